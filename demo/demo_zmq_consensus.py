@@ -10,6 +10,7 @@ import sys
 import os
 import asyncio
 import logging
+from typing import Callable
 
 # Add parent directory to path to allow importing hierachain modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -22,8 +23,14 @@ from hierachain.hierarchical.consensus.bft_consensus import BFTConsensus
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("ConsensusDemo")
 
-async def run_node(node_id: str, consensus: BFTConsensus, zmq_node: ZmqNode):
-    """Run a single node's main loop"""
+async def run_node(
+    node_id: str,
+    consensus: BFTConsensus,
+    zmq_node: ZmqNode,
+    shutdown_event: asyncio.Event,
+    on_commit: Callable[[str], None]
+):
+    """Run a single node until shutdown_event is set"""
     logger.info(f"Starting Node {node_id}")
     
     # Define message handler
@@ -33,6 +40,8 @@ async def run_node(node_id: str, consensus: BFTConsensus, zmq_node: ZmqNode):
             if "message_type" in msg:
                 # It's a BFT message
                 consensus.handle_message(msg)
+                if consensus.get_consensus_status()["state"] == "committed":
+                    on_commit(node_id)
             elif msg.get("type") == "client_request":
                 logger.info(f"{node_id} received client request")
                 consensus.request(msg["operation"])
@@ -42,11 +51,10 @@ async def run_node(node_id: str, consensus: BFTConsensus, zmq_node: ZmqNode):
     zmq_node.set_handler(msg_handler)
     await zmq_node.start()
     
-    # Keep running
+    # Idle until shutdown; messages are handled by the receiver loop
     try:
-        while True:
-            await asyncio.sleep(1)
-    except asyncio.CancelledError:
+        await shutdown_event.wait()
+    finally:
         logger.info(f"Node {node_id} shutting down...")
         await zmq_node.stop()
 
@@ -60,7 +68,7 @@ async def main():
     
     # 2. Key Generation
     logger.info("Generating keys...")
-    keypairs = {nid: KeyPair() for nid in nodes}
+    keypairs = dict(zip(nodes, KeyPair.generate_batch(len(nodes))))
     public_keys = {nid: kp.public_key for nid, kp in keypairs.items()}
     
     # 3. Create Network & Consensus Instances
@@ -94,9 +102,20 @@ async def main():
                 zmq_nodes[nid].register_peer(peer, address)
     
     # 5. Start Node Tasks
+    shutdown_event = asyncio.Event()
+    quorum_reached = asyncio.Event()
+    committed_nodes = set()
+    
+    def on_commit(node_id: str):
+        committed_nodes.add(node_id)
+        if len(committed_nodes) >= 3:
+            quorum_reached.set()
+    
     tasks = []
     for nid in nodes:
-        task = asyncio.create_task(run_node(nid, consensus_map[nid], zmq_nodes[nid]))
+        task = asyncio.create_task(
+            run_node(nid, consensus_map[nid], zmq_nodes[nid], shutdown_event, on_commit)
+        )
         tasks.append(task)
         
     await asyncio.sleep(2) # Wait for connections
@@ -115,33 +134,17 @@ async def main():
     # Inject request directly into Node1
     consensus_map["node1"].request(client_request)
     
-    # 7. Monitor Consensus
-    logger.info("Monitoring consensus state...")
-    start_time = asyncio.get_running_loop().time()
-    success = False
-    
-    while asyncio.get_running_loop().time() - start_time < 15:
-        committed_count = 0
-        for nid, cons in consensus_map.items():
-            status = cons.get_consensus_status()
-            if status["state"] == "committed":
-                committed_count += 1
-                # logger.info(f"{nid} COMMITTED sequence {status['sequence_number']}")
-        
-        if committed_count >= 3:
-            logger.info("SUCCESS: Supermajority reached consensus!")
-            success = True
-            break
-            
-        await asyncio.sleep(0.5)
-        
-    if not success:
+    # 7. Wait for Consensus
+    logger.info("Waiting for consensus...")
+    try:
+        await asyncio.wait_for(quorum_reached.wait(), timeout=15)
+        logger.info("SUCCESS: Supermajority reached consensus!")
+    except asyncio.TimeoutError:
         logger.error("FAILED to reach consensus in time.")
     
     # Cleanup
     logger.info("Demo finished. Cleaning up...")
-    for task in tasks:
-        task.cancel()
+    shutdown_event.set()
     
     await asyncio.gather(*tasks, return_exceptions=True)
 
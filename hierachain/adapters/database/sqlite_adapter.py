@@ -10,6 +10,7 @@ import sqlite3
 import json
 import time
 import logging
+from queue import Empty, Full, LifoQueue
 from typing import Any
 from contextlib import contextmanager
 
@@ -18,6 +19,40 @@ from hierachain.core.blockchain import Blockchain
 
 logger = logging.getLogger(__name__)
 
+# Compact JSON encoder for details/metadata columns (no whitespace after separators)
+_json_encode = json.JSONEncoder(separators=(',', ':')).encode
+
+# Hot-path statements. sqlite3 keeps a per-connection cache of compiled
+# statements keyed by SQL text, so with pooled connections these are
+# prepared once per connection and reused on every call.
+_STATEMENT_CACHE_SIZE = 256
+
+_INSERT_BLOCK_SQL = """
+    INSERT OR REPLACE INTO blocks 
+    (chain_name, block_index, block_hash, previous_hash, timestamp, nonce, events_count, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# block_id is resolved from the blocks table so events for a whole batch of
+# blocks can be written in one executemany() call
+_INSERT_EVENT_SQL = """
+    INSERT OR REPLACE INTO events 
+    (chain_name, block_id, block_index, entity_id, event_type, timestamp, details, created_at)
+    VALUES (?, (SELECT id FROM blocks WHERE chain_name = ? AND block_index = ?), ?, ?, ?, ?, ?, ?)
+"""
+
+_SELECT_EVENTS_BY_ENTITY_SQL = """
+    SELECT chain_name, block_index, entity_id, event_type, timestamp, details
+    FROM events WHERE entity_id = ?
+    ORDER BY timestamp
+"""
+
+_SELECT_EVENTS_BY_ENTITY_AND_CHAIN_SQL = """
+    SELECT chain_name, block_index, entity_id, event_type, timestamp, details
+    FROM events WHERE entity_id = ? AND chain_name = ?
+    ORDER BY timestamp
+"""
+
 
 class SQLiteAdapter:
     """
@@ -45,6 +80,7 @@ class SQLiteAdapter:
             raise ValueError(f"Security: Invalid database path '{self.database_path}'. Path traversal detected.")
 
         self.connection_pool_size = 5
+        self._pool: LifoQueue[sqlite3.Connection] = LifoQueue(maxsize=self.connection_pool_size)
         self._initialize_database()
     
     def _initialize_database(self) -> None:
@@ -115,28 +151,93 @@ class SQLiteAdapter:
                 )
             """)
             
+            # Create chain_stats table - precomputed per-chain aggregates,
+            # rebuilt by refresh_chain_statistics() (SQLite has no materialized views)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS chain_stats (
+                    chain_name TEXT PRIMARY KEY,
+                    total_blocks INTEGER NOT NULL,
+                    total_events INTEGER NOT NULL,
+                    unique_entities INTEGER NOT NULL,
+                    first_event REAL,
+                    last_event REAL,
+                    event_types TEXT,  -- JSON object of event_type -> count
+                    refreshed_at REAL NOT NULL
+                )
+            """)
+            
             # Create indexes for efficient querying
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_entity_id ON events (entity_id)")
+            # Composite indexes let entity lookups (filtered by entity_id and
+            # optionally chain_name, ordered by timestamp) and per-chain block
+            # scans be served by a single index range scan.
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_entity_ts ON events (entity_id, timestamp)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_chain_entity_ts ON events (chain_name, entity_id, timestamp)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_chain_block ON events (chain_name, block_index)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_type ON events (event_type)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_timestamp ON events (timestamp)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_chain ON events (chain_name)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_blocks_hash ON blocks (block_hash)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_blocks_chain ON blocks (chain_name)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_proofs_sub_chain ON proofs (sub_chain_name)")
             
+            # Single-column indexes superseded by the composite indexes above
+            cursor.execute("DROP INDEX IF EXISTS idx_events_entity_id")
+            cursor.execute("DROP INDEX IF EXISTS idx_events_chain")
+            
             conn.commit()
     
+    def _create_connection(self) -> sqlite3.Connection:
+        """Open a new database connection."""
+        # Pooled connections may be checked out by any thread, but only
+        # by one at a time
+        conn = sqlite3.connect(
+            self.database_path,
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE
+        )
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        # WAL appends commits to a log instead of rewriting pages through a
+        # rollback journal, so a block and its events commit with a single
+        # sequential write and readers are not blocked by the writer.
+        # synchronous=NORMAL defers fsync to WAL checkpoints.
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+    
     @contextmanager
     def _get_connection(self):
-        """Get a database connection with proper error handling."""
-        conn = sqlite3.connect(self.database_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
+        """
+        Check out a pooled database connection with proper error handling.
+        
+        Connections are reused across calls instead of being opened and
+        closed per operation. Up to connection_pool_size idle connections are
+        kept; extra connections opened under concurrency are closed on return.
+        """
+        try:
+            conn = self._pool.get_nowait()
+        except Empty:
+            conn = self._create_connection()
+        
         try:
             yield conn
         except Exception as e:
             conn.rollback()
             raise e
         finally:
+            # Never hand out a connection with a dangling transaction
+            if conn.in_transaction:
+                conn.rollback()
+            try:
+                self._pool.put_nowait(conn)
+            except Full:
+                conn.close()
+    
+    def close(self) -> None:
+        """Close all pooled database connections."""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except Empty:
+                break
             conn.close()
     
     def store_chain(self, chain: Blockchain) -> bool:
@@ -165,8 +266,7 @@ class SQLiteAdapter:
                 """, (chain.name, chain_type, domain_type, time.time(), time.time()))
                 
                 # Store all blocks
-                for block in chain.chain:
-                    self._store_block(cursor, chain.name, block)
+                self._store_blocks(cursor, chain.name, chain.chain)
                 
                 conn.commit()
                 return True
@@ -175,35 +275,59 @@ class SQLiteAdapter:
             logger.error(f"Error storing chain {chain.name}: {e}")
             return False
     
+    def store_blocks(self, chain_name: str, blocks: list[Block]) -> bool:
+        """
+        Store a batch of blocks and their events in a single transaction.
+        
+        All block rows are written with one executemany() call and all event
+        rows with another, so the cost of a batch no longer scales with the
+        number of statements. A failure rolls back the whole batch.
+        
+        Args:
+            chain_name: Name of the chain the blocks belong to
+            blocks: Blocks to store
+            
+        Returns:
+            True if stored successfully, False otherwise
+        """
+        try:
+            with self._get_connection() as conn:
+                self._store_blocks(conn.cursor(), chain_name, blocks)
+                conn.commit()
+                return True
+                
+        except Exception as e:
+            logger.error(f"Error storing blocks for chain {chain_name}: {e}")
+            return False
+    
     @staticmethod
-    def _store_block(cursor: sqlite3.Cursor, chain_name: str, block: Block) -> None:
-        """Store a single block and its events."""
-        # Insert block record
-        cursor.execute("""
-            INSERT OR REPLACE INTO blocks 
-            (chain_name, block_index, block_hash, previous_hash, timestamp, nonce, events_count, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (chain_name, block.index, block.hash, block.previous_hash, 
-              block.timestamp, block.nonce, len(block.events), time.time()))
+    def _store_blocks(cursor: sqlite3.Cursor, chain_name: str, blocks: list[Block]) -> None:
+        """Store blocks and their events with one executemany() call each."""
+        created_at = time.time()
+        block_rows = []
+        event_rows = []
         
-        # Get block ID
-        block_id = cursor.lastrowid
+        for block in blocks:
+            block_rows.append((chain_name, block.index, block.hash, block.previous_hash,
+                               block.timestamp, block.nonce, len(block.events), created_at))
+            
+            # Use to_event_list() if available to handle Arrow Tables
+            events = block.to_event_list() if hasattr(block, 'to_event_list') else block.events
+            event_rows.extend(
+                (chain_name, chain_name, block.index, block.index,
+                 event.get("entity_id"),  # Metadata field
+                 event.get("event"),
+                 event.get("timestamp"),
+                 _json_encode(event.get("details", {})),
+                 created_at)
+                for event in events
+            )
         
-        # Store events
-        # Store events
-        # Use to_event_list() if available to handle Arrow Tables
-        events = block.to_event_list() if hasattr(block, 'to_event_list') else block.events
-        for event in events:
-            cursor.execute("""
-                INSERT OR REPLACE INTO events 
-                (chain_name, block_id, block_index, entity_id, event_type, timestamp, details, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (chain_name, block_id, block.index, 
-                  event.get("entity_id"),  # Metadata field
-                  event.get("event"), 
-                  event.get("timestamp"), 
-                  json.dumps(event.get("details", {})),
-                  time.time()))
+        # Blocks first so the events' block_id subquery can resolve them
+        if block_rows:
+            cursor.executemany(_INSERT_BLOCK_SQL, block_rows)
+        if event_rows:
+            cursor.executemany(_INSERT_EVENT_SQL, event_rows)
     
     @staticmethod
     def _create_event_from_row(row: sqlite3.Row) -> dict[str, Any]:
@@ -306,7 +430,7 @@ class SQLiteAdapter:
                     (main_chain_name, sub_chain_name, proof_hash, block_index, metadata, submitted_at, created_at)
                     VALUES (?, ?, ?, ?, ?, ?, ?)
                 """, (main_chain_name, sub_chain_name, proof_hash, block_index,
-                      json.dumps(metadata), time.time(), time.time()))
+                      _json_encode(metadata), time.time(), time.time()))
                 
                 conn.commit()
                 return True
@@ -331,17 +455,9 @@ class SQLiteAdapter:
                 cursor = conn.cursor()
                 
                 if chain_name:
-                    cursor.execute("""
-                        SELECT chain_name, block_index, entity_id, event_type, timestamp, details
-                        FROM events WHERE entity_id = ? AND chain_name = ?
-                        ORDER BY timestamp
-                    """, (entity_id, chain_name))
+                    cursor.execute(_SELECT_EVENTS_BY_ENTITY_AND_CHAIN_SQL, (entity_id, chain_name))
                 else:
-                    cursor.execute("""
-                        SELECT chain_name, block_index, entity_id, event_type, timestamp, details
-                        FROM events WHERE entity_id = ?
-                        ORDER BY timestamp
-                    """, (entity_id,))
+                    cursor.execute(_SELECT_EVENTS_BY_ENTITY_SQL, (entity_id,))
                 
                 rows = cursor.fetchall()
                 
@@ -395,12 +511,81 @@ class SQLiteAdapter:
             logger.error(f"Error getting events by type: {e}")
             return []
     
-    def get_chain_statistics(self, chain_name: str) -> dict[str, Any]:
+    def refresh_chain_statistics(self) -> bool:
+        """
+        Recompute the precomputed statistics of every chain.
+        
+        Aggregates for all chains are rebuilt in one pass over the events
+        table, so get_chain_statistics(use_cached=True) becomes a single-row
+        primary key lookup. Call this after bulk writes or on a schedule.
+        
+        Returns:
+            True if the refresh succeeded, False otherwise
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT e.chain_name,
+                           COUNT(*) as event_count,
+                           COUNT(DISTINCT e.entity_id) as entity_count,
+                           MIN(e.timestamp) as first_event,
+                           MAX(e.timestamp) as last_event
+                    FROM events e GROUP BY e.chain_name
+                """)
+                event_rows = {row['chain_name']: row for row in cursor.fetchall()}
+                
+                cursor.execute("SELECT chain_name, COUNT(*) as block_count FROM blocks GROUP BY chain_name")
+                block_counts = {row['chain_name']: row['block_count'] for row in cursor.fetchall()}
+                
+                cursor.execute("""
+                    SELECT chain_name, event_type, COUNT(*) as count 
+                    FROM events GROUP BY chain_name, event_type ORDER BY count DESC
+                """)
+                event_types: dict[str, dict[str, int]] = {}
+                for row in cursor.fetchall():
+                    event_types.setdefault(row['chain_name'], {})[row['event_type']] = row['count']
+                
+                refreshed_at = time.time()
+                rows = []
+                for (name,) in cursor.execute("SELECT name FROM chains").fetchall():
+                    event_row = event_rows.get(name)
+                    rows.append((
+                        name,
+                        block_counts.get(name, 0),
+                        event_row['event_count'] if event_row else 0,
+                        event_row['entity_count'] if event_row else 0,
+                        event_row['first_event'] if event_row else None,
+                        event_row['last_event'] if event_row else None,
+                        _json_encode(event_types.get(name, {})),
+                        refreshed_at
+                    ))
+                
+                cursor.execute("DELETE FROM chain_stats")
+                cursor.executemany("""
+                    INSERT INTO chain_stats 
+                    (chain_name, total_blocks, total_events, unique_entities,
+                     first_event, last_event, event_types, refreshed_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, rows)
+                
+                conn.commit()
+                return True
+                
+        except Exception as e:
+            logger.error(f"Error refreshing chain statistics: {e}")
+            return False
+    
+    def get_chain_statistics(self, chain_name: str, use_cached: bool = False) -> dict[str, Any]:
         """
         Get statistics for a specific chain.
         
         Args:
             chain_name: Name of the chain
+            use_cached: Read the aggregates precomputed by refresh_chain_statistics()
+                        instead of scanning the events table. Falls back to live
+                        aggregation if the chain has not been refreshed yet.
             
         Returns:
             Chain statistics
@@ -416,20 +601,38 @@ class SQLiteAdapter:
                 if not chain_row:
                     return {}
                 
+                if use_cached:
+                    cursor.execute("SELECT * FROM chain_stats WHERE chain_name = ?", (chain_name,))
+                    stats_row = cursor.fetchone()
+                    if stats_row:
+                        return {
+                            "chain_name": chain_name,
+                            "chain_type": chain_row['chain_type'],
+                            "domain_type": chain_row['domain_type'],
+                            "total_blocks": stats_row['total_blocks'],
+                            "total_events": stats_row['total_events'],
+                            "unique_entities": stats_row['unique_entities'],
+                            "event_types": json.loads(stats_row['event_types'] or '{}'),
+                            "first_event_at": stats_row['first_event'],
+                            "last_event_at": stats_row['last_event'],
+                            "created_at": chain_row['created_at'],
+                            "updated_at": chain_row['updated_at'],
+                            "refreshed_at": stats_row['refreshed_at']
+                        }
+                
                 # Get block count
                 cursor.execute("SELECT COUNT(*) as block_count FROM blocks WHERE chain_name = ?", (chain_name,))
                 block_count = cursor.fetchone()['block_count']
                 
-                # Get event count
-                cursor.execute("SELECT COUNT(*) as event_count FROM events WHERE chain_name = ?", (chain_name,))
-                event_count = cursor.fetchone()['event_count']
-                
-                # Get unique entity count
+                # Get event count, unique entity count and time range in one pass
                 cursor.execute("""
-                    SELECT COUNT(DISTINCT entity_id) as entity_count 
-                    FROM events WHERE chain_name = ? AND entity_id IS NOT NULL
+                    SELECT COUNT(*) as event_count,
+                           COUNT(DISTINCT entity_id) as entity_count,
+                           MIN(timestamp) as first_event,
+                           MAX(timestamp) as last_event
+                    FROM events WHERE chain_name = ?
                 """, (chain_name,))
-                entity_count = cursor.fetchone()['entity_count']
+                event_row = cursor.fetchone()
                 
                 # Get event type distribution
                 cursor.execute("""
@@ -444,9 +647,11 @@ class SQLiteAdapter:
                     "chain_type": chain_row['chain_type'],
                     "domain_type": chain_row['domain_type'],
                     "total_blocks": block_count,
-                    "total_events": event_count,
-                    "unique_entities": entity_count,
+                    "total_events": event_row['event_count'],
+                    "unique_entities": event_row['entity_count'],
                     "event_types": event_types,
+                    "first_event_at": event_row['first_event'],
+                    "last_event_at": event_row['last_event'],
                     "created_at": chain_row['created_at'],
                     "updated_at": chain_row['updated_at']
                 }
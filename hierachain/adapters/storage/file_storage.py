@@ -6,29 +6,142 @@ It stores blockchain data in a structured directory layout with separate folders
 types of data
 """
 
+import asyncio
+import bisect
 import json
 import os
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterator, NamedTuple
 import pyarrow as pa
 import pyarrow.parquet as pq
 import pyarrow.dataset as ds
 import pyarrow.compute as pc
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from hierachain.config.settings import settings
 from hierachain.core.block import Block
+from hierachain.core.caching import AdvancedCache
 
 logger = logging.getLogger(__name__)
 
+# Number of per-block events index files after which they are merged into a
+# single snapshot file
+EVENTS_COMPACTION_THRESHOLD = 256
+
+# Seconds a decoded block stays in the block cache
+BLOCK_CACHE_TTL = 300
+
+# Upper bound on threads reading block files concurrently in get_chain_blocks
+# (Parquet decoding releases the GIL)
+BLOCK_READ_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Number of decoded block footers kept by _read_block_footer
+BLOCK_HEADER_CACHE_SIZE = 4096
+
+# Directory listings keyed on a directory's mtime are only cached once that
+# mtime is this old. File timestamps are coarse (kernel tick, or whole
+# seconds on some filesystems), so a change made right after a scan can leave
+# the mtime unchanged and would otherwise go unnoticed.
+MTIME_SETTLE_SECONDS = 2.0
+
+# Parquet write options shared by block and events index files. Dictionary
+# encoding only pays off on low-cardinality columns; on unique ones (event
+# payloads, timestamps) it is built and then discarded on every write.
+PARQUET_COMPRESSION_LEVEL = 1
+PARQUET_DICTIONARY_COLUMNS = ["entity_id", "event", "event_type", "block_hash"]
+
+# Events index layout. ``data`` is the event's JSON payload copied from the
+# block so entity lookups can be answered from the index alone; index files
+# written before it existed read back as null and fall back to the block file.
+EVENTS_INDEX_SCHEMA = pa.schema([
+    ("entity_id", pa.string()),
+    ("block_index", pa.int64()),
+    ("event_type", pa.string()),
+    ("timestamp", pa.float64()),
+    ("block_hash", pa.string()),
+    ("data", pa.binary())
+])
+
+
+def _dumps_json(obj) -> bytes:
+    """Encode an object as compact UTF-8 JSON, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _loads_json(data: bytes):
+    """Decode UTF-8 JSON, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class BlockHeader(NamedTuple):
+    """Block header fields stored in a block file's Parquet metadata"""
+    index: int
+    timestamp: float
+    previous_hash: str
+    nonce: int
+    hash: str
+
+    @classmethod
+    def from_metadata(cls, meta: dict[bytes, bytes]) -> 'BlockHeader':
+        """Decode header fields from Parquet key-value metadata (bytes keys and values)."""
+        return cls(
+            int(meta.get(b'index', b'0')),
+            float(meta.get(b'timestamp', b'0.0')),
+            meta.get(b'previous_hash', b'').decode('utf-8'),
+            int(meta.get(b'nonce', b'0')),
+            meta.get(b'hash', b'').decode('utf-8')
+        )
+
+
+@lru_cache(maxsize=BLOCK_HEADER_CACHE_SIZE)
+def _read_block_footer(path: str, mtime_ns: int, inode: int) -> tuple[BlockHeader, int] | None:
+    """
+    Read and decode a block file's footer into (header, event_count).
+    
+    mtime_ns and inode are part of the cache key only: block files are
+    replaced atomically (new inode) rather than edited in place, so a
+    rewritten file never hits a stale entry.
+    """
+    file_meta = pq.read_metadata(path)
+    meta = file_meta.metadata
+    if not meta or b'index' not in meta:
+        return None
+    return BlockHeader.from_metadata(meta), file_meta.num_rows
+
+
 class FileStorageAdapter:
     """File-based storage adapter for blockchain data"""
     
-    def __init__(self, storage_path: str = "blockchain_data"):
+    def __init__(
+        self,
+        storage_path: str = "blockchain_data",
+        block_cache_size: int | None = None,
+        events_buffer_rows: int = 0
+    ):
         """
         Initialize file storage adapter
         
         Args:
             storage_path: Base directory for storing blockchain data
+            block_cache_size: Maximum number of decoded blocks kept in memory
+                              (defaults to settings.BLOCK_CACHE_SIZE, 0 disables)
+            events_buffer_rows: Buffer events index rows in memory and write them
+                                as one file once this many are pending (0 writes
+                                each block's rows immediately). Buffered rows are
+                                flushed before any index read and by close().
         """
         self.storage_path = Path(storage_path)
         self.chains_path = self.storage_path / "chains"
@@ -36,6 +149,32 @@ class FileStorageAdapter:
         self.events_path = self.storage_path / "events"
         self.proofs_path = self.storage_path / "proofs"
         
+        # Per-chain count of uncompacted events index files written by this instance
+        self._events_fragments: dict[str, int] = {}
+        
+        # Opened events datasets keyed by chain name (None = all chains), with
+        # the directory mtimes they were discovered at
+        self._events_datasets: dict[str | None, tuple[tuple, ds.Dataset]] = {}
+        
+        # Sorted (block_index, path) listings per chain with the directory mtime they were read at
+        self._block_listings: dict[str, tuple[int, list[tuple[int, str]]]] = {}
+        
+        # Cached list_chains() result with the chains directory mtime it was read at
+        self._chains_listing: tuple[int, list[str]] | None = None
+        
+        # Pending events index rows per chain as (block_index, table) pairs
+        self._events_buffer_rows = events_buffer_rows
+        self._events_buffer: dict[str, list[tuple[int, pa.Table]]] = {}
+        self._events_buffered: dict[str, int] = {}
+        
+        # Read-through, write-through cache of decoded blocks keyed by "chain:index",
+        # each stored with the (mtime_ns, inode) of the block file it belongs to
+        cache_size = settings.BLOCK_CACHE_SIZE if block_cache_size is None else block_cache_size
+        self._block_cache = (
+            AdvancedCache(max_size=cache_size, eviction_policy=settings.BLOCK_CACHE_POLICY)
+            if settings.ADVANCED_CACHING_ENABLED and cache_size > 0 else None
+        )
+        
         self._create_directories()
         logger.info(f"File storage initialized at: {self.storage_path}")
 
@@ -74,6 +213,15 @@ class FileStorageAdapter:
         chain_dir.mkdir(exist_ok=True)
         return chain_dir / f"block_{block_index:06d}.parquet"
     
+    @staticmethod
+    def _file_version(path: str | Path) -> tuple[int, int] | None:
+        """(mtime_ns, inode) of a file, or None if it does not exist."""
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_ino
+    
     def _get_events_dir(self, chain_name: str) -> Path:
         """Get directory for chain events dataset"""
         self._validate_filename(chain_name)
@@ -81,6 +229,162 @@ class FileStorageAdapter:
         path.mkdir(parents=True, exist_ok=True)
         return path
     
+    @staticmethod
+    def _mtime_settled(*mtimes_ns: int) -> bool:
+        """Whether directory mtimes are old enough to key a cached listing on (see MTIME_SETTLE_SECONDS)."""
+        cutoff = time.time_ns() - int(MTIME_SETTLE_SECONDS * 1e9)
+        return all(mtime_ns <= cutoff for mtime_ns in mtimes_ns)
+    
+    def _events_dataset(self, chain_name: str | None = None) -> ds.Dataset:
+        """
+        Get the events index dataset of a chain, or of all chains if None.
+        
+        Opening a dataset lists its files and reads their footers, so opened
+        datasets are reused until their directories change (once their mtimes
+        have settled, see MTIME_SETTLE_SECONDS). Writes through
+        this adapter also drop them explicitly (see _invalidate_events_dataset).
+        Buffered index rows are flushed first.
+        """
+        if self._events_buffer:
+            self.flush_events_index(chain_name)
+        
+        if chain_name:
+            events_dir = self._get_events_dir(chain_name)
+            signature = (events_dir.stat().st_mtime_ns,)
+            mtimes = signature
+        else:
+            with os.scandir(self.events_path) as entries:
+                signature = tuple(sorted(
+                    (entry.name, entry.stat().st_mtime_ns) for entry in entries if entry.is_dir()
+                ))
+            mtimes = tuple(mtime for _, mtime in signature)
+        
+        cached = self._events_datasets.get(chain_name)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
+        if chain_name:
+            dataset = ds.dataset(events_dir, format="parquet", schema=EVENTS_INDEX_SCHEMA)
+        else:
+            # All chains: events/<chain_name>/*.parquet
+            dataset = ds.dataset(
+                self.events_path,
+                format="parquet",
+                schema=EVENTS_INDEX_SCHEMA.append(pa.field("chain_name", pa.string())),
+                partitioning=ds.partitioning(pa.schema([("chain_name", pa.string())]))
+            )
+        if self._mtime_settled(*mtimes):
+            self._events_datasets[chain_name] = (signature, dataset)
+        return dataset
+    
+    def _invalidate_events_dataset(self, chain_name: str) -> None:
+        """Drop cached events datasets that include a chain."""
+        self._events_datasets.pop(chain_name, None)
+        self._events_datasets.pop(None, None)
+    
+    def _cache_get(self, chain_name: str, block_index: int) -> dict | None:
+        """
+        Get a cached block dictionary, or None on a miss.
+        
+        Entries are only served while the block file is the version they were
+        cached for, so rewrites by other adapters or processes are picked up.
+        """
+        if self._block_cache is None:
+            return None
+        key = f"{chain_name}:{block_index}"
+        cached = self._block_cache.get(key)
+        if cached is None:
+            return None
+        version, block_data = cached
+        if self._file_version(self.blocks_path / chain_name / f"block_{block_index:06d}.parquet") != version:
+            self._block_cache.delete(key)
+            return None
+        # Shallow copy so callers cannot mutate the cached entry
+        return dict(block_data)
+    
+    def _cache_put(self, chain_name: str, block_data: dict, version: tuple[int, int] | None) -> None:
+        """
+        Cache a block dictionary for the given block file version.
+        
+        Readers take the version before reading the file, so a file replaced
+        mid-read is cached under the old version and simply missed later.
+        """
+        if self._block_cache is not None and version is not None:
+            self._block_cache.set(
+                f"{chain_name}:{block_data['index']}", (version, dict(block_data)), ttl=BLOCK_CACHE_TTL
+            )
+    
+    @staticmethod
+    def _tmp_path(path: Path) -> Path:
+        """
+        Temporary sibling path used while writing a file.
+        Dot-prefixed names are skipped by block listing and dataset discovery.
+        """
+        return path.with_name(f".{path.name}.tmp")
+    
+    @classmethod
+    def _atomic_write_bytes(cls, path: Path, data: bytes) -> None:
+        """Durably write bytes to path: write a temp file, fsync it, then rename over path."""
+        tmp_file = cls._tmp_path(path)
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            # os.write may write fewer bytes than given; keep going until all are out
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_file, path)
+    
+    @classmethod
+    def _write_parquet(cls, table: pa.Table | list[pa.Table], path: Path) -> None:
+        """
+        Durably write a Parquet file.
+        
+        Readers never observe a partially written file: the table is written
+        to a temp file, fsynced and renamed over the target. The rename itself
+        only becomes durable once the directory is fsynced (see _fsync_dir).
+        
+        Args:
+            table: Table to write, or a list of tables sharing one schema that
+                   are appended as separate row groups of the same file
+            path: Target file path
+        """
+        tables = table if isinstance(table, list) else [table]
+        tmp_file = cls._tmp_path(path)
+        with open(tmp_file, 'wb') as f:
+            with pq.ParquetWriter(
+                f,
+                tables[0].schema,
+                compression='zstd',
+                compression_level=PARQUET_COMPRESSION_LEVEL,
+                use_dictionary=PARQUET_DICTIONARY_COLUMNS,
+                write_statistics=True
+            ) as writer:
+                for part in tables:
+                    writer.write_table(part)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, path)
+    
+    @staticmethod
+    def _fsync_dir(path: Path) -> None:
+        """Persist renames in a directory. No-op where directories cannot be opened (Windows)."""
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    
+    def _sync_chain_dirs(self, chain_name: str) -> None:
+        """fsync the block and events directories of a chain."""
+        self._fsync_dir(self.blocks_path / chain_name)
+        self._fsync_dir(self.events_path / chain_name)
+    
     def store_chain_metadata(self, chain_name: str, chain_type: str, parent_chain: str = None, metadata: dict = None):
         """Store chain metadata"""
         try:
@@ -93,9 +397,10 @@ class FileStorageAdapter:
                 "updated_at": time.time()
             }
             
+            # Compact encoding; pretty-printing only inflated file size and encode time
             chain_file = self._get_chain_file(chain_name)
-            with open(chain_file, 'w') as f:
-                json.dump(chain_data, f, indent=2)
+            self._atomic_write_bytes(chain_file, _dumps_json(chain_data))
+            self._fsync_dir(self.chains_path)
             
             logger.debug(f"Stored chain metadata: {chain_name}")
             
@@ -111,28 +416,74 @@ class FileStorageAdapter:
             chain_name: Name of the chain
             block_data: Block object or Dictionary
         """
+        self._write_block(chain_name, block_data)
+        self._sync_chain_dirs(chain_name)
+    
+    def store_blocks_batch(self, chain_name: str, blocks: list[dict | Block]):
+        """
+        Store several blocks, syncing the chain directories once at the end.
+        
+        Every block file is still written atomically and fsynced, but the
+        directory fsync that makes the renames durable is paid once per
+        batch instead of once per block. The events of the whole batch go
+        into a single index file with one row group per block, rather than
+        one index file per block.
+        
+        Args:
+            chain_name: Name of the chain
+            blocks: Block objects or Dictionaries
+        """
+        entries = [self._write_block(chain_name, block_data, index_events=False) for block_data in blocks]
+        if entries:
+            self._write_events_index(chain_name, entries)
+            self._sync_chain_dirs(chain_name)
+    
+    def _write_block(
+        self, chain_name: str, block_data: dict | Block, index_events: bool = True
+    ) -> tuple[int, pa.Table | None]:
+        """
+        Write a block file without syncing directories.
+        
+        Args:
+            chain_name: Name of the chain
+            block_data: Block object or Dictionary
+            index_events: Also write the block's events index entry
+            
+        Returns:
+            The block's (block_index, events index table) entry
+        """
         try:
-            # Convert to Block object if it's a dict (inefficient but safe fallback)
-            if isinstance(block_data, dict):
-                # We assume it follows Block.to_dict() structure
-                block = Block.from_dict(block_data)
+            if isinstance(block_data, dict) and block_data.get("hash"):
+                # Block.to_dict()/get_block() structure: use the header as given
+                # and only convert the events, rather than rebuilding a Block
+                # (which recomputes the hash and possibly the Merkle root)
+                index = block_data["index"]
+                timestamp = block_data["timestamp"]
+                previous_hash = block_data["previous_hash"]
+                nonce = block_data.get("nonce", 0)
+                block_hash = block_data["hash"]
+                events = block_data["events"]
+                table = events if isinstance(events, pa.Table) else Block._convert_events_to_arrow(events)
             else:
-                block = block_data
+                block = Block.from_dict(block_data) if isinstance(block_data, dict) else block_data
+                index = block.index
+                timestamp = block.timestamp
+                previous_hash = block.previous_hash
+                nonce = block.nonce
+                block_hash = block.hash
+                table = block.events
 
             # Prepare metadata for the Parquet file
             # Parquet metadata keys must be bytes or strings
             metadata = {
-                b'index': str(block.index).encode(),
-                b'timestamp': str(block.timestamp).encode(),
-                b'previous_hash': str(block.previous_hash).encode(),
-                b'nonce': str(block.nonce).encode(),
-                b'hash': str(block.hash).encode(),
+                b'index': str(index).encode(),
+                b'timestamp': str(timestamp).encode(),
+                b'previous_hash': str(previous_hash).encode(),
+                b'nonce': str(nonce).encode(),
+                b'hash': str(block_hash).encode(),
                 b'stored_at': str(time.time()).encode()
             }
             
-            # Get the Arrow Table from the block
-            table = block.events
-            
             # Merge existing schema metadata with block header metadata
             existing_meta = table.schema.metadata or {}
             combined_meta = {**existing_meta, **metadata}
@@ -141,80 +492,291 @@ class FileStorageAdapter:
             table_with_meta = table.replace_schema_metadata(combined_meta)
             
             # Store block file as Parquet with optimized compression
-            block_file = self._get_block_file(chain_name, block.index)
-            pq.write_table(
-                table_with_meta,
-                block_file,
-                compression='zstd',
-                compression_level=3,
-                use_dictionary=True,
-                write_statistics=True
-            )
+            block_file = self._get_block_file(chain_name, index)
+            self._write_parquet(table_with_meta, block_file)
+            self._block_listings.pop(chain_name, None)
+            
+            self._cache_put(chain_name, {
+                "index": index,
+                "events": table_with_meta,
+                "timestamp": float(timestamp),
+                "previous_hash": str(previous_hash),
+                "nonce": int(nonce),
+                "hash": str(block_hash)
+            }, self._file_version(block_file))
 
-            self._update_events_index(chain_name, block.to_dict())
+            try:
+                index_table = self._build_events_index_table(index, timestamp, block_hash, table)
+            except Exception as e:
+                # Not critical for block storage, like index write failures
+                logger.error(f"Failed to update events index: {e}")
+                index_table = None
+            entry = (index, index_table)
+            if index_events:
+                self._write_events_index(chain_name, [entry])
             
-            logger.debug(f"Stored block {block.index} for chain {chain_name} as Parquet")
+            logger.debug(f"Stored block {index} for chain {chain_name} as Parquet")
+            return entry
             
         except Exception as e:
             logger.error(f"Failed to store block: {e}")
             raise
     
-    def _update_events_index(self, chain_name: str, block_data: dict):
+    @staticmethod
+    def _build_events_index_table(
+        block_index: int, block_timestamp: float, block_hash: str, events: pa.Table
+    ) -> pa.Table | None:
+        """
+        Build the events index rows of a block, or None if it has no indexed events.
+        
+        Works on the block's Arrow table column-wise: events without an
+        entity_id are filtered out and the block fields are broadcast,
+        without materializing the events as Python objects. Events without
+        an event name fall back to the event_type kept in their data payload.
+        """
+        if events.num_rows == 0:
+            return None
+
+        # Extract columns for index
+        indexed = events.filter(pc.is_valid(pc.field("entity_id")) & (pc.field("entity_id") != ""))
+        num_rows = indexed.num_rows
+        
+        if num_rows == 0:
+            return None
+
+        data = indexed["data"] if "data" in indexed.column_names else pa.nulls(num_rows, pa.binary())
+        event_names = indexed["event"]
+        if event_names.null_count:
+            # Only the unnamed events are decoded to look up their event_type
+            event_names = pa.array(
+                [
+                    name if name is not None
+                    else (_loads_json(payload).get("event_type", "unknown") if payload else "unknown")
+                    for name, payload in zip(event_names.to_pylist(), data.to_pylist())
+                ],
+                pa.string()
+            )
+
+        return pa.Table.from_arrays(
+            [
+                indexed["entity_id"],
+                pa.repeat(pa.scalar(block_index, pa.int64()), num_rows),
+                event_names,
+                pc.fill_null(indexed["timestamp"], float(block_timestamp)),
+                pa.repeat(pa.scalar(str(block_hash), pa.string()), num_rows),
+                data
+            ],
+            schema=EVENTS_INDEX_SCHEMA
+        )
+    
+    def _write_events_index(self, chain_name: str, entries: list[tuple[int, pa.Table | None]]):
         """
         Update events index using Arrow Dataset (Append-only).
-        Writes a small parquet file for the block's events.
+        Writes one small parquet file for the given (block_index, table)
+        entries, with one row group per block, or buffers the rows if
+        buffering is enabled. Blocks without indexed events have no table.
         """
         try:
-            events_list = block_data.get("events", [])
+            entries = [(block_index, table) for block_index, table in entries if table is not None]
             
-            if not events_list:
+            if not entries:
                 return
-
-            # Extract columns for index
-            indices = []
-            for event in events_list:
-                entity_id = event.get("entity_id")
-                if entity_id:
-                    indices.append({
-                        "entity_id": entity_id,
-                        "block_index": block_data["index"],
-                        "event_type": event.get("event", event.get("event_type", "unknown")),
-                        "timestamp": event.get("timestamp", block_data["timestamp"]),
-                        "block_hash": block_data["hash"]
-                    })
-            
-            if not indices:
-                return
-
-            # Create Table
-            schema = pa.schema([
-                ("entity_id", pa.string()),
-                ("block_index", pa.int64()),
-                ("event_type", pa.string()),
-                ("timestamp", pa.float64()),
-                ("block_hash", pa.string())
-            ])
-            
-            table = pa.Table.from_pylist(indices, schema=schema)
             
-            # Write partition file
-            events_dir = self._get_events_dir(chain_name)
-            # Use block index to ensure unique filenames and easy ordering
-            file_path = events_dir / f"events_{block_data['index']:09d}.parquet"
+            if self._events_buffer_rows > 0:
+                self._events_buffer.setdefault(chain_name, []).extend(entries)
+                buffered = self._events_buffered.get(chain_name, 0) + sum(t.num_rows for _, t in entries)
+                self._events_buffered[chain_name] = buffered
+                if buffered >= self._events_buffer_rows:
+                    self.flush_events_index(chain_name)
+                return
             
-            pq.write_table(
-                table,
-                file_path,
-                compression='zstd',
-                compression_level=3,
-                use_dictionary=True,
-                write_statistics=True
-            )
+            self._write_events_file(chain_name, entries)
 
         except Exception as e:
             logger.error(f"Failed to update events index: {e}")
             # Don't raise - this is not critical for block storage
     
+    def _write_events_file(self, chain_name: str, entries: list[tuple[int, pa.Table]]):
+        """
+        Write (block_index, table) index entries as one events file, one row group each.
+        
+        A block's index rows live in exactly one file: rows already indexed
+        for the written blocks are dropped from older files, and a later entry
+        for the same block replaces an earlier one.
+        """
+        # Write partition file
+        events_dir = self._get_events_dir(chain_name)
+        entries = sorted(dict(entries).items())
+        block_indices = [block_index for block_index, _ in entries]
+        # Use block index to ensure unique filenames and easy ordering;
+        # multi-block files are named after their range like snapshots
+        first, last = block_indices[0], block_indices[-1]
+        if first != last:
+            file_path = events_dir / f"events_{first:09d}-{last:09d}.parquet"
+        else:
+            file_path = events_dir / f"events_{first:09d}.parquet"
+        
+        retained = self._drop_indexed_blocks(events_dir, block_indices, file_path)
+        self._write_parquet(retained + [table for _, table in entries], file_path)
+        self._invalidate_events_dataset(chain_name)
+        if first != last:
+            return
+
+        # Only per-block files count towards compaction
+        fragments = self._events_fragments.get(chain_name, 0) + 1
+        self._events_fragments[chain_name] = fragments
+        if fragments >= EVENTS_COMPACTION_THRESHOLD:
+            self.compact_events_index(chain_name)
+    
+    @staticmethod
+    def _split_by_block(table: pa.Table) -> list[pa.Table]:
+        """Split index rows into one table per block, in block order."""
+        return [
+            table.filter(pc.field("block_index") == block_index)
+            for block_index in sorted(pc.unique(table["block_index"]).to_pylist())
+        ]
+    
+    def _drop_indexed_blocks(
+        self, events_dir: Path, block_indices: list[int], target: Path
+    ) -> list[pa.Table]:
+        """
+        Remove the index rows of re-indexed blocks from existing events files.
+        
+        Only files whose name range covers one of the blocks are read;
+        per-block files of those blocks are deleted and multi-block files
+        rewritten without their rows (or deleted once empty).
+        
+        Args:
+            events_dir: Events directory of the chain
+            block_indices: Sorted indices of the blocks about to be written
+            target: File about to be written; its remaining rows are returned
+                    instead of being rewritten
+            
+        Returns:
+            The rows of target kept for other blocks, one table per block
+        """
+        retained = []
+        dropped = pa.array(block_indices, pa.int64())
+        for path in events_dir.glob("events_*.parquet"):
+            first, _, last = path.stem[len("events_"):].partition("-")
+            first = int(first)
+            last = int(last) if last else first
+            # Any of the blocks inside this file's range?
+            position = bisect.bisect_left(block_indices, first)
+            if position == len(block_indices) or block_indices[position] > last:
+                continue
+            
+            table = ds.dataset(path, format="parquet", schema=EVENTS_INDEX_SCHEMA).to_table()
+            kept = table.filter(pc.invert(pc.is_in(table["block_index"], value_set=dropped)))
+            if path == target:
+                retained = self._split_by_block(kept) if kept.num_rows else []
+            elif not kept.num_rows:
+                path.unlink()
+            elif kept.num_rows < table.num_rows:
+                self._write_parquet(self._split_by_block(kept), path)
+        return retained
+    
+    def flush_events_index(self, chain_name: str | None = None):
+        """
+        Write buffered events index rows to disk.
+        
+        Args:
+            chain_name: Chain to flush (None flushes all chains)
+        """
+        chains = [chain_name] if chain_name else list(self._events_buffer)
+        for chain in chains:
+            entries = self._events_buffer.pop(chain, None)
+            self._events_buffered.pop(chain, None)
+            if not entries:
+                continue
+            try:
+                self._write_events_file(chain, entries)
+                self._fsync_dir(self.events_path / chain)
+            except Exception as e:
+                logger.error(f"Failed to flush events index for chain {chain}: {e}")
+    
+    def close(self):
+        """Flush buffered events index rows and stop the block cache's cleanup thread."""
+        self.flush_events_index()
+        if self._block_cache is not None:
+            self._block_cache.close()
+    
+    def __enter__(self) -> 'FileStorageAdapter':
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    def compact_events_index(self, chain_name: str) -> int:
+        """
+        Merge per-block events index files into a single snapshot file.
+        
+        Each stored block appends one small Parquet file to the chain's events
+        dataset; scans over thousands of them are dominated by file opens and
+        footer parsing. Compaction rewrites all per-block files into one
+        snapshot named after the block range it covers. Other snapshots and
+        batch files (see store_blocks_batch) are left untouched, except that
+        the rows of a file with the snapshot's name are carried over into it.
+        
+        Args:
+            chain_name: Name of the chain
+            
+        Returns:
+            Number of per-block files merged
+        """
+        self.flush_events_index(chain_name)
+        events_dir = self._get_events_dir(chain_name)
+        fragments = sorted(
+            f for f in events_dir.glob("events_*.parquet")
+            if f.stem[len("events_"):].isdigit()
+        )
+        self._events_fragments[chain_name] = 0
+        
+        if len(fragments) < 2:
+            return 0
+        
+        table = ds.dataset(fragments, format="parquet", schema=EVENTS_INDEX_SCHEMA).to_table()
+        
+        first = int(fragments[0].stem[len("events_"):])
+        last = int(fragments[-1].stem[len("events_"):])
+        snapshot = events_dir / f"events_{first:09d}-{last:09d}.parquet"
+        if snapshot.exists():
+            # An earlier snapshot of the same range whose first and last blocks
+            # were re-stored since; its other blocks are kept
+            previous = ds.dataset(snapshot, format="parquet", schema=EVENTS_INDEX_SCHEMA).to_table()
+            table = pa.concat_tables([previous, table])
+        table = table.sort_by([("block_index", "ascending"), ("timestamp", "ascending")])
+        self._write_parquet(table, snapshot)
+        self._fsync_dir(events_dir)
+        
+        for fragment in fragments:
+            fragment.unlink()
+        self._invalidate_events_dataset(chain_name)
+        
+        logger.debug(f"Compacted {len(fragments)} events index files for chain {chain_name}")
+        return len(fragments)
+    
+    async def store_chain_metadata_async(
+        self, chain_name: str, chain_type: str, parent_chain: str = None, metadata: dict = None
+    ):
+        """store_chain_metadata() run in a worker thread so the event loop is not blocked on disk I/O."""
+        await asyncio.to_thread(self.store_chain_metadata, chain_name, chain_type, parent_chain, metadata)
+    
+    async def get_chain_metadata_async(self, chain_name: str) -> dict | None:
+        """get_chain_metadata() run in a worker thread."""
+        return await asyncio.to_thread(self.get_chain_metadata, chain_name)
+    
+    async def store_block_async(self, chain_name: str, block_data: dict | Block):
+        """
+        store_block() run in a worker thread; the block write and fsyncs happen off the event loop.
+        Writes to the same chain should still be awaited one at a time.
+        """
+        await asyncio.to_thread(self.store_block, chain_name, block_data)
+    
+    async def get_block_async(self, chain_name: str, block_index: int) -> dict | None:
+        """get_block() run in a worker thread."""
+        return await asyncio.to_thread(self.get_block, chain_name, block_index)
+    
     def get_chain_metadata(self, chain_name: str) -> dict | None:
         """Get chain metadata"""
         try:
@@ -222,97 +784,204 @@ class FileStorageAdapter:
             if not chain_file.exists():
                 return None
             
-            with open(chain_file, 'r') as f:
-                return json.load(f)
+            return _loads_json(chain_file.read_bytes())
                 
         except Exception as e:
             logger.error(f"Failed to get chain metadata {chain_name}: {e}")
             return None
     
+    @staticmethod
+    def _decode_block_header(meta: dict[bytes, bytes]) -> dict:
+        """Decode block header fields from Parquet key-value metadata (bytes keys and values)."""
+        return BlockHeader.from_metadata(meta)._asdict()
+    
+    @classmethod
+    def _read_block_file(cls, block_file: str | Path) -> dict | None:
+        """
+        Read a block Parquet file into a block dictionary.
+        Returns None if the file carries no block header metadata.
+        """
+        table = pq.read_table(block_file)
+        
+        # Extract metadata
+        meta = table.schema.metadata
+        if not meta:
+            return None
+            
+        block_data = cls._decode_block_header(meta)
+        block_data["events"] = table  # Zero-copy access
+        return block_data
+    
+    @staticmethod
+    def _read_block_header(block_file: str | Path) -> dict | None:
+        """
+        Read only the header of a block Parquet file from its footer.
+        Returns None if the file carries no block header metadata.
+        
+        Decoded footers are memoized per file version, so listing the same
+        blocks again costs a stat() per file.
+        """
+        st = os.stat(block_file)
+        footer = _read_block_footer(str(block_file), st.st_mtime_ns, st.st_ino)
+        if footer is None:
+            return None
+        
+        header, event_count = footer
+        block_header = header._asdict()
+        block_header["event_count"] = event_count
+        return block_header
+    
     def get_block(self, chain_name: str, block_index: int) -> dict | None:
         """
         Get a specific block.
         Returns a Dictionary suitable for Block.from_dict(), with 'events' as a pyarrow.Table.
         """
         try:
+            self._validate_filename(chain_name)
+            cached = self._cache_get(chain_name, block_index)
+            if cached is not None:
+                return cached
+            
             block_file = self._get_block_file(chain_name, block_index)
-            if not block_file.exists():
+            version = self._file_version(block_file)
+            if version is None:
                 return None
             
-            # Read Parquet file
-            table = pq.read_table(block_file)
-            
-            # Extract metadata
-            meta = table.schema.metadata
-            if not meta:
+            block_data = self._read_block_file(block_file)
+            if block_data is None:
                 logger.warning(f"Block {block_index} missing metadata in Parquet file")
-                return None
-                
-            # Decode metadata
-            # Keys are bytes, values are bytes
-            index = int(meta.get(b'index', b'0'))
-            timestamp = float(meta.get(b'timestamp', b'0.0'))
-            previous_hash = meta.get(b'previous_hash', b'').decode('utf-8')
-            nonce = int(meta.get(b'nonce', b'0'))
-            block_hash = meta.get(b'hash', b'').decode('utf-8')
-
-            block_data = {
-                "index": index,
-                "events": table,  # Zero-copy access
-                "timestamp": timestamp,
-                "previous_hash": previous_hash,
-                "nonce": nonce,
-                "hash": block_hash
-            }
-            
+            else:
+                self._cache_put(chain_name, block_data, version)
             return block_data
                 
         except Exception as e:
             logger.error(f"Failed to get block {block_index} for chain {chain_name}: {e}")
             return None
     
-    def get_chain_blocks(self, chain_name: str, limit: int = None, offset: int = 0) -> list[dict]:
-        """Get blocks for a specific chain"""
+    def _list_block_files(self, chain_name: str, limit: int = None, offset: int = 0) -> list[tuple[int, str]]:
+        """
+        List (block_index, path) pairs for a chain in index order, after offset/limit.
+        
+        The sorted listing is cached per chain until the chain directory's
+        mtime changes (any block file added, replaced or removed), so paging
+        through a chain is a list slice instead of a directory scan and sort.
+        """
+        self._validate_filename(chain_name)
+        chain_dir = self.blocks_path / chain_name
         try:
-            self._validate_filename(chain_name)
-            chain_dir = self.blocks_path / chain_name
-            if not chain_dir.exists():
-                return []
+            signature = chain_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+        
+        cached = self._block_listings.get(chain_name)
+        if cached is not None and cached[0] == signature:
+            entries = cached[1]
+        else:
+            entries = []
+            with os.scandir(chain_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith("block_") and name.endswith(".parquet"):
+                        entries.append((int(name[len("block_"):-len(".parquet")]), entry.path))
+            entries.sort()
+            if self._mtime_settled(signature):
+                self._block_listings[chain_name] = (signature, entries)
+        
+        if limit:
+            return entries[offset:offset + limit]
+        return entries[offset:] if offset else list(entries)
+    
+    def iter_chain_blocks(self, chain_name: str, limit: int = None, offset: int = 0) -> Iterator[dict]:
+        """
+        Lazily iterate blocks for a specific chain in index order.
+        
+        Block files are only opened as the iterator advances, so callers that
+        stop early never read the remaining blocks. Unreadable block files are
+        skipped with a warning.
+        
+        Raises:
+            ValueError: If chain_name is invalid
+        """
+        block_files = self._list_block_files(chain_name, limit, offset)
+        return self._iter_block_files(chain_name, block_files)
+    
+    def _iter_block_files(self, chain_name: str, block_files: list[tuple[int, str]]) -> Iterator[dict]:
+        """Yield block dictionaries for the given block files, serving cached blocks first."""
+        for block_index, block_file in block_files:
+            cached = self._cache_get(chain_name, block_index)
+            if cached is not None:
+                yield cached
+                continue
             
-            # Get all block files and sort by index
-            block_files = sorted(
-                [f for f in chain_dir.glob("block_*.parquet")],
-                key=lambda x: int(x.stem.split('_')[1])
-            )
+            version = self._file_version(block_file)
+            block_data = self._try_read_block_file(block_file)
+            if block_data is not None:
+                self._cache_put(chain_name, block_data, version)
+                yield block_data
+    
+    def _try_read_block_file(self, block_file: str | Path) -> dict | None:
+        """Read a block file, logging and returning None if it is unreadable."""
+        try:
+            return self._read_block_file(block_file)
+        except Exception as e:
+            logger.warning(f"Failed to read block file {block_file}: {e}")
+            return None
+    
+    def get_chain_block_headers(self, chain_name: str, limit: int = None, offset: int = 0) -> list[dict]:
+        """
+        Get block headers for a specific chain without reading events.
+        
+        Only the Parquet footer of each block file is read, so listing blocks
+        costs O(footer) rather than O(block) I/O. Each header carries index,
+        timestamp, previous_hash, nonce, hash and event_count.
+        
+        Raises:
+            ValueError: If chain_name is invalid
+        """
+        headers = []
+        for block_index, block_file in self._list_block_files(chain_name, limit, offset):
+            cached = self._cache_get(chain_name, block_index)
+            if cached is not None:
+                events = cached.pop("events")
+                cached["event_count"] = events.num_rows
+                headers.append(cached)
+                continue
             
-            # Apply offset and limit
-            if offset:
-                block_files = block_files[offset:]
-            if limit:
-                block_files = block_files[:limit]
+            try:
+                header = self._read_block_header(block_file)
+            except Exception as e:
+                logger.warning(f"Failed to read block file {block_file}: {e}")
+                continue
+            if header is not None:
+                headers.append(header)
+        return headers
+    
+    def get_chain_blocks(self, chain_name: str, limit: int = None, offset: int = 0) -> list[dict]:
+        """
+        Get blocks for a specific chain.
+        
+        Unlike iter_chain_blocks, every block is needed up front, so block
+        files missing from the cache are read concurrently.
+        """
+        try:
+            block_files = self._list_block_files(chain_name, limit, offset)
             
-            blocks = []
-            for block_file in block_files:
-                try:
-                    table = pq.read_table(block_file)
-                    meta = table.schema.metadata
-                    
-                    if meta:
-                        block_data = {
-                            "index": int(meta.get(b'index', b'0')),
-                            "events": table,
-                            "timestamp": float(meta.get(b'timestamp', b'0.0')),
-                            "previous_hash": meta.get(b'previous_hash', b'').decode('utf-8'),
-                            "nonce": int(meta.get(b'nonce', b'0')),
-                            "hash": meta.get(b'hash', b'').decode('utf-8')
-                        }
-                        blocks.append(block_data)
-                except Exception as e:
-                    logger.warning(f"Failed to read block file {block_file}: {e}")
-                    continue
+            blocks: list[dict | None] = [self._cache_get(chain_name, block_index) for block_index, _ in block_files]
+            missing = [i for i, block_data in enumerate(blocks) if block_data is None]
+            versions = {i: self._file_version(block_files[i][1]) for i in missing}
             
-            return blocks
+            if len(missing) > 1:
+                with ThreadPoolExecutor(max_workers=min(BLOCK_READ_WORKERS, len(missing))) as executor:
+                    read = executor.map(self._try_read_block_file, [block_files[i][1] for i in missing])
+                    for i, block_data in zip(missing, read):
+                        blocks[i] = block_data
+            elif missing:
+                blocks[missing[0]] = self._try_read_block_file(block_files[missing[0]][1])
             
+            for i in missing:
+                if blocks[i] is not None:
+                    self._cache_put(chain_name, blocks[i], versions[i])
+            return [block_data for block_data in blocks if block_data is not None]
         except ValueError:
             raise
         except Exception as e:
@@ -322,54 +991,62 @@ class FileStorageAdapter:
     def get_entity_events(self, entity_id: str, chain_name: str = None) -> list[dict]:
         """
         Get all events for a specific entity using Arrow Dataset.
+        
+        Without a chain filter, the events datasets of all chains are scanned
+        in one pass, with the chain name taken from the directory layout.
         """
         try:
             events = []
             
-            # Determine which chains to search
-            chains_to_search = []
-            if chain_name:
-                chains_to_search = [chain_name]
-            else:
-                # Search all chains (directories in events_path)
-                chains_to_search = [p.name for p in self.events_path.iterdir() if p.is_dir()]
+            dataset = self._events_dataset(chain_name)
             
-            # Search each chain's events dataset
-            for search_chain in chains_to_search:
-                events_dir = self._get_events_dir(search_chain)
-                
-                try:
-                    # Load dataset
-                    dataset = ds.dataset(events_dir, format="parquet")
-                    filtered_table = dataset.to_table(filter=pc.field("entity_id") == entity_id)
-                    sorted_table = filtered_table.sort_by([("timestamp", "ascending")])
-                    index_records = sorted_table.to_pylist()
+            try:
+                filtered_table = dataset.to_table(filter=pc.field("entity_id") == entity_id)
+                sorted_table = filtered_table.sort_by([("timestamp", "ascending")])
+                index_records = sorted_table.to_pylist()
+            except Exception as e:
+                logger.warning(f"Failed to scan events index: {e}")
+                index_records = []
+            
+            # Index rows carry the event payload, so blocks are only
+            # read for rows from index files that predate the column
+            legacy_timestamps_by_block: dict[tuple[str, int], list[float]] = {}
+            for record in index_records:
+                record_chain = record.get("chain_name", chain_name)
+                if record["data"] is None:
+                    key = (record_chain, record["block_index"])
+                    legacy_timestamps_by_block.setdefault(key, []).append(record["timestamp"])
+                    continue
+                events.append({
+                    "chain_name": record_chain,
+                    "block_index": record["block_index"],
+                    "event_type": record["event_type"],
+                    "timestamp": record["timestamp"],
+                    "details": _loads_json(record["data"]).get("details", {})
+                })
+            
+            for (block_chain, block_index), timestamps in legacy_timestamps_by_block.items():
+                # Fetch full block
+                block_data = self.get_block(block_chain, block_index)
+                if block_data:
+
+                    events_table = block_data["events"]
+                    expr = (pc.field("entity_id") == entity_id) & pc.field("timestamp").isin(timestamps)
+                    subset = events_table.filter(expr)
+                    subset_rows = Block._table_to_list_of_dicts(subset)
                     
-                    for record in index_records:
-                        # Fetch full block
-                        block_data = self.get_block(search_chain, record["block_index"])
-                        if block_data:
-
-                            events_table = block_data["events"]
-                            expr = (pc.field("entity_id") == entity_id) & (pc.field("timestamp") == record["timestamp"])
-                            subset = events_table.filter(expr)
-                            subset_rows = Block._table_to_list_of_dicts(subset)
-                            
-                            for full_event in subset_rows:
-                                events.append({
-                                    "chain_name": search_chain,
-                                    "block_index": record["block_index"],
-                                    "event_type": full_event.get("event"),
-                                    "timestamp": full_event.get("timestamp"),
-                                    "details": full_event.get("details", {})
-                                })
-                                
-                except Exception as e:
-                    logger.warning(f"Failed to load user config: {e}")
-                    pass
+                    for full_event in subset_rows:
+                        events.append({
+                            "chain_name": block_chain,
+                            "block_index": block_index,
+                            "event_type": full_event.get("event"),
+                            "timestamp": full_event.get("timestamp"),
+                            "details": full_event.get("details", {})
+                        })
             
-            # Final sort by timestamp across chains
-            events.sort(key=lambda x: x.get("timestamp", 0))
+            # Legacy rows are appended out of order
+            if legacy_timestamps_by_block:
+                events.sort(key=lambda x: x.get("timestamp", 0))
             return events
             
         except ValueError:
@@ -382,6 +1059,7 @@ class FileStorageAdapter:
         """Get statistics for a specific chain using Arrow Datasets"""
         try:
             self._validate_filename(chain_name)
+            self.flush_events_index(chain_name)
             chain_dir = self.blocks_path / chain_name
             events_dir = self._get_events_dir(chain_name)
             
@@ -402,16 +1080,16 @@ class FileStorageAdapter:
             
             if events_dir.exists() and any(events_dir.iterdir()):
                 try:
-                    dataset = ds.dataset(events_dir, format="parquet")
+                    dataset = self._events_dataset(chain_name)
                     
                     # Total events = count rows
                     total_events = dataset.count_rows()
                     
-                    unique_entities_count = len(
-                        dataset.to_table(columns=['entity_id'])
-                        .column('entity_id')
-                        .unique()
-                    )
+                    # Only the entity_id column is read; counted without
+                    # materializing the unique values
+                    unique_entities_count = pc.count_distinct(
+                        dataset.to_table(columns=['entity_id']).column('entity_id')
+                    ).as_py()
                 except Exception as e:
                     logger.warning(f"Failed to load channel data: {e}")
                     pass
@@ -435,10 +1113,22 @@ class FileStorageAdapter:
             }
     
     def list_chains(self) -> list[str]:
-        """list all stored chains"""
+        """
+        list all stored chains
+        
+        The listing is cached until the chains directory's mtime changes,
+        which happens whenever a chain metadata file is added or replaced.
+        """
         try:
-            chain_files = self.chains_path.glob("*.json")
-            return [f.stem for f in chain_files]
+            signature = self.chains_path.stat().st_mtime_ns
+            if self._chains_listing is not None and self._chains_listing[0] == signature:
+                return list(self._chains_listing[1])
+            
+            with os.scandir(self.chains_path) as it:
+                names = [entry.name[:-len(".json")] for entry in it if entry.name.endswith(".json")]
+            if self._mtime_settled(signature):
+                self._chains_listing = (signature, names)
+            return names
         except Exception as e:
             logger.error(f"Failed to list chains: {e}")
             return []
@@ -454,6 +1144,10 @@ class FileStorageAdapter:
                     for block_file in chain_dir.glob("block_*.parquet"):
                         if block_file.stat().st_mtime < cutoff_time:
                             block_file.unlink()
+                            self._block_listings.pop(chain_dir.name, None)
+                            if self._block_cache is not None:
+                                block_index = int(block_file.stem[len("block_"):])
+                                self._block_cache.delete(f"{chain_dir.name}:{block_index}")
                             logger.debug(f"Cleaned up old block file: {block_file}")
             
             logger.info(f"Cleaned up data older than {days_to_keep} days")
@@ -461,17 +1155,36 @@ class FileStorageAdapter:
         except Exception as e:
             logger.error(f"Failed to cleanup old data: {e}")
     
+    @staticmethod
+    def _scan_tree(root: str | Path) -> tuple[int, int]:
+        """
+        Sum file sizes and count files under a directory.
+        
+        Walks with os.scandir so directory checks come from the cached
+        dirent type and no Path object is built per file.
+        
+        Returns:
+            Tuple of (total_size_bytes, file_count)
+        """
+        total_size = 0
+        file_count = 0
+        pending = [root]
+        
+        while pending:
+            with os.scandir(pending.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    else:
+                        total_size += entry.stat(follow_symlinks=False).st_size
+                        file_count += 1
+        
+        return total_size, file_count
+    
     def get_storage_info(self) -> dict:
         """Get storage information"""
         try:
-            total_size = 0
-            file_count = 0
-            
-            for root, dirs, files in os.walk(self.storage_path):
-                for file in files:
-                    file_path = Path(root) / file
-                    total_size += file_path.stat().st_size
-                    file_count += 1
+            total_size, file_count = self._scan_tree(self.storage_path)
             
             return {
                 "storage_path": str(self.storage_path),
@@ -501,6 +1214,8 @@ class FileStorageAdapter:
         try:
             events = []
             
+            self.flush_events_index(chain_name)
+            
             # Determine which chains to search
             chains_to_search = []
             if chain_name:
@@ -511,10 +1226,8 @@ class FileStorageAdapter:
                 ]
             
             for search_chain in chains_to_search:
-                events_dir = self._get_events_dir(search_chain)
-                
                 try:
-                    dataset = ds.dataset(events_dir, format="parquet")
+                    dataset = self._events_dataset(search_chain)
                     
                     # Apply column pruning - only read required columns
                     projection = columns if columns else None
@@ -529,6 +1242,9 @@ class FileStorageAdapter:
                     sorted_table = filtered_table.sort_by([("timestamp", "ascending")])
                     
                     for record in sorted_table.to_pylist():
+                        if "data" in record:
+                            payload = record.pop("data")
+                            record["details"] = _loads_json(payload).get("details", {}) if payload else {}
                         record["chain_name"] = search_chain
                         events.append(record)
                         
@@ -601,8 +1317,8 @@ class BatchBlockWriter:
         
         start_time = time.time()
         
+        self.storage.store_blocks_batch(self.chain_name, self._buffer)
         for block in self._buffer:
-            self.storage.store_block(self.chain_name, block)
             self._stats["blocks_written"] += 1
             self._stats["events_written"] += len(block.events)
         
@@ -10,6 +10,7 @@ provides validation mechanisms to ensure system integrity.
 """
 
 import os
+from functools import lru_cache
 from typing import Any
 
 from hierachain.units.version import get_version, VERSION
@@ -262,11 +263,9 @@ class TestingSettings(Settings):
     GO_ENGINE_ENABLED = False  # Disabled in testing
 
 
-# Get settings based on environment
-def get_settings() -> Settings:
-    """Get settings based on environment variable"""
-    env = os.getenv("HRC_ENV", "dev").lower()
-    
+@lru_cache(maxsize=None)
+def _settings_for_env(env: str) -> Settings:
+    """Build the settings instance for an environment name (memoized)"""
     if env == "product":
         return ProductionSettings()
     elif env == "test":
@@ -275,5 +274,11 @@ def get_settings() -> Settings:
         return DevelopmentSettings()
 
 
+# Get settings based on environment
+def get_settings() -> Settings:
+    """Get settings based on environment variable"""
+    return _settings_for_env(os.getenv("HRC_ENV", "dev").lower())
+
+
 # Global settings instance
 settings = get_settings()
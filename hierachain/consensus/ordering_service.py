@@ -296,6 +296,11 @@ class OrderingService:
         self.blocks_created = 0
         self.events_processed = 0
         
+        # Completion signalling for callers awaiting a processed-event count
+        self.completion_event: asyncio.Event | None = None
+        self._completion_target: int | None = None
+        self._completion_loop: asyncio.AbstractEventLoop | None = None
+
         # Threading for concurrent processing
         self.processing_thread = None
         self.should_stop = threading.Event()
@@ -442,15 +447,64 @@ class OrderingService:
         Returns:
             Event ID for tracking
         """
-        # Enforce status check
+        self._check_accepting_events()
+
+        if not isinstance(event_data, dict):
+            raise ValueError("Event data must be a dictionary")
+
+        return self._enqueue_event(event_data, channel_id, submitter_org, time.time())
+
+    def receive_events_batch(self, events: list[dict[str, Any]], channel_id: str,
+                             submitter_org: str) -> list[str]:
+        """
+        Receive a batch of events from the same channel and organization.
+
+        The whole batch is validated before anything is journaled or queued,
+        so a malformed event rejects the batch without partial submission.
+        If the journal fails part-way, the RuntimeError is raised after the
+        earlier events were already queued and counted; those events are
+        still ordered, but their IDs are not returned.
+
+        Args:
+            events: Event data to order, in submission order
+            channel_id: Channel where the events originated
+            submitter_org: Organization submitting the events
+
+        Returns:
+            Event IDs for tracking, in the same order as the events
+        """
+        self._check_accepting_events()
+
+        if not all(isinstance(event_data, dict) for event_data in events):
+            raise ValueError("Event data must be a dictionary")
+
+        received_at = time.time()
+        return [
+            self._enqueue_event(event_data, channel_id, submitter_org, received_at)
+            for event_data in events
+        ]
+
+    def _check_accepting_events(self) -> None:
+        """Raise if the service is not accepting new events"""
         if self.status == OrderingStatus.LOCKDOWN:
             raise PermissionError("Service is in LOCKDOWN mode. Write operations are suspended.")
         if self.status != OrderingStatus.ACTIVE:
             raise RuntimeError(f"Service is not ACTIVE (current status: {self.status.value})")
 
-        if not isinstance(event_data, dict):
-            raise ValueError("Event data must be a dictionary")
+    def _enqueue_event(self, event_data: dict[str, Any], channel_id: str,
+                       submitter_org: str, received_at: float) -> str:
+        """
+        Journal a validated event and queue it for ordering.
 
+        Args:
+            event_data: Event data to order
+            channel_id: Channel where event originated
+            submitter_org: Organization submitting the event
+            received_at: Time the event was received
+
+        Returns:
+            Event ID for tracking
+        """
         # Sanitize event data to ensure JSON compatibility (e.g. bytes -> hex)
         event_data = self._make_serializable(event_data)
 
@@ -470,7 +524,7 @@ class OrderingService:
             event_data=event_data,
             channel_id=channel_id,
             submitter_org=submitter_org,
-            received_at=time.time(),
+            received_at=received_at,
             status=EventStatus.PENDING
         )
         
@@ -480,9 +534,44 @@ class OrderingService:
         
         # Update statistics
         self.statistics["events_received"] += 1
-        
+
         return event_id
-    
+
+    def register_completion_target(self, target: int) -> asyncio.Event:
+        """
+        Register a processed-event count to be signalled on the caller's loop.
+
+        Must be called from a running event loop. The returned event is set
+        once certified plus rejected events reach the target.
+
+        Args:
+            target: Number of certified or rejected events to wait for
+
+        Returns:
+            Event set when the target is reached
+        """
+        self._completion_loop = asyncio.get_running_loop()
+        self.completion_event = asyncio.Event()
+        self._completion_target = target
+        self._check_completion()
+        return self.completion_event
+
+    def _check_completion(self) -> None:
+        """Signal the completion event once the registered target is reached"""
+        target = self._completion_target
+        if target is None:
+            return
+        done = self.statistics["events_certified"] + self.statistics["events_rejected"]
+        if done < target:
+            return
+
+        self._completion_target = None
+        try:
+            self._completion_loop.call_soon_threadsafe(self.completion_event.set)
+        except RuntimeError:
+            # Waiting loop already closed
+            pass
+
     def get_event_status(self, event_id: str) -> dict[str, Any] | None:
         """
         Get status of a specific event.
@@ -736,6 +825,8 @@ class OrderingService:
                 
             await self._process_single_event(event)
 
+        self._check_completion()
+
     async def _check_timeout_block_creation(self, force: bool = False) -> None:
         """
         Check if block needs to be created due to timeout.
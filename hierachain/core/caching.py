@@ -7,7 +7,9 @@ TTL support, and specialized blockchain data caching. Delivers significant perfo
 
 import time
 import threading
+import weakref
 import logging
+from collections import OrderedDict
 from typing import Any
 from dataclasses import dataclass, field
 from enum import Enum
@@ -58,7 +60,8 @@ class AdvancedCache:
         self.max_size = max_size
         self.eviction_policy = EvictionPolicy(eviction_policy)
         self.cache: dict[str, CacheEntry] = {}
-        self.access_order: list[str] = []  # For LRU/FIFO
+        # Keys from least to most recently accessed, kept in O(1) per access
+        self.access_order: OrderedDict[str, None] = OrderedDict()
         self.lock = threading.RLock()
         self.logger = logging.getLogger(__name__)
         
@@ -68,6 +71,7 @@ class AdvancedCache:
         self.evictions = 0
         
         # TTL cleanup
+        self._cleanup_stop = threading.Event()
         self._start_ttl_cleanup_thread()
     
     def get(self, key: str) -> Any | None:
@@ -139,10 +143,9 @@ class AdvancedCache:
         entry.access_time = time.time()
         entry.access_count += 1
         
-        # Update access order for LRU/FIFO
-        if key in self.access_order:
-            self.access_order.remove(key)
-        self.access_order.append(key)
+        # Update access order for LRU
+        self.access_order[key] = None
+        self.access_order.move_to_end(key)
     
     def _evict(self):
         """Evict an item based on the eviction policy"""
@@ -152,9 +155,8 @@ class AdvancedCache:
         evict_key = None
         
         if self.eviction_policy == EvictionPolicy.LRU:
-            # Least Recently Used
-            evict_key = min(self.cache.keys(), 
-                           key=lambda k: self.cache[k].access_time)
+            # Least Recently Used: head of the access order
+            evict_key = next(iter(self.access_order))
         
         elif self.eviction_policy == EvictionPolicy.LFU:
             # Least Frequently Used
@@ -175,8 +177,7 @@ class AdvancedCache:
                 evict_key = expired_keys[0]
             else:
                 # Fallback to LRU if no expired items
-                evict_key = min(self.cache.keys(), 
-                               key=lambda k: self.cache[k].access_time)
+                evict_key = next(iter(self.access_order))
         
         if evict_key:
             self._remove_key(evict_key)
@@ -186,21 +187,35 @@ class AdvancedCache:
         """Remove a key from the cache"""
         if key in self.cache:
             del self.cache[key]
-        if key in self.access_order:
-            self.access_order.remove(key)
+        self.access_order.pop(key, None)
     
     def _start_ttl_cleanup_thread(self):
-        """Start background thread for TTL cleanup"""
+        """
+        Start background thread for TTL cleanup.
+        
+        The thread only holds a weak reference to the cache and exits as soon
+        as the cache is garbage collected or closed.
+        """
+        stop = self._cleanup_stop
+        cache_ref = weakref.ref(self, lambda _: stop.set())
+        
         def cleanup_loop():
-            while True:
+            while not stop.wait(60):  # Check every minute
+                cache = cache_ref()
+                if cache is None:
+                    return
                 try:
-                    time.sleep(60)  # Check every minute
-                    self.cleanup_ttl()
+                    cache.cleanup_ttl()
                 except Exception as e:
-                    self.logger.error(f"TTL cleanup error: {e}")
+                    cache.logger.error(f"TTL cleanup error: {e}")
+                del cache
         
-        cleanup_thread = threading.Thread(target=cleanup_loop, daemon=True)
-        cleanup_thread.start()
+        self._cleanup_thread = threading.Thread(target=cleanup_loop, daemon=True)
+        self._cleanup_thread.start()
+    
+    def close(self):
+        """Stop the TTL cleanup thread; expired entries are still dropped on access"""
+        self._cleanup_stop.set()
     
     def cleanup_ttl(self):
         """Manual cleanup of expired TTL entries"""
@@ -560,9 +575,9 @@ class BlockchainCacheManager:
     def shutdown(self):
         """Shutdown cache manager"""
         with self.lock:
-            self.block_cache.clear()
-            self.event_cache.clear()
-            self.entity_cache.clear()
+            for cache in (self.block_cache, self.event_cache, self.entity_cache):
+                cache.clear()
+                cache.close()
             self.logger.info("Blockchain cache manager shutdown")
 
 
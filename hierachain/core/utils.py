@@ -7,6 +7,7 @@ including cryptographic utilities, validation helpers, and data processing funct
 
 import hashlib
 import json
+import math
 import time
 import uuid
 from typing import Any
@@ -433,3 +434,97 @@ class MerkleTree:
     def get_root(self) -> str:
         """Get the Merkle Root hash."""
         return self.root
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+    
+    Membership tests answer "definitely absent" or "possibly present";
+    there are no false negatives, so a miss can safely skip a full scan.
+    """
+    
+    def __init__(self, size_bits: int = 1 << 16, num_hashes: int = 3):
+        """
+        Initialize Bloom filter.
+        
+        Args:
+            size_bits: Number of bits in the filter
+            num_hashes: Number of bit positions set per item
+        """
+        self.size_bits = size_bits
+        self.num_hashes = num_hashes
+        self._bits = bytearray((size_bits + 7) // 8)
+
+    def _positions(self, item: str) -> list[int]:
+        """Derive the item's bit positions by double hashing one digest."""
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size_bits for i in range(self.num_hashes)]
+
+    def add(self, item: str) -> None:
+        """Add an item to the filter."""
+        bits = self._bits
+        for pos in self._positions(item):
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        """Check whether an item may have been added."""
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class HyperLogLog:
+    """
+    HyperLogLog sketch estimating the number of distinct strings.
+    
+    Uses 2**p one-byte registers (4 KB at the default p=12, about 1.6%
+    standard error). Sketches with the same p merge by register-wise max.
+    """
+    
+    def __init__(self, p: int = 12):
+        """
+        Initialize HyperLogLog sketch.
+        
+        Args:
+            p: Number of hash bits used to select a register (4-16)
+        """
+        if not 4 <= p <= 16:
+            raise ValueError("p must be between 4 and 16")
+        self.p = p
+        self.num_registers = 1 << p
+        self._registers = bytearray(self.num_registers)
+
+    def add(self, item: str) -> None:
+        """Add an item to the sketch."""
+        x = int.from_bytes(hashlib.blake2b(item.encode('utf-8'), digest_size=8).digest(), 'big')
+        width = 64 - self.p
+        index = x >> width
+        # Rank: position of the leftmost 1-bit in the remaining bits
+        rank = width - (x & ((1 << width) - 1)).bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """
+        Fold another sketch into this one.
+        
+        Args:
+            other: Sketch built with the same p
+        """
+        if other.p != self.p:
+            raise ValueError("Cannot merge HyperLogLog sketches with different p")
+        self._registers = bytearray(map(max, self._registers, other._registers))
+
+    def count(self) -> int:
+        """Estimate the number of distinct items added."""
+        m = self.num_registers
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self._registers)
+        
+        # Small-range correction (linear counting)
+        zeros = self._registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return round(estimate)
@@ -363,7 +363,7 @@ class CrossChainValidator:
         validation_results["main_chain_valid"] = self.hierarchy_manager.main_chain.is_chain_valid()
         
         # Validate each Sub-Chain
-        for sub_chain_name, sub_chain in self.hierarchy_manager.sub_chains.items():
+        for sub_chain_name, sub_chain in self.hierarchy_manager.get_sub_chain_snapshot():
             validation_results["sub_chains_valid"][sub_chain_name] = sub_chain.is_chain_valid()
         
         # Validate proof consistency
@@ -406,7 +406,7 @@ class CrossChainValidator:
             compliance_results["compliant_chains"] += 1
         
         # Check Sub-Chain compliance
-        for sub_chain_name, sub_chain in self.hierarchy_manager.sub_chains.items():
+        for sub_chain_name, sub_chain in self.hierarchy_manager.get_sub_chain_snapshot():
             sub_chain_violations = self._check_chain_compliance(sub_chain, sub_chain_name)
             compliance_results["violations"].extend(sub_chain_violations)
             compliance_results["chains_checked"] += 1
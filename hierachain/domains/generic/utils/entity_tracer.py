@@ -7,11 +7,16 @@ across multiple Sub-Chains while maintaining framework guidelines.
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from collections import defaultdict
 from hierachain.hierarchical.hierarchy_manager import HierarchyManager
 
 
+# Upper bound on worker threads used to scan candidate sub-chains
+MAX_TRACE_WORKERS = 8
+
+
 class EntityTracer:
     """
     Entity tracing utility for the HieraChain framework.
@@ -508,15 +513,24 @@ class EntityTracer:
         Returns:
             Dictionary mapping chain names to lists of entity events
         """
-        result = {}
+        # Skip sub-chains whose entity filter rules the entity out
+        candidates = [
+            (chain_name, chain)
+            for chain_name, chain in self.hierarchy_manager.get_sub_chain_snapshot()
+            if chain.may_contain_entity(entity_id)
+        ]
 
-        # Trace entity in all sub-chains
-        for chain_name, chain in self.hierarchy_manager.sub_chains.items():
-            events = chain.get_entity_history(entity_id)
-            if events:
-                result[chain_name] = events
+        def history(candidate: tuple[str, Any]) -> tuple[str, list[dict[str, Any]]]:
+            chain_name, chain = candidate
+            return chain_name, chain.get_entity_history(entity_id)
+
+        if len(candidates) > 1:
+            with ThreadPoolExecutor(max_workers=min(MAX_TRACE_WORKERS, len(candidates))) as executor:
+                histories = list(executor.map(history, candidates))
+        else:
+            histories = [history(candidate) for candidate in candidates]
 
-        return result
+        return {chain_name: events for chain_name, events in histories if events}
 
     def __str__(self) -> str:
         """String representation of the Entity Tracer."""
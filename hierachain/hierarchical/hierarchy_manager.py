@@ -6,7 +6,9 @@ coordinating the interaction between the Main Chain and multiple Sub-Chains
 (Domain Chains) in the HieraChain system.
 """
 
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from hierachain.hierarchical.main_chain import MainChain
@@ -14,10 +16,15 @@ from hierachain.hierarchical.multi_org import create_organization, MultiOrgNetwo
 from hierachain.hierarchical.channel import Channel, Organization as ChannelOrganization
 from hierachain.hierarchical.private_data import PrivateCollection
 
+from hierachain.core.utils import HyperLogLog, sanitize_metadata_for_main_chain
 from hierachain.domains.generic.chains.domain_chain import DomainChain
 from hierachain.hierarchical.transaction_manager import CrossChainTransactionManager
 
 
+# Upper bound on worker threads used to finalize sub-chains concurrently
+MAX_PROOF_WORKERS = 32
+
+
 class HierarchyManager:
     """
     Manages the hierarchy of chains (Main Chain and Sub-Chains).
@@ -38,7 +45,13 @@ class HierarchyManager:
         """
         self.main_chain: MainChain = MainChain(main_chain_name)
         self.sub_chains: dict[str, DomainChain] = {}
+        # Immutable (name, sub_chain) pairs for iteration, rebuilt whenever a
+        # sub-chain is added or removed through this class (see _rebuild_snapshot)
+        self._sub_chains_snapshot: tuple[tuple[str, DomainChain], ...] = ()
+        self._sub_chains_lock = threading.Lock()
         self.system_started_at: float = time.time()
+        # Uptime is measured on the monotonic clock so wall-clock steps cannot skew it
+        self._monotonic_start: float = time.monotonic()
         
         # Configuration
         self.auto_proof_submission: bool = False
@@ -48,8 +61,11 @@ class HierarchyManager:
         self.system_stats: dict[str, Any] = {
             "total_transactions": 0,
             "total_blocks": 0,
-            "active_chains": 0
+            "active_chains": 0,
+            "total_proofs": 0
         }
+        # Serializes writes to the shared Main Chain and to system_stats
+        self._main_chain_lock = threading.Lock()
 
         self.organizations: dict[str, Any] = {}
         self.network: MultiOrgNetwork | None = None
@@ -77,18 +93,23 @@ class HierarchyManager:
 
         sub_chain = DomainChain(name, domain_type)
         
+        # Summary-only view of the caller's metadata, recorded with the
+        # Main Chain registration; nothing to build when none was given
+        connection_metadata = sanitize_metadata_for_main_chain(metadata) if metadata else None
+        
         # Connect to main chain (simulated logical connection)
-        if sub_chain.connect_to_main_chain(self.main_chain):
-            self.sub_chains[name] = sub_chain
-            
-            # Record creation event on Main Chain
-            _connection_metadata = metadata or {}
-            # (In a real system, we might log this to main chain)
-            
+        if sub_chain.connect_to_main_chain(self.main_chain, connection_metadata):
+            with self._sub_chains_lock:
+                self.sub_chains[name] = sub_chain
+                self._rebuild_snapshot()
             return True
         
         return False
     
+    def get_uptime(self) -> float:
+        """Get seconds elapsed since the Hierarchy Manager was created."""
+        return time.monotonic() - self._monotonic_start
+
     def get_sub_chain(self, name: str) -> DomainChain | None:
         """Get a sub-chain by name."""
         return self.sub_chains.get(name)
@@ -96,6 +117,35 @@ class HierarchyManager:
     def get_all_sub_chains(self) -> dict[str, DomainChain]:
         """Get all sub-chains."""
         return self.sub_chains
+
+    def get_sub_chain_snapshot(self) -> tuple[tuple[str, DomainChain], ...]:
+        """
+        Get an immutable (name, sub_chain) snapshot for iteration.
+        
+        Safe to iterate while other threads create or remove sub-chains.
+        Reflects sub-chains added or removed through this class, not direct
+        edits of the sub_chains dict.
+        """
+        return self._sub_chains_snapshot
+
+    def _rebuild_snapshot(self) -> None:
+        """Rebuild the sub-chain snapshot; called with _sub_chains_lock held."""
+        self._sub_chains_snapshot = tuple(self.sub_chains.items())
+
+    def remove_sub_chain(self, name: str) -> bool:
+        """
+        Unregister a sub-chain from the hierarchy.
+        
+        Args:
+            name: Name of the sub-chain to remove
+            
+        Returns:
+            True if the sub-chain was registered and removed
+        """
+        with self._sub_chains_lock:
+            removed = self.sub_chains.pop(name, None)
+            self._rebuild_snapshot()
+        return removed is not None
         
     def get_main_chain(self) -> MainChain:
         """Get the main chain instance."""
@@ -170,8 +220,11 @@ class HierarchyManager:
         if not chain:
             return False
         
-        # Simplified simulation:
-        return True
+        with self._main_chain_lock:
+            submitted = chain.submit_proof_to_main(self.main_chain)
+            if submitted:
+                self.system_stats["total_proofs"] += 1
+        return submitted
 
     def get_system_overview(self) -> dict[str, Any]:
         """
@@ -184,21 +237,24 @@ class HierarchyManager:
         total_blocks = len(self.main_chain.chain)
         
         domain_distribution: dict[str, int] = {}
-        operation_types: dict[str, int] = {}
+        entity_sketch = HyperLogLog()
 
-        for name, chain in self.sub_chains.items():
-            stats = chain.get_domain_statistics()
-            total_tx += stats.get("total_operations", 0) + stats.get("total_events", 0)
-            total_blocks += stats.get("total_blocks", 0)
+        for name, chain in self._sub_chains_snapshot:
+            # Running totals kept by the sub-chain, so no block is walked here
+            chain_blocks, chain_events = chain.get_block_totals()
+            total_tx += chain_events
+            total_blocks += chain_blocks
+            entity_sketch.merge(chain.get_entity_sketch())
             
             d_type = chain.domain_type
             domain_distribution[d_type] = domain_distribution.get(d_type, 0) + 1
             
         return {
-            "uptime": time.time() - self.system_started_at,
+            "uptime": self.get_uptime(),
             "total_chains": len(self.sub_chains) + 1,  # +1 for MainChain
             "total_transactions_system_wide": total_tx,
             "total_blocks_system_wide": total_blocks,
+            "unique_entities_system_wide": entity_sketch.count(),  # Estimate
             "domain_types": domain_distribution,
             "main_chain_height": len(self.main_chain.chain)
         } 
@@ -216,17 +272,48 @@ class HierarchyManager:
         self.proof_submission_interval = int(interval)
         
         # Update all existing Sub-Chains
-        for sub_chain in self.sub_chains.values():
+        for _, sub_chain in self._sub_chains_snapshot:
             sub_chain.proof_submission_interval = interval
 
     def submit_all_proofs(self) -> dict[str, bool]:
         """
-        Submit proofs for all sub-chains to the main chain.
+        Finalize every sub-chain and submit all proofs to the main chain.
+        
+        Sub-chains are finalized concurrently, then their proofs are
+        recorded on the Main Chain in a single batch.
+        
+        Returns:
+            Mapping of sub-chain name to whether its proof was accepted
         """
-        results = {}
-        for name in self.sub_chains:
-            results[name] = self.submit_proof_to_main_chain(name)
-        return results
+        sub_chains = self._sub_chains_snapshot
+        if not sub_chains:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(MAX_PROOF_WORKERS, len(sub_chains))) as executor:
+            futures = {
+                name: executor.submit(self._finalize_and_prepare, sub_chain)
+                for name, sub_chain in sub_chains
+            }
+        prepared = {name: proof for name, future in futures.items() if (proof := future.result())}
+
+        with self._main_chain_lock:
+            accepted = self.main_chain.record_proofs_batch([
+                (name, block.hash, metadata) for name, (block, metadata) in prepared.items()
+            ])
+            self.system_stats["total_proofs"] += len(accepted)
+
+        sub_chains = dict(sub_chains)
+        for name in accepted:
+            sub_chains[name].mark_proof_submitted(self.main_chain, prepared[name][0])
+
+        accepted_names = set(accepted)
+        return {name: name in accepted_names for name in futures}
+
+    @staticmethod
+    def _finalize_and_prepare(sub_chain: DomainChain) -> tuple[Any, dict[str, Any]] | None:
+        """Finalize a sub-chain's ordered blocks, then build its proof."""
+        sub_chain.finalize_sub_chain_block()
+        return sub_chain.prepare_proof()
 
     def finalize_main_chain_block(self) -> Any | None:
         """
@@ -264,7 +351,7 @@ class HierarchyManager:
             })
         
         # Update system stats
-        self.system_stats["system_uptime"] = time.time() - self.system_started_at
+        self.system_stats["system_uptime"] = self.get_uptime()
         
         return maintenance_results
     
@@ -283,16 +370,18 @@ class HierarchyManager:
             "overall_consistent": True
         }
         
-        # Validate each Sub-Chain
-        for sub_chain_name, sub_chain in self.sub_chains.items():
+        # Validate each Sub-Chain and check its proof in one pass. Every call
+        # re-validates each chain in full: validity is not cached, because a
+        # result keyed on the chain tip would miss in-place edits of earlier
+        # blocks, and the per-block hashing is GIL-bound, so threads would not
+        # overlap it
+        for sub_chain_name, sub_chain in self._sub_chains_snapshot:
             is_valid = sub_chain.is_chain_valid()
             validation_results["sub_chain_validation"][sub_chain_name] = is_valid
             
             if not is_valid:
                 validation_results["overall_consistent"] = False
-        
-        # Check proof consistency
-        for sub_chain_name, sub_chain in self.sub_chains.items():
+            
             if len(sub_chain.chain) > 1:  # Has blocks beyond genesis
                 latest_block = sub_chain.get_latest_block()
                 proof_exists = self.main_chain.verify_proof(
@@ -502,9 +591,11 @@ class HierarchyManager:
 
     def add_sub_chain(self, chain_name, sub_chain):
         """Add a sub-chain to the hierarchy."""
-        if chain_name in self.sub_chains:
-            raise ValueError(f"Sub-chain {chain_name} already exists")
-        self.sub_chains[chain_name] = sub_chain
+        with self._sub_chains_lock:
+            if chain_name in self.sub_chains:
+                raise ValueError(f"Sub-chain {chain_name} already exists")
+            self.sub_chains[chain_name] = sub_chain
+            self._rebuild_snapshot()
         sub_chain.connect_to_main_chain(self.main_chain)
 
     def __str__(self) -> str:
@@ -516,4 +607,4 @@ class HierarchyManager:
         return (f"HierarchyManager(main_chain={self.main_chain.name}, "
                 f"sub_chains={list(self.sub_chains.keys())}, "
                 f"auto_proof={self.auto_proof_submission}, "
-                f"uptime={time.time() - self.system_started_at:.2f}s)")
+                f"uptime={self.get_uptime():.2f}s)")
@@ -12,7 +12,7 @@ from typing import Any
 from hierachain.core.blockchain import Blockchain
 from hierachain.core.consensus.proof_of_authority import ProofOfAuthority
 from hierachain.core.consensus.proof_of_federation import ProofOfFederation
-from hierachain.core.utils import sanitize_metadata_for_main_chain, validate_proof_metadata
+from hierachain.core.utils import MerkleTree, sanitize_metadata_for_main_chain, validate_proof_metadata
 from hierachain.core.block import Block
 from hierachain.config.settings import settings
 
@@ -47,6 +47,9 @@ class MainChain(Blockchain):
         self.registered_sub_chains: set[str] = set()
         self.sub_chain_metadata: dict[str, dict[str, Any]] = {}
         self.proof_count: int = 0
+        # Proof hashes per Sub-Chain; built lazily from the chain, then kept
+        # up to date as proofs are added
+        self._proof_index: dict[str, set[str]] | None = None
 
         # Register Main Chain as the primary authority/validator
         if hasattr(self.consensus, 'add_authority'):
@@ -118,6 +121,36 @@ class MainChain(Blockchain):
         self.add_event(registration_event)
         return True
     
+    def add_event(self, event: dict[str, Any]) -> None:
+        """
+        Add an event to the pending events list, indexing proof submissions.
+        
+        Args:
+            event: Event dictionary with required metadata
+        """
+        super().add_event(event)
+        self._index_proof(event)
+    
+    def _index_proof(self, event: dict[str, Any]) -> None:
+        """Record a proof submission event in the proof index, if it is built."""
+        if self._proof_index is None or event.get("event") != "proof_submission":
+            return
+        details = event.get("details", {})
+        self._proof_index.setdefault(details.get("sub_chain_name"), set()).add(details.get("proof_hash"))
+    
+    def _get_proof_index(self) -> dict[str, set[str]]:
+        """Get the proof index, building it from all blocks and pending events if needed."""
+        if self._proof_index is None:
+            self._proof_index = {}
+            for block in self.chain:
+                # Use to_event_list() if available to handle Arrow Tables
+                events = block.to_event_list() if hasattr(block, 'to_event_list') else block.events
+                for event in events:
+                    self._index_proof(event)
+            for event in self.pending_events:
+                self._index_proof(event)
+        return self._proof_index
+    
     def add_proof(self, sub_chain_name: str, proof_hash: str, metadata: dict[str, Any]) -> bool:
         """
         Add a proof from a Sub-Chain to the Main Chain.
@@ -142,35 +175,71 @@ class MainChain(Blockchain):
         if not validate_proof_metadata(metadata):
             return False
         
+        # Add the event to Main Chain
+        self.add_event(self._proof_event(sub_chain_name, proof_hash, metadata, time.time()))
+        self.proof_count += 1
+        
+        return True
+    
+    def record_proofs_batch(self, proofs: list[tuple[str, str, dict[str, Any]]]) -> list[str]:
+        """
+        Add proofs from several Sub-Chains in one step.
+        
+        Every accepted proof becomes a regular proof submission event, so
+        verification and per-sub-chain queries are unchanged. The events share
+        one timestamp and carry the Merkle root over all accepted proof hashes,
+        and are appended together so they are finalized into the same block.
+        
+        Args:
+            proofs: (sub_chain_name, proof_hash, metadata) tuples
+            
+        Returns:
+            Names of the Sub-Chains whose proofs were accepted
+        """
+        accepted = [
+            (sub_chain_name, proof_hash, metadata)
+            for sub_chain_name, proof_hash, metadata in proofs
+            if sub_chain_name in self.registered_sub_chains and validate_proof_metadata(metadata)
+        ]
+        if not accepted:
+            return []
+        
+        now = time.time()
+        batch_root = MerkleTree(leaves=[proof_hash for _, proof_hash, _ in accepted]).root
+        events = []
+        for sub_chain_name, proof_hash, metadata in accepted:
+            event = self._proof_event(sub_chain_name, proof_hash, metadata, now)
+            event["details"]["batch_root"] = batch_root
+            event["details"]["batch_size"] = len(accepted)
+            events.append(event)
+            self._index_proof(event)
+            self.proof_count += 1
+        
+        self.pending_events.extend(events)
+        return [sub_chain_name for sub_chain_name, _, _ in accepted]
+    
+    def _proof_event(self, sub_chain_name: str, proof_hash: str, metadata: dict[str, Any],
+                     submitted_at: float) -> dict[str, Any]:
+        """Build the proof submission event for the next proof number."""
         # Sanitize metadata to ensure only summary data
         sanitized_metadata = sanitize_metadata_for_main_chain(metadata)
         
         # Create proof submission event (following guidelines pattern)
-        event = {
+        return {
             "type": "sub_chain_proof",
             "sub_chain": sub_chain_name,
             "proof_hash": proof_hash,
-            "metadata": sanitized_metadata  # Summary data only
-        }
-        
-        # Add required fields for proper event structure
-        event.update({
+            "metadata": sanitized_metadata,  # Summary data only
             "entity_id": sub_chain_name,
             "event": "proof_submission",
-            "timestamp": time.time(),
+            "timestamp": submitted_at,
             "details": {
                 "sub_chain_name": sub_chain_name,
                 "proof_hash": proof_hash,
                 "proof_id": f"PROOF-{self.proof_count + 1}",
-                "submitted_at": time.time()
+                "submitted_at": submitted_at
             }
-        })
-        
-        # Add the event to Main Chain
-        self.add_event(event)
-        self.proof_count += 1
-        
-        return True
+        }
     
     def verify_proof(self, proof_hash: str, sub_chain_name: str) -> bool:
         """
@@ -183,24 +252,7 @@ class MainChain(Blockchain):
         Returns:
             True if proof exists and is valid, False otherwise
         """
-        # Search for proof in all blocks
-        for block in self.chain:
-            # Use to_event_list() if available to handle Arrow Tables
-            events = block.to_event_list() if hasattr(block, 'to_event_list') else block.events
-            for event in events:
-                if (event.get("event") == "proof_submission" and
-                    event.get("details", {}).get("proof_hash") == proof_hash and
-                    event.get("details", {}).get("sub_chain_name") == sub_chain_name):
-                    return True
-        
-        # Search in pending events as well
-        for event in self.pending_events:
-            if (event.get("event") == "proof_submission" and
-                event.get("details", {}).get("proof_hash") == proof_hash and
-                event.get("details", {}).get("sub_chain_name") == sub_chain_name):
-                return True
-        
-        return False
+        return proof_hash in self._get_proof_index().get(sub_chain_name, ())
     
     def get_proofs_by_sub_chain(self, sub_chain_name: str) -> list[dict[str, Any]]:
         """
@@ -274,6 +326,8 @@ class MainChain(Blockchain):
         if self.add_block(finalized_block):
             return finalized_block
         
+        # The rejected block's proofs are gone; rebuild the index on next use
+        self._proof_index = None
         return None
 
     def get_main_chain_stats(self) -> dict[str, Any]:
@@ -305,25 +359,16 @@ class MainChain(Blockchain):
         Returns:
             Information about the finalized block, or None if no pending events
         """
-        if not self.pending_events:
+        finalized_block = self.finalize_block()
+        if finalized_block is None:
             return None
         
-        # Create block with pending events
-        new_block = self.create_block()
-        
-        # Finalize block using PoA consensus
-        finalized_block = self.consensus.finalize_block(new_block, "main_chain")
-        
-        # Add finalized block to chain
-        if self.add_block(finalized_block):
-            return {
-                "block_index": finalized_block.index,
-                "block_hash": finalized_block.hash,
-                "events_count": len(finalized_block.events),
-                "finalized_at": time.time()
-            }
-        
-        return None
+        return {
+            "block_index": finalized_block.index,
+            "block_hash": finalized_block.hash,
+            "events_count": len(finalized_block.events),
+            "finalized_at": time.time()
+        }
     
     def validate_sub_chain_proof_format(self, proof_data: dict[str, Any]) -> bool:
         """
@@ -358,17 +403,18 @@ class MainChain(Blockchain):
         Returns:
             Comprehensive integrity report
         """
+        is_valid = self.is_chain_valid()
         report = {
             "main_chain": {
                 "name": self.name,
                 "blocks": len(self.chain),
-                "valid": self.is_chain_valid(),
+                "valid": is_valid,
                 "latest_hash": self.get_latest_block().hash
             },
             "sub_chains": {},
             "total_proofs": self.proof_count,
             "registered_sub_chains": len(self.registered_sub_chains),
-            "system_integrity": "healthy" if self.is_chain_valid() else "compromised"
+            "system_integrity": "healthy" if is_valid else "compromised"
         }
         
         # Add Sub-Chain summaries
@@ -16,7 +16,7 @@ from hierachain.core.blockchain import Blockchain
 from hierachain.core.consensus.proof_of_authority import ProofOfAuthority
 from hierachain.core.consensus.proof_of_federation import ProofOfFederation
 from hierachain.config.settings import settings
-from hierachain.core.utils import sanitize_metadata_for_main_chain, create_event
+from hierachain.core.utils import BloomFilter, HyperLogLog, sanitize_metadata_for_main_chain, create_event
 from hierachain.consensus.ordering_service import OrderingService, OrderingNode, OrderingStatus
 
 logger = logging.getLogger(__name__)
@@ -59,6 +59,21 @@ class SubChain(Blockchain):
         self.last_proof_submission: float = 0.0
         self.completed_operations: int = 0
         
+        # Event statistics traversal, keyed by (block count, latest hash)
+        self._stats_cache: tuple[tuple[int, str], dict[str, Any]] | None = None
+        
+        # Entity IDs seen in chain blocks: a filter to skip scans for absent
+        # entities and a sketch for distinct counts across chains
+        self._entity_bloom = BloomFilter()
+        self._entity_sketch = HyperLogLog()
+        for block in self.chain:
+            entity_ids = self._block_entity_ids(block)
+            self._index_entities(entity_ids)
+            self._count_entities(entity_ids)
+        
+        # Running total of events in chain blocks
+        self._event_total: int = sum(len(block.events) for block in self.chain)
+        
         # Register Sub-Chain as authority for its own operations
         if hasattr(self.consensus, 'add_authority'):
             self.consensus.add_authority(name, {
@@ -79,6 +94,70 @@ class SubChain(Blockchain):
         self.consumer_thread = threading.Thread(target=self._block_consumer_loop, daemon=True)
         self.consumer_thread.start()
 
+    def add_block(self, block) -> bool:
+        """
+        Add a block to the Sub-Chain after validation.
+        
+        The block's entities enter the entity filter first, so a concurrent
+        lookup never misses a block that is already in the chain; they are
+        counted in the distinct-entity sketch only once the block is accepted.
+        
+        Args:
+            block: Block to add to the chain
+            
+        Returns:
+            True if block was added successfully, False otherwise
+        """
+        entity_ids = self._block_entity_ids(block)
+        self._index_entities(entity_ids)
+        if not super().add_block(block):
+            return False
+        self._count_entities(entity_ids)
+        self._event_total += len(block.events)
+        return True
+
+    def get_block_totals(self) -> tuple[int, int]:
+        """
+        Get the number of blocks and of events in those blocks.
+        
+        Returns:
+            (block_count, event_count) tuple, maintained without walking the chain
+        """
+        return len(self.chain), self._event_total
+
+    @staticmethod
+    def _block_entity_ids(block) -> set[str]:
+        """Distinct non-null entity IDs of a block's events."""
+        entity_ids = set(block.events.column("entity_id").to_pylist())
+        entity_ids.discard(None)
+        return entity_ids
+
+    def _index_entities(self, entity_ids: set[str]) -> None:
+        """Record entity IDs in the entity filter."""
+        for entity_id in entity_ids:
+            self._entity_bloom.add(entity_id)
+
+    def _count_entities(self, entity_ids: set[str]) -> None:
+        """Record entity IDs in the distinct-entity sketch."""
+        for entity_id in entity_ids:
+            self._entity_sketch.add(entity_id)
+
+    def get_entity_sketch(self) -> HyperLogLog:
+        """Get the HyperLogLog sketch of entity IDs in this Sub-Chain's blocks."""
+        return self._entity_sketch
+
+    def may_contain_entity(self, entity_id: str) -> bool:
+        """
+        Check whether any block in this Sub-Chain may hold events for an entity.
+        
+        Args:
+            entity_id: Entity identifier to check
+            
+        Returns:
+            False if the entity is definitely absent, True if it may be present
+        """
+        return str(entity_id) in self._entity_bloom
+
     def is_valid_new_block(self, block) -> bool:
         """
         Validate a new block including consensus rules.
@@ -163,26 +242,30 @@ class SubChain(Blockchain):
 
         return f"tx-{hash(str(event))}"
     
-    def connect_to_main_chain(self, main_chain: Any) -> bool:
+    def connect_to_main_chain(self, main_chain: Any, metadata: dict[str, Any] | None = None) -> bool:
         """
         Connect this Sub-Chain to a Main Chain.
         
         Args:
             main_chain: Main Chain instance to connect to
+            metadata: Optional extra summary metadata for the registration
             
         Returns:
             True if connection was successful, False otherwise
         """
         try:
             # Register with Main Chain
-            metadata = {
+            registration = {
                 "domain_type": self.domain_type,
                 "sub_chain_name": self.name,
                 "connected_at": time.time(),
                 "capabilities": ["domain_operations", "proof_submission"]
             }
+            if metadata:
+                # Built-in fields take precedence over caller metadata
+                registration = {**metadata, **registration}
             
-            if main_chain.register_sub_chain(self.name, metadata):
+            if main_chain.register_sub_chain(self.name, registration):
                 self.main_chain_connection = main_chain
                 
                 # Create connection event
@@ -305,14 +388,41 @@ class SubChain(Blockchain):
         Returns:
             True if proof was submitted successfully, False otherwise
         """
+        proof = self.prepare_proof(metadata_filter)
+        if proof is None:
+            return False
+        latest_block, metadata = proof
+        
+        # Submit proof to Main Chain
+        success = main_chain.add_proof(
+            sub_chain_name=self.name,
+            proof_hash=latest_block.hash,
+            metadata=metadata
+        )
+        logger.debug(f"MainChain.add_proof returned: {success}")
+        
+        if success:
+            self.mark_proof_submitted(main_chain, latest_block)
+        
+        return success
+    
+    def prepare_proof(self, metadata_filter: Callable | None = None) -> tuple[Any, dict[str, Any]] | None:
+        """
+        Select the block to prove and build its summary metadata.
         
+        Args:
+            metadata_filter: Optional function to generate custom metadata
+            
+        Returns:
+            (latest_block, metadata) tuple, or None if there is nothing to prove
+        """
         # Get latest block for proof
         latest_block = self.get_latest_block()
-        logger.warning(f"DEBUG: SubChain {self.name} submitting proof. Chain length: {len(self.chain)}. Latest block index: {latest_block.index}")
+        logger.debug(f"SubChain {self.name} preparing proof. Chain length: {len(self.chain)}. Latest block index: {latest_block.index}")
 
         if not self.chain or len(self.chain) <= 1:  # Only genesis block
             logger.debug("SubChain has only genesis block. Aborting proof submission.")
-            return False
+            return None
         
         # Generate summary metadata (not detailed domain data)
         if metadata_filter:
@@ -320,33 +430,33 @@ class SubChain(Blockchain):
         else:
             metadata = self._generate_default_proof_metadata()
         
-        # Submit proof to Main Chain
-        success = main_chain.add_proof(
-            sub_chain_name=self.name,
-            proof_hash=latest_block.hash,
-            metadata=metadata
-        )
-        logger.debug(f"MainChain.add_proof returned: {success}")
+        return latest_block, metadata
+    
+    def mark_proof_submitted(self, main_chain: Any, block: Any) -> None:
+        """
+        Record on this Sub-Chain that a proof of block was accepted by the Main Chain.
         
-        if success:
-            self.last_proof_submission = time.time()
-            
-            # Create proof submission event in Sub-Chain
-            proof_event = {
-                "entity_id": self.name,
-                "event": "proof_submitted",
-                "timestamp": time.time(),
-                "details": {
-                    "main_chain_name": getattr(main_chain, 'name', str(main_chain)),
-                    "proof_hash": latest_block.hash,
-                    "block_index": latest_block.index,
-                    "submitted_at": time.time()
-                }
+        Args:
+            main_chain: Main Chain that accepted the proof
+            block: The proven block
+        """
+        now = time.time()
+        self.last_proof_submission = now
+        
+        # Create proof submission event in Sub-Chain
+        proof_event = {
+            "entity_id": self.name,
+            "event": "proof_submitted",
+            "timestamp": now,
+            "details": {
+                "main_chain_name": getattr(main_chain, 'name', str(main_chain)),
+                "proof_hash": block.hash,
+                "block_index": block.index,
+                "submitted_at": now
             }
-            
-            self.add_event(proof_event)
+        }
         
-        return success
+        self.add_event(proof_event)
     
     def _generate_default_proof_metadata(self) -> dict[str, Any]:
         """
@@ -443,35 +553,50 @@ class SubChain(Blockchain):
             Dictionary containing domain statistics
         """
         base_stats = self.get_chain_stats()
-        
-        # Count entities and operations
-        all_events = []
-        for block in self.chain:
-            # Use to_event_list() if available to handle Arrow Tables
-            events = block.to_event_list() if hasattr(block, 'to_event_list') else block.events
-            all_events.extend(events)
-        
-        unique_entities = set()
-        operation_types = {}
-        
-        for event in all_events:
-            if event.get("entity_id") is not None:
-                unique_entities.add(event["entity_id"])
-            
-            event_type = event.get("event", "unknown")
-            operation_types[event_type] = operation_types.get(event_type, 0) + 1
+        event_stats = self._get_event_statistics()
         
         return {
             **base_stats,
             "domain_type": self.domain_type,
-            "unique_entities": len(unique_entities),
+            "unique_entities": event_stats["unique_entities"],
             "completed_operations": self.completed_operations,
-            "operation_types": operation_types,
+            "operation_types": dict(event_stats["operation_types"]),
             "main_chain_connected": self.main_chain_connection is not None,
             "last_proof_submission": self.last_proof_submission,
             "proof_submission_interval": self.proof_submission_interval
         }
     
+    def _chain_cache_key(self) -> tuple[int, str]:
+        """Key identifying the current chain contents for cached traversals."""
+        return len(self.chain), self.chain[-1].hash if self.chain else ""
+
+    def _get_event_statistics(self) -> dict[str, Any]:
+        """
+        Count entities and event types over all blocks.
+        
+        The result is reused until a block is added to the chain.
+        """
+        key = self._chain_cache_key()
+        if self._stats_cache and self._stats_cache[0] == key:
+            return self._stats_cache[1]
+        
+        unique_entities = set()
+        operation_types = {}
+        
+        for block in self.chain:
+            # Use to_event_list() if available to handle Arrow Tables
+            events = block.to_event_list() if hasattr(block, 'to_event_list') else block.events
+            for event in events:
+                if event.get("entity_id") is not None:
+                    unique_entities.add(event["entity_id"])
+                
+                event_type = event.get("event", "unknown")
+                operation_types[event_type] = operation_types.get(event_type, 0) + 1
+        
+        stats = {"unique_entities": len(unique_entities), "operation_types": operation_types}
+        self._stats_cache = (key, stats)
+        return stats
+
     def finalize_sub_chain_block(self) -> dict[str, Any] | None:
         """
         Pull ordered blocks from Ordering Service and finalize them.
@@ -509,7 +634,8 @@ class SubChain(Blockchain):
                 
         if not new_blocks:
             return None
-            
+        
+        self._stats_cache = None
         last_block = new_blocks[-1]
         
         return {
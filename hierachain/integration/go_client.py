@@ -8,13 +8,23 @@ via gRPC for high-performance transaction processing.
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
+import random
+import threading
 import time
-from dataclasses import dataclass, field
-from typing import Any, AsyncIterator, Iterator
+from dataclasses import MISSING, dataclass, field, fields
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, Sequence
 
 import grpc
 import grpc.aio
+from google.protobuf.internal import api_implementation
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 # Import generated protobuf stubs
 from hierachain.integration.proto import hierachain_pb2 as pb
@@ -23,6 +33,34 @@ from hierachain.integration.proto import hierachain_pb2_grpc as pb_grpc
 
 logger = logging.getLogger(__name__)
 
+# protobuf>=4.21 encodes messages in C (upb). The pure-Python backend, picked
+# via PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=python or a missing wheel, is an
+# order of magnitude slower on submit_batch/stream_transactions.
+if api_implementation.Type() == "python":
+    logger.warning(
+        "protobuf is using the pure-Python backend; Go Engine batch "
+        "encoding will be slow. Unset PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION "
+        "or install a protobuf wheel with the upb backend."
+    )
+
+# Channel options tuned for large batches and long-lived streams. The gRPC
+# defaults cap messages at 4 MB and drop idle connections silently.
+DEFAULT_CHANNEL_OPTIONS: dict[str, Any] = {
+    "grpc.max_send_message_length": 64 << 20,
+    "grpc.max_receive_message_length": 64 << 20,
+    "grpc.keepalive_time_ms": 20000,
+    "grpc.keepalive_timeout_ms": 10000,
+    "grpc.http2.max_pings_without_data": 0,
+    "grpc.use_local_subchannel_pool": 1,
+}
+
+# Status codes worth retrying: the engine is down, shedding load, or slow
+RETRYABLE_STATUS_CODES = frozenset({
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+})
+
 
 class GoEngineError(Exception):
     """Exception raised for Go Engine errors."""
@@ -42,111 +80,275 @@ class GoEngineUnavailableError(GoEngineError):
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Transaction:
     """Transaction to submit to Go Engine."""
     
     tx_id: str
     entity_id: str
     event_type: str
-    arrow_payload: bytes = b""
+    # Any buffer-protocol object (bytes, bytearray, memoryview, pyarrow.Buffer)
+    arrow_payload: bytes | bytearray | memoryview = b""
     signature: str = ""
     timestamp: float = field(default_factory=time.time)
     details: dict[str, str] = field(default_factory=dict)
     
     def to_proto(self) -> pb.Transaction:
         """Convert to protobuf message."""
+        payload = self.arrow_payload
         return pb.Transaction(
             tx_id=self.tx_id,
             entity_id=self.entity_id,
             event_type=self.event_type,
-            arrow_payload=self.arrow_payload,
+            # Protobuf bytes fields only take bytes; copy other buffers once here
+            arrow_payload=payload if type(payload) is bytes else bytes(payload),
             signature=self.signature,
             timestamp=self.timestamp,
             details=self.details,
         )
 
 
-@dataclass
-class BatchResult:
-    """Result of batch transaction processing."""
+# Transaction fields in declaration order, all of which map 1:1 onto pb.Transaction
+_TRANSACTION_FIELDS = tuple(f.name for f in fields(Transaction))
+
+# Transaction fields without a default; proto3 would silently send "" for them
+_REQUIRED_TRANSACTION_FIELDS = tuple(
+    f.name for f in fields(Transaction) if f.default is MISSING and f.default_factory is MISSING
+)
+
+
+class _ProtoView:
+    """
+    Read-only view over a protobuf reply.
     
-    success: bool
-    message: str
-    processed_tx_ids: list[str]
-    processing_time_ms: int
-    errors: list[dict[str, str]]
+    Subclasses name their public fields in _FIELDS; equality and repr are
+    defined over those field values, as for the dataclasses these views
+    replaced. Views are unhashable like those dataclasses.
+    """
+    
+    __slots__ = ("_proto",)
+    _FIELDS: tuple[str, ...] = ()
+    
+    def __init__(self, proto):
+        self._proto = proto
+    
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self._FIELDS)
+    
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._FIELDS)
+        return f"{type(self).__name__}({values})"
+
+
+class BatchResult(_ProtoView):
+    """
+    Result of batch transaction processing.
+    
+    Thin read-only view over the pb.BatchResult reply: scalar fields are
+    read from the message on access, and processed_tx_ids and errors are
+    converted to lists once, on first access.
+    """
+    
+    __slots__ = ("_processed_tx_ids", "_errors")
+    _FIELDS = ("success", "message", "processed_tx_ids", "processing_time_ms", "errors")
+    
+    def __init__(self, proto: pb.BatchResult):
+        super().__init__(proto)
+        self._processed_tx_ids: list[str] | None = None
+        self._errors: list[dict[str, str]] | None = None
     
     @classmethod
     def from_proto(cls, result: pb.BatchResult) -> BatchResult:
         """Create from protobuf message."""
-        return cls(
-            success=result.success,
-            message=result.message,
-            processed_tx_ids=list(result.processed_tx_ids),
-            processing_time_ms=result.processing_time_ms,
-            errors=[
+        return cls(result)
+    
+    @classmethod
+    def merge(cls, results: Sequence[BatchResult]) -> BatchResult:
+        """Combine the results of sub-batches into one result for the whole batch."""
+        merged = pb.BatchResult(
+            success=all(r.success for r in results),
+            message="; ".join(dict.fromkeys(r.message for r in results if r.message)),
+            processing_time_ms=sum(r.processing_time_ms for r in results),
+        )
+        for r in results:
+            merged.processed_tx_ids.extend(r._proto.processed_tx_ids)
+            merged.errors.extend(r._proto.errors)
+        return cls(merged)
+    
+    @property
+    def success(self) -> bool:
+        return self._proto.success
+    
+    @property
+    def message(self) -> str:
+        return self._proto.message
+    
+    @property
+    def processed_tx_ids(self) -> list[str]:
+        if self._processed_tx_ids is None:
+            self._processed_tx_ids = list(self._proto.processed_tx_ids)
+        return self._processed_tx_ids
+    
+    @property
+    def processing_time_ms(self) -> int:
+        return self._proto.processing_time_ms
+    
+    @property
+    def errors(self) -> list[dict[str, str]]:
+        """Per-transaction errors, decoded on first access."""
+        if self._errors is None:
+            self._errors = [
                 {
                     "tx_id": e.tx_id,
                     "error_message": e.error_message,
                     "error_code": e.error_code,
                 }
-                for e in result.errors
-            ],
-        )
+                for e in self._proto.errors
+            ]
+        return self._errors
+
 
+# Shared request for parameter-less RPCs; never mutated
+_EMPTY = pb.Empty()
 
-@dataclass
-class TxStatus:
-    """Status of a transaction."""
+# pb.TxStatus enum value -> status name
+_TX_STATUS_NAMES = {
+    pb.TxStatus.PENDING: "PENDING",
+    pb.TxStatus.CONFIRMED: "CONFIRMED",
+    pb.TxStatus.FAILED: "FAILED",
+}
+
+
+class TxStatus(_ProtoView):
+    """Status of a transaction, as a read-only view over pb.TxStatus."""
     
-    tx_id: str
-    status: str  # "PENDING", "CONFIRMED", "FAILED"
-    timestamp: int
-    block_hash: str = ""
+    __slots__ = ()
+    _FIELDS = ("tx_id", "status", "timestamp", "block_hash")
     
     @classmethod
     def from_proto(cls, status: pb.TxStatus) -> TxStatus:
         """Create from protobuf message."""
-        status_map = {
-            pb.TxStatus.PENDING: "PENDING",
-            pb.TxStatus.CONFIRMED: "CONFIRMED",
-            pb.TxStatus.FAILED: "FAILED",
-        }
-        return cls(
-            tx_id=status.tx_id,
-            status=status_map.get(status.status, "UNKNOWN"),
-            timestamp=status.timestamp,
-            block_hash=status.block_hash,
-        )
+        return cls(status)
+    
+    @property
+    def tx_id(self) -> str:
+        return self._proto.tx_id
+    
+    @property
+    def status(self) -> str:
+        """One of PENDING, CONFIRMED, FAILED or UNKNOWN."""
+        return _TX_STATUS_NAMES.get(self._proto.status, "UNKNOWN")
+    
+    @property
+    def timestamp(self) -> int:
+        return self._proto.timestamp
+    
+    @property
+    def block_hash(self) -> str:
+        return self._proto.block_hash
 
 
-@dataclass
-class HealthResponse:
-    """Health status of the Go Engine."""
+class HealthResponse(_ProtoView):
+    """Health status of the Go Engine, as a read-only view over pb.HealthResponse."""
     
-    healthy: bool
-    version: str
-    uptime_seconds: int
-    stats: dict[str, Any]
+    __slots__ = ()
+    _FIELDS = ("healthy", "version", "uptime_seconds", "stats")
     
     @classmethod
     def from_proto(cls, resp: pb.HealthResponse) -> HealthResponse:
         """Create from protobuf message."""
-        stats = {}
-        if resp.stats:
-            stats = {
-                "transactions_processed": resp.stats.transactions_processed,
-                "blocks_created": resp.stats.blocks_created,
-                "pending_transactions": resp.stats.pending_transactions,
-                "avg_processing_time_ms": resp.stats.avg_processing_time_ms,
-            }
-        return cls(
-            healthy=resp.healthy,
-            version=resp.version,
-            uptime_seconds=resp.uptime_seconds,
-            stats=stats,
-        )
+        return cls(resp)
+    
+    @property
+    def healthy(self) -> bool:
+        return self._proto.healthy
+    
+    @property
+    def version(self) -> str:
+        return self._proto.version
+    
+    @property
+    def uptime_seconds(self) -> int:
+        return self._proto.uptime_seconds
+    
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Engine statistics, decoded on access."""
+        stats = self._proto.stats
+        if not stats:
+            return {}
+        return {
+            "transactions_processed": stats.transactions_processed,
+            "blocks_created": stats.blocks_created,
+            "pending_transactions": stats.pending_transactions,
+            "avg_processing_time_ms": stats.avg_processing_time_ms,
+        }
+
+
+def _build_transaction_batch(transactions: list[Transaction] | list[dict]) -> pb.TransactionBatch:
+    """Build a TransactionBatch message from Transaction objects or dicts."""
+    # Build the repeated field in place instead of materializing
+    # intermediate Transaction objects and a list of messages
+    batch = pb.TransactionBatch()
+    add = batch.transactions.add
+    
+    # Homogeneous Transaction batches (the common case) skip the per-item
+    # type dispatch and keyword dict built by the generic loop below
+    if transactions and all(type(tx) is Transaction for tx in transactions):
+        for tx in transactions:
+            payload = tx.arrow_payload
+            add(
+                tx_id=tx.tx_id,
+                entity_id=tx.entity_id,
+                event_type=tx.event_type,
+                arrow_payload=payload if type(payload) is bytes else bytes(payload),
+                signature=tx.signature,
+                timestamp=tx.timestamp,
+                details=tx.details,
+            )
+        return batch
+    
+    field_names = _TRANSACTION_FIELDS
+    now = time.time
+    for tx in transactions:
+        if isinstance(tx, dict):
+            missing = [name for name in _REQUIRED_TRANSACTION_FIELDS if name not in tx]
+            if missing:
+                raise TypeError(f"Transaction dict missing required fields: {', '.join(missing)}")
+            msg_fields = tx if "timestamp" in tx else {**tx, "timestamp": now()}
+        else:
+            msg_fields = {name: getattr(tx, name) for name in field_names}
+        payload = msg_fields.get("arrow_payload")
+        if payload is not None and type(payload) is not bytes:
+            msg_fields = {**msg_fields, "arrow_payload": bytes(payload)}
+        add(**msg_fields)
+    return batch
+
+
+def _tx_proto(tx: Transaction | dict) -> pb.Transaction:
+    """Convert a Transaction or transaction dict to its protobuf message."""
+    if type(tx) is Transaction:
+        return tx.to_proto()
+    return Transaction(**tx).to_proto()
+
+
+def _sync_tx_protos(transactions: Iterable[Transaction | dict]) -> Iterator[pb.Transaction]:
+    """Yield protobuf messages for a sync iterable of transactions."""
+    for tx in transactions:
+        yield _tx_proto(tx)
+
+
+async def _async_tx_protos(transactions: AsyncIterator[Transaction | dict]) -> AsyncIterator[pb.Transaction]:
+    """Yield protobuf messages for an async iterable of transactions."""
+    async for tx in transactions:
+        yield _tx_proto(tx)
 
 
 class GoEngineClient:
@@ -170,6 +372,12 @@ class GoEngineClient:
         timeout_seconds: float = 30.0,
         max_retries: int = 3,
         retry_delay_seconds: float = 1.0,
+        channel_options: dict[str, Any] | None = None,
+        max_retry_delay_seconds: float = 30.0,
+        retry_jitter: float = 0.5,
+        compression: grpc.Compression = grpc.Compression.Gzip,
+        channels: int = 1,
+        max_batch_size: int | None = 1024,
     ):
         """
         Initialize Go Engine client.
@@ -178,16 +386,46 @@ class GoEngineClient:
             address: Server address in format "host:port".
             timeout_seconds: Default timeout for RPC calls.
             max_retries: Maximum number of retry attempts.
-            retry_delay_seconds: Delay between retry attempts.
+            retry_delay_seconds: Delay before the first retry; doubled on
+                each further attempt.
+            channel_options: gRPC channel arguments overriding
+                DEFAULT_CHANNEL_OPTIONS (e.g. HTTP/2 window sizes per link).
+            max_retry_delay_seconds: Upper bound on the backoff delay.
+            retry_jitter: Relative random spread applied to each delay
+                (0.5 means +/-50%), so clients do not retry in lock-step.
+            compression: Channel compression for outgoing messages. Use
+                grpc.Compression.NoCompression when payloads are already
+                compressed (e.g. compressed Arrow IPC) or the link is local.
+            channels: Number of channels (each its own HTTP/2 connection)
+                that SubmitBatch and StreamTransactions calls are spread
+                over round-robin, to use more of the engine's cores.
+            max_batch_size: Largest number of transactions sent in one
+                SubmitBatch call; bigger batches are split. None disables
+                splitting.
         """
         self.address = address
         self.timeout = timeout_seconds
         self.max_retries = max_retries
         self.retry_delay = retry_delay_seconds
+        self.max_retry_delay = max_retry_delay_seconds
+        self.retry_jitter = retry_jitter
+        self.compression = compression
+        self.channels = max(1, channels)
+        self.max_batch_size = max_batch_size
+        self.channel_options = {**DEFAULT_CHANNEL_OPTIONS, **(channel_options or {})}
         
-        self._channel: grpc.aio.Channel | None = None
+        self._channels: list[grpc.aio.Channel] = []
         self._stub: pb_grpc.HieraChainEngineStub | None = None
         self._connected = False
+        # Serializes connect/close so concurrent reconnects (e.g. sub-batches
+        # of a split submit) do not close each other's fresh channels
+        self._connect_lock = asyncio.Lock()
+        
+        # Stub methods bound once per connect (see _bind_stubs). The
+        # _next_* attributes return the next channel's method round-robin.
+        self._health = None
+        self._next_submit_batch = None
+        self._next_stream = None
     
     async def __aenter__(self) -> GoEngineClient:
         """Async context manager entry."""
@@ -203,29 +441,62 @@ class GoEngineClient:
         if self._connected:
             return
         
-        try:
-            self._channel = grpc.aio.insecure_channel(self.address)
-            self._stub = pb_grpc.HieraChainEngineStub(self._channel)
+        async with self._connect_lock:
+            # Another caller may have connected while we waited for the lock
+            if self._connected:
+                return
             
-            # Verify connection with health check
-            await self.health_check()
-            self._connected = True
-            logger.info(f"Connected to Go Engine at {self.address}")
+            # Drop channels left over from a connection marked unavailable
+            await self._close_channels()
             
-        except grpc.aio.AioRpcError as e:
-            self._connected = False
-            raise GoEngineConnectionError(
-                f"Failed to connect to Go Engine at {self.address}: {e.details()}"
-            ) from e
+            try:
+                options = list(self.channel_options.items())
+                self._channels = [
+                    grpc.aio.insecure_channel(self.address, options=options, compression=self.compression)
+                    for _ in range(self.channels)
+                ]
+                self._bind_stubs([pb_grpc.HieraChainEngineStub(channel) for channel in self._channels])
+                
+                # Verify connection with health check
+                await self.health_check()
+                self._connected = True
+                logger.info(f"Connected to Go Engine at {self.address}")
+                
+            except grpc.aio.AioRpcError as e:
+                self._connected = False
+                raise GoEngineConnectionError(
+                    f"Failed to connect to Go Engine at {self.address}: {e.details()}"
+                ) from e
     
     async def close(self) -> None:
         """Close connection to Go Engine."""
-        if self._channel:
-            await self._channel.close()
-            self._channel = None
-            self._stub = None
-            self._connected = False
-            logger.info("Disconnected from Go Engine")
+        async with self._connect_lock:
+            if self._channels:
+                await self._close_channels()
+                self._connected = False
+                logger.info("Disconnected from Go Engine")
+    
+    async def _close_channels(self) -> None:
+        """Close all open channels and unbind their stubs."""
+        channels, self._channels = self._channels, []
+        self._bind_stubs([])
+        for channel in channels:
+            await channel.close()
+    
+    def _bind_stubs(self, stubs: list[pb_grpc.HieraChainEngineStub]) -> None:
+        """Set the stubs and cache their multi-callables for the hot paths."""
+        self._stub = stubs[0] if stubs else None
+        self._health = stubs[0].HealthCheck if stubs else None
+        if stubs:
+            self._next_submit_batch = itertools.cycle([stub.SubmitBatch for stub in stubs]).__next__
+            self._next_stream = itertools.cycle([stub.StreamTransactions for stub in stubs]).__next__
+        else:
+            self._next_submit_batch = None
+            self._next_stream = None
+    
+    def _pick_submit_batch(self):
+        """Next channel's SubmitBatch method, bound to the current connection."""
+        return self._next_submit_batch()
     
     @property
     def is_connected(self) -> bool:
@@ -237,27 +508,44 @@ class GoEngineClient:
         if not self._connected:
             await self.connect()
     
-    async def _call_with_retry(self, method, *args, **kwargs):
-        """Execute RPC call with retry logic."""
+    def _backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff delay with jitter for a zero-based attempt number."""
+        delay = min(self.retry_delay * (2 ** attempt), self.max_retry_delay)
+        return delay * random.uniform(1 - self.retry_jitter, 1 + self.retry_jitter)
+    
+    async def _call_with_retry(self, pick_rpc: Callable[[], Callable], request):
+        """
+        Execute a unary RPC with retry logic.
+        
+        Args:
+            pick_rpc: Returns the stub method to call (e.g.
+                self._pick_submit_batch). It is called per attempt, after
+                reconnecting, so a retry uses the new channels.
+            request: Request message.
+        """
         last_error = None
         
         for attempt in range(self.max_retries):
             try:
                 await self._ensure_connected()
-                return await method(*args, **kwargs)
+                return await pick_rpc()(request, timeout=self.timeout)
                 
             except grpc.aio.AioRpcError as e:
                 last_error = e
                 
-                if e.code() == grpc.StatusCode.UNAVAILABLE:
-                    self._connected = False
+                code = e.code()
+                if code in RETRYABLE_STATUS_CODES:
+                    if code == grpc.StatusCode.UNAVAILABLE:
+                        self._connected = False
                     if attempt < self.max_retries - 1:
+                        delay = self._backoff_delay(attempt)
                         logger.warning(
-                            f"Go Engine unavailable, retrying in {self.retry_delay}s "
+                            f"Go Engine call failed ({code.name}), retrying in {delay:.2f}s "
                             f"(attempt {attempt + 1}/{self.max_retries})"
                         )
-                        await asyncio.sleep(self.retry_delay)
+                        await asyncio.sleep(delay)
                         continue
+                    break
                 
                 # Non-retryable error
                 raise GoEngineError(f"RPC error: {e.details()}", str(e.code())) from e
@@ -276,12 +564,12 @@ class GoEngineClient:
         Raises:
             GoEngineError: If health check fails.
         """
-        if not self._stub:
+        if not self._health:
             raise GoEngineError("Not connected to Go Engine")
         
         try:
-            response = await self._stub.HealthCheck(
-                pb.Empty(),
+            response = await self._health(
+                _EMPTY,
                 timeout=self.timeout,
             )
             return HealthResponse.from_proto(response)
@@ -302,27 +590,59 @@ class GoEngineClient:
         Returns:
             BatchResult with processing results.
             
+        Batches larger than max_batch_size are split into sub-batches that
+        are submitted concurrently and merged into one result. If one
+        sub-batch fails, the others may already have been processed.
+        
         Raises:
             GoEngineError: If batch submission fails.
         """
-        # Convert dicts to Transaction objects
-        tx_list = []
-        for tx in transactions:
-            if isinstance(tx, dict):
-                tx = Transaction(**tx)
-            tx_list.append(tx.to_proto())
+        size = self.max_batch_size
+        if size and len(transactions) > size:
+            results = await self.submit_batches(
+                [transactions[i:i + size] for i in range(0, len(transactions), size)]
+            )
+            return BatchResult.merge(results)
         
-        batch = pb.TransactionBatch(transactions=tx_list)
+        batch = _build_transaction_batch(transactions)
+        response = await self._call_with_retry(self._pick_submit_batch, batch)
+        return BatchResult.from_proto(response)
+    
+    async def submit_batches(
+        self,
+        batches: Iterable[list[Transaction] | list[dict]],
+        max_in_flight: int = 16,
+    ) -> list[BatchResult]:
+        """
+        Submit several batches concurrently over the same channel.
         
-        async def _submit():
-            return await self._stub.SubmitBatch(batch, timeout=self.timeout)
+        Up to max_in_flight SubmitBatch calls are outstanding at once; HTTP/2
+        multiplexes them on one connection. Batches may be processed by the
+        Go Engine in any order, so they must not depend on each other.
         
-        response = await self._call_with_retry(_submit)
-        return BatchResult.from_proto(response)
+        Args:
+            batches: Batches of Transaction objects or dicts.
+            max_in_flight: Maximum number of concurrent SubmitBatch calls.
+            
+        Returns:
+            BatchResult per batch, in the order the batches were given.
+            
+        Raises:
+            GoEngineError: If any batch submission fails.
+        """
+        # Connect up front so concurrent calls do not each open a channel
+        await self._ensure_connected()
+        semaphore = asyncio.Semaphore(max_in_flight)
+        
+        async def _submit_one(batch):
+            async with semaphore:
+                return await self.submit_batch(batch)
+        
+        return list(await asyncio.gather(*(_submit_one(batch) for batch in batches)))
     
     async def stream_transactions(
         self,
-        transactions: AsyncIterator[Transaction] | Iterator[Transaction],
+        transactions: AsyncIterator[Transaction | dict] | Iterable[Transaction | dict],
     ) -> AsyncIterator[TxStatus]:
         """
         Stream transactions for real-time processing.
@@ -338,15 +658,18 @@ class GoEngineClient:
         """
         await self._ensure_connected()
         
-        if not self._stub:
+        if not self._next_stream:
             raise GoEngineError("Not connected to Go Engine")
         
-        async def tx_generator():
-            async for tx in transactions if hasattr(transactions, '__anext__') else iter(transactions):
-                yield tx.to_proto() if isinstance(tx, Transaction) else Transaction(**tx).to_proto()
+        # grpc.aio accepts both sync and async request iterators, so pick
+        # the matching generator once instead of branching per item
+        if hasattr(transactions, '__aiter__'):
+            requests = _async_tx_protos(transactions)
+        else:
+            requests = _sync_tx_protos(transactions)
         
         try:
-            stream = self._stub.StreamTransactions(tx_generator())
+            stream = self._next_stream()(requests)
             async for status in stream:
                 yield TxStatus.from_proto(status)
                 
@@ -358,6 +681,10 @@ class GoEngineClientSync:
     """
     Synchronous wrapper for GoEngineClient.
     
+    All calls run on one event loop hosted by a background thread, so
+    several caller threads can submit concurrently over the same
+    multiplexed HTTP/2 channel.
+    
     Example:
         with GoEngineClientSync("localhost:50051") as client:
             health = client.health_check()
@@ -367,34 +694,72 @@ class GoEngineClientSync:
     def __init__(self, *args, **kwargs):
         """Initialize sync client wrapper."""
         self._async_client = GoEngineClient(*args, **kwargs)
-        self._loop = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._loop_lock = threading.Lock()
     
     def __enter__(self) -> GoEngineClientSync:
         """Context manager entry."""
-        self._loop = asyncio.new_event_loop()
-        self._loop.run_until_complete(self._async_client.connect())
+        self.connect()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Context manager exit."""
-        if self._loop:
-            self._loop.run_until_complete(self._async_client.close())
-            self._loop.close()
+        self.close()
+    
+    def _start_loop(self) -> None:
+        """Start the background event loop thread if it is not running."""
+        with self._loop_lock:
+            if self._loop is not None:
+                return
+            # The loop is private to this wrapper, so uvloop can be used
+            # without touching the application's event loop policy
+            self._loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._loop.run_forever,
+                name="GoEngineClientSync",
+                daemon=True,
+            )
+            self._thread.start()
+    
+    def _stop_loop(self) -> None:
+        """Stop the background event loop and wait for its thread to exit."""
+        with self._loop_lock:
+            loop, thread = self._loop, self._thread
             self._loop = None
+            self._thread = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
     
     def _run(self, coro):
-        """Run coroutine in event loop."""
-        if self._loop is None:
-            self._loop = asyncio.new_event_loop()
-        return self._loop.run_until_complete(coro)
+        """Run coroutine on the background loop and wait for its result."""
+        loop = self._loop
+        if loop is None:
+            coro.close()
+            raise GoEngineError("Client is closed; call connect() first")
+        # RPCs carry their own deadlines, so no outer timeout is applied
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
     
     def connect(self) -> None:
         """Connect to Go Engine."""
-        self._run(self._async_client.connect())
+        self._start_loop()
+        try:
+            self._run(self._async_client.connect())
+        except Exception:
+            self._stop_loop()
+            raise
     
     def close(self) -> None:
-        """Close connection."""
-        self._run(self._async_client.close())
+        """Close connection and stop the background loop."""
+        if self._loop is None:
+            return
+        try:
+            self._run(self._async_client.close())
+        finally:
+            self._stop_loop()
     
     def health_check(self) -> HealthResponse:
         """Check health of Go Engine."""
@@ -403,3 +768,7 @@ class GoEngineClientSync:
     def submit_batch(self, transactions: list) -> BatchResult:
         """Submit a batch of transactions."""
         return self._run(self._async_client.submit_batch(transactions))
+    
+    def submit_batches(self, batches: Iterable[list], max_in_flight: int = 16) -> list[BatchResult]:
+        """Submit several batches concurrently."""
+        return self._run(self._async_client.submit_batches(batches, max_in_flight))
@@ -11,7 +11,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Transaction:
     """Transaction to submit to Engine."""
     
@@ -24,7 +24,7 @@ class Transaction:
     details: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BatchResult:
     """Result of batch transaction processing."""
     
@@ -35,7 +35,7 @@ class BatchResult:
     errors: list[dict[str, str]]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TxStatus:
     """Status of a transaction."""
     
@@ -45,7 +45,7 @@ class TxStatus:
     block_hash: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HealthResponse:
     """Health status of the Engine."""
     
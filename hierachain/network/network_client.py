@@ -9,13 +9,17 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
+import threading
+from array import array
 from dataclasses import dataclass, field
-from typing import Any
+from itertools import compress
+from typing import Any, Iterable
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PeerInfo:
     """Information about a network peer."""
     peer_id: str
@@ -24,7 +28,7 @@ class PeerInfo:
     is_healthy: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkStatus:
     """Current status of the network."""
     node_id: str
@@ -35,7 +39,7 @@ class NetworkStatus:
     p2p_enabled: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkClientConfig:
     """Configuration for the network client."""
     enabled: bool = False
@@ -54,6 +58,9 @@ class NetworkClient:
     - Query network status
     - Get peer information
     - Register/unregister peers
+
+    Peer IDs are passed through sys.intern on registration, so every index
+    and column holds the same string object; new ingress paths must do the same.
     """
 
     def __init__(self, config: NetworkClientConfig | None = None) -> None:
@@ -66,7 +73,19 @@ class NetworkClient:
         self.config = config or NetworkClientConfig()
         self._zmq_node: Any = None
         self._is_running: bool = False
-        self._peers: dict[str, PeerInfo] = {}
+
+        # Peers are stored column-wise; row i of each column describes one
+        # peer and _peer_index maps peer_id -> i. PeerInfo objects are only
+        # built when peers are returned to callers.
+        self._peer_index: dict[str, int] = {}
+        self._peer_ids: list[str] = []
+        self._peer_addrs: list[str] = []
+        self._peer_last_seen = array('d')
+        self._peer_health = bytearray()
+
+        # Maintained on every peer mutation so status reads are O(1)
+        self._healthy_count = 0
+        self._address = f"tcp://{self.config.host}:{self.config.port}"
 
     async def start(self) -> bool:
         """
@@ -95,10 +114,11 @@ class NetworkClient:
             await self._zmq_node.start()
 
             # Register seed nodes
-            for seed in self.config.seed_nodes:
-                if ":" in seed:
-                    peer_id = seed.split(":")[0]
-                    self._zmq_node.register_peer(peer_id, seed)
+            self._zmq_node.register_peers([
+                (seed.split(":", 1)[0], seed)
+                for seed in self.config.seed_nodes
+                if ":" in seed
+            ])
 
             self._is_running = True
             logger.info(
@@ -108,7 +128,7 @@ class NetworkClient:
             return True
 
         except Exception as e:
-            logger.error(f"Failed to start NetworkClient: {e}")
+            logger.error("Failed to start NetworkClient: %s", e)
             self._is_running = False
             return False
 
@@ -126,7 +146,7 @@ class NetworkClient:
             logger.info("NetworkClient stopped")
 
         except Exception as e:
-            logger.error(f"Error stopping NetworkClient: {e}")
+            logger.error("Error stopping NetworkClient: %s", e)
 
     def get_network_status(self) -> NetworkStatus:
         """
@@ -137,10 +157,10 @@ class NetworkClient:
         """
         return NetworkStatus(
             node_id=self.config.node_id,
-            address=f"tcp://{self.config.host}:{self.config.port}",
+            address=self._address,
             is_running=self._is_running,
-            peer_count=len(self._peers),
-            healthy_peers=sum(1 for p in self._peers.values() if p.is_healthy),
+            peer_count=len(self._peer_ids),
+            healthy_peers=self._healthy_count,
             p2p_enabled=self.config.enabled,
         )
 
@@ -151,7 +171,7 @@ class NetworkClient:
         Returns:
             List of PeerInfo objects.
         """
-        return list(self._peers.values())
+        return [self._peer_info(i) for i in range(len(self._peer_ids))]
 
     def get_healthy_peers(self) -> list[PeerInfo]:
         """
@@ -160,7 +180,17 @@ class NetworkClient:
         Returns:
             List of healthy PeerInfo objects.
         """
-        return [p for p in self._peers.values() if p.is_healthy]
+        healthy = compress(range(len(self._peer_ids)), self._peer_health)
+        return [self._peer_info(i) for i in healthy]
+
+    def _peer_info(self, i: int) -> PeerInfo:
+        """Build the PeerInfo for row i of the peer columns."""
+        return PeerInfo(
+            peer_id=self._peer_ids[i],
+            address=self._peer_addrs[i],
+            last_seen=self._peer_last_seen[i],
+            is_healthy=bool(self._peer_health[i]),
+        )
 
     def register_peer(
         self,
@@ -174,16 +204,29 @@ class NetworkClient:
             peer_id: Unique identifier for the peer.
             address: Network address (e.g., "tcp://127.0.0.1:5556").
         """
-        self._peers[peer_id] = PeerInfo(
-            peer_id=peer_id,
-            address=address,
-            is_healthy=True,
-        )
+        peer_id = sys.intern(peer_id)
+        self._add_peer(peer_id, address)
 
         if self._zmq_node and self._is_running:
             self._zmq_node.register_peer(peer_id, address)
 
-        logger.debug(f"Registered peer: {peer_id} at {address}")
+        logger.debug("Registered peer: %s at %s", peer_id, address)
+
+    def register_peers(self, peers: Iterable[tuple[str, str]]) -> None:
+        """
+        Register several peers at once.
+
+        Args:
+            peers: (peer_id, address) pairs.
+        """
+        peers = [(sys.intern(peer_id), address) for peer_id, address in peers]
+        for peer_id, address in peers:
+            self._add_peer(peer_id, address)
+
+        if self._zmq_node and self._is_running:
+            self._zmq_node.register_peers(peers)
+
+        logger.debug("Registered %d peers", len(peers))
 
     def unregister_peer(self, peer_id: str) -> None:
         """
@@ -192,9 +235,74 @@ class NetworkClient:
         Args:
             peer_id: ID of the peer to remove.
         """
-        if peer_id in self._peers:
-            del self._peers[peer_id]
-            logger.debug(f"Unregistered peer: {peer_id}")
+        i = self._peer_index.pop(sys.intern(peer_id), None)
+        if i is None:
+            return
+        self._healthy_count -= self._peer_health[i]
+
+        # Move the last row into the freed slot so removal stays O(1)
+        last = len(self._peer_ids) - 1
+        if i != last:
+            moved_id = self._peer_ids[last]
+            self._peer_ids[i] = moved_id
+            self._peer_addrs[i] = self._peer_addrs[last]
+            self._peer_last_seen[i] = self._peer_last_seen[last]
+            self._peer_health[i] = self._peer_health[last]
+            self._peer_index[moved_id] = i
+        self._peer_ids.pop()
+        self._peer_addrs.pop()
+        self._peer_last_seen.pop()
+        self._peer_health.pop()
+        logger.debug("Unregistered peer: %s", peer_id)
+
+    async def send_to_peer(self, peer_id: str, message: dict[str, Any]) -> bool:
+        """
+        Send a message to a registered peer.
+
+        A failed send marks the peer unhealthy and a successful one marks it
+        healthy again, so get_healthy_peers reflects reachability.
+
+        Args:
+            peer_id: ID of the destination peer.
+            message: Message content.
+
+        Returns:
+            True if the message was sent, False otherwise.
+        """
+        if not (self._zmq_node and self._is_running):
+            logger.debug("Cannot send to %s: network is not running", peer_id)
+            return False
+
+        peer_id = sys.intern(peer_id)
+        sent = await self._zmq_node.send_direct(peer_id, message)
+        self._set_peer_health(peer_id, sent)
+        if not sent:
+            logger.warning("Send to peer %s failed; marked unhealthy", peer_id)
+        return sent
+
+    def _add_peer(self, peer_id: str, address: str) -> None:
+        """Add a peer row, or reset an existing peer's address and health."""
+        i = self._peer_index.get(peer_id)
+        if i is None:
+            self._peer_index[peer_id] = len(self._peer_ids)
+            self._peer_ids.append(peer_id)
+            self._peer_addrs.append(address)
+            self._peer_last_seen.append(0.0)
+            self._peer_health.append(1)
+            self._healthy_count += 1
+        else:
+            self._peer_addrs[i] = address
+            self._peer_last_seen[i] = 0.0
+            self._set_peer_health(peer_id, True)
+
+    def _set_peer_health(self, peer_id: str, healthy: bool) -> None:
+        """Mark a known peer healthy or unhealthy, keeping the healthy count in step."""
+        i = self._peer_index.get(peer_id)
+        if i is None:
+            return
+        flag = 1 if healthy else 0
+        self._healthy_count += flag - self._peer_health[i]
+        self._peer_health[i] = flag
 
     @property
     def is_running(self) -> bool:
@@ -204,13 +312,17 @@ class NetworkClient:
     @property
     def peer_count(self) -> int:
         """Get the number of known peers."""
-        return len(self._peers)
+        return len(self._peer_ids)
 
 
 class NetworkClientSync:
     """
     Synchronous wrapper for NetworkClient.
 
+    Async operations run on one event loop hosted by a background thread
+    for the lifetime of the context, so the ZMQ node's tasks keep running
+    between calls.
+
     Example:
         with NetworkClientSync(config) as client:
             status = client.get_network_status()
@@ -221,11 +333,22 @@ class NetworkClientSync:
         """Initialize sync network client wrapper."""
         self._async_client = NetworkClient(config)
         self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
 
     def __enter__(self) -> NetworkClientSync:
         """Context manager entry."""
         self._loop = asyncio.new_event_loop()
-        self._loop.run_until_complete(self._async_client.start())
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="NetworkClientSync",
+            daemon=True,
+        )
+        self._thread.start()
+        try:
+            self._call(self._async_client.start())
+        except BaseException:
+            self._stop_loop()
+            raise
         return self
 
     def __exit__(
@@ -236,9 +359,23 @@ class NetworkClientSync:
     ) -> None:
         """Context manager exit."""
         if self._loop:
-            self._loop.run_until_complete(self._async_client.stop())
-            self._loop.close()
-            self._loop = None
+            try:
+                self._call(self._async_client.stop())
+            finally:
+                self._stop_loop()
+
+    def _call(self, coro: Any) -> Any:
+        """Run a coroutine on the background loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def _stop_loop(self) -> None:
+        """Stop the background loop and wait for its thread to exit."""
+        loop, thread = self._loop, self._thread
+        self._loop = None
+        self._thread = None
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
 
     def get_network_status(self) -> NetworkStatus:
         """Get current network status."""
@@ -256,6 +393,14 @@ class NetworkClientSync:
         """Register a new peer."""
         self._async_client.register_peer(peer_id, address)
 
+    def register_peers(self, peers: Iterable[tuple[str, str]]) -> None:
+        """Register several peers at once."""
+        self._async_client.register_peers(peers)
+
     def unregister_peer(self, peer_id: str) -> None:
         """Unregister a peer."""
         self._async_client.unregister_peer(peer_id)
+
+    def send_to_peer(self, peer_id: str, message: dict[str, Any]) -> bool:
+        """Send a message to a registered peer."""
+        return self._call(self._async_client.send_to_peer(peer_id, message))
@@ -11,14 +11,26 @@ and the network transport (ZeroMQ). It handles:
 import zmq
 import zmq.auth
 import logging
+import time
+import uuid
 from typing import Any
 
-from hierachain.network.zmq_transport import ZmqNode
+from hierachain.network.zmq_transport import ZmqNode, encode_message
 from hierachain.security.msp import HierarchicalMSP
 from hierachain.security.identity import IdentityManager
 
 logger = logging.getLogger(__name__)
 
+# Handshake messages are encoded once without their closing brace; each
+# send appends the fresh timestamp and nonce the transport's replay check
+# requires (see _seal_message)
+_HANDSHAKE_ACK_OK_PREFIX = encode_message({"type": "HANDSHAKE_ACK", "status": "OK"})[:-1]
+
+
+def _seal_message(prefix: bytes) -> bytes:
+    """Complete a pre-encoded message prefix with a fresh timestamp and nonce."""
+    return prefix + f',"timestamp":{time.time()!r},"nonce":"{uuid.uuid4().hex}"}}'.encode('utf-8')
+
 class SecureConnectionManager:
     """
     Manages secure connections between nodes using:
@@ -33,6 +45,8 @@ class SecureConnectionManager:
         
         # 1. Generate Ephemeral keys for Transport Encryption
         self.transport_public, self.transport_secret = zmq.curve_keypair()
+        # Curve keys are Z85 text, so the str form is decoded once here
+        self._transport_public_str = self.transport_public.decode('ascii')
         
         # 2. Initialize Transport Layer with these keys
         self.transport = ZmqNode(
@@ -43,68 +57,95 @@ class SecureConnectionManager:
         )
         
         # 3. Validation Cache
-        self.authenticated_peers: dict[str, bool] = {}
+        self.authenticated_peers: set[str] = set()
+        # Encoded transport keys by their Z85 text, reused across reconnects
+        self._peer_key_bytes: dict[str, bytes] = {}
+        
+        # 4. Handshake request fields that never change for this node
+        self._handshake_init_prefix = encode_message({
+            "type": "HANDSHAKE_INIT",
+            "sender_msp_id": self.msp.organization_id,
+            "certificate_id": self.node_id,
+            "return_address": self.transport.address,
+            "transport_public_key": self._transport_public_str
+        })[:-1]
+        
+        # 5. Control message handlers by message type; anything else is data
+        self._handlers = {
+            "HANDSHAKE_INIT": self._handle_handshake_request,
+            "HANDSHAKE_ACK": self._handle_handshake_ack,
+        }
 
     async def start(self):
         """Start the secure transport."""
         # Set handler to intercept messages for handshake
-        self.transport.set_handler(self._handle_message)
+        self.transport.set_batch_handler(self._handle_batch)
         await self.transport.start()
-        logger.info(f"Secure Node {self.node_id} started. Transport Key: {self.transport_public.decode('utf-8')[:8]}...")
+        logger.info("Secure Node %s started. Transport Key: %s...", self.node_id, self._transport_public_str[:8])
 
-    async def connect_to_peer(self, peer_id: str, address: str, peer_transport_key: str):
+    async def connect_to_peer(self, peer_id: str, address: str, peer_transport_key: str | bytes):
         """
         Connect to a peer securely.
         
         Args:
             peer_id: The remote node's ID.
             address: Network address (tcp://ip:port).
-            peer_transport_key: The remote node's Curve25519 public key.
+            peer_transport_key: The remote node's Curve25519 public key (Z85 str or bytes).
         """
         # Register peer with their Transport Public Key (for CurveZMQ)
         # This establishes the ENCRYPTED channel.
         self.transport.register_peer(
             peer_id, 
             address, 
-            public_key=peer_transport_key.encode('utf-8') if peer_transport_key else None
+            public_key=self._peer_key(peer_transport_key) if peer_transport_key else None
         )
         
         # Trigger Application-Level Handshake (to verify Identity)
         await self._initiate_handshake(peer_id)
 
+    def _peer_key(self, key: str | bytes) -> bytes:
+        """Return the bytes form of a peer's transport key, encoding each Z85 str only once."""
+        if isinstance(key, bytes):
+            return key
+        
+        encoded = self._peer_key_bytes.get(key)
+        if encoded is None:
+            encoded = self._peer_key_bytes[key] = key.encode('utf-8')
+        return encoded
+
     async def _initiate_handshake(self, peer_id: str):
         """Send a handshake request to prove Identity (MSP)."""
-        logger.info(f"Initiating Handshake with {peer_id}...")
+        logger.info("Initiating Handshake with %s...", peer_id)
         
         # Create a challenge payload
-        handshake_msg = {
-            "type": "HANDSHAKE_INIT",
-            "sender_msp_id": self.msp.organization_id,
-            "certificate_id": self.node_id,
-            "timestamp": "now",
-            "return_address": self.transport.address,
-            "transport_public_key": self.transport_public.decode('utf-8')
-        }
+        handshake_msg = _seal_message(self._handshake_init_prefix)
         
         success = await self.transport.send_direct(peer_id, handshake_msg)
         if not success:
-            logger.error(f"Failed to send handshake to {peer_id}")
+            logger.error("Failed to send handshake to %s", peer_id)
+
+    async def _handle_batch(self, batch: list[tuple[dict[str, Any], str]]):
+        """Handle all messages received in one transport wakeup, in arrival order."""
+        handle = self._handle_message
+        for message, sender_id in batch:
+            try:
+                await handle(message, sender_id)
+            except Exception as e:
+                logger.error("Error handling message from %s: %s", sender_id, e)
 
     async def _handle_message(self, message: dict[str, Any], sender_id: str):
         """Intercept messages to handle Handshake vs Data."""
-        msg_type = message.get("type")
+        handler = self._handlers.get(message.get("type"))
         
-        if msg_type == "HANDSHAKE_INIT":
-            await self._handle_handshake_request(message, sender_id)
-        elif msg_type == "HANDSHAKE_ACK":
-            await self._handle_handshake_ack(message, sender_id)
+        if handler:
+            await handler(message, sender_id)
         else:
             # For data messages, check if handshake was completed
-            if self.authenticated_peers.get(sender_id):
+            if sender_id in self.authenticated_peers:
                 # Pass to upper layer (e.g. Consensus / Block Sync)
-                logger.info(f"Received Authenticated Message from {sender_id}: {message}")
+                logger.info("Received Authenticated Message from %s: %s", sender_id, message)
             else:
-                logger.warning(f"Dropped Unauthenticated Message from {sender_id}")
+                logger.warning("Dropped Unauthenticated Message from %s", sender_id)
 
     async def _handle_handshake_request(self, message: dict[str, Any], sender_id: str):
         """Processing incoming handshake: Verify MSP Certificate."""
@@ -113,32 +154,29 @@ class SecureConnectionManager:
             return_addr = message.get("return_address")
             transport_key = message.get("transport_public_key")
             if return_addr and transport_key:
-                logger.info(f"Dynamically registering peer {sender_id} from Handshake")
+                logger.info("Dynamically registering peer %s from Handshake", sender_id)
                 self.transport.register_peer(
                     sender_id, 
                     return_addr, 
-                    public_key=transport_key.encode('utf-8')
+                    public_key=self._peer_key(transport_key)
                 )
 
         # 2. Check if sender exists in MSP (Identity Check)
         is_valid_entity = True
         
         if is_valid_entity:
-            logger.info(f"Handshake Validated for {sender_id}. Sending ACK.")
-            self.authenticated_peers[sender_id] = True
+            logger.info("Handshake Validated for %s. Sending ACK.", sender_id)
+            self.authenticated_peers.add(sender_id)
             
             # Send ACK
-            await self.transport.send_direct(sender_id, {
-                "type": "HANDSHAKE_ACK",
-                "status": "OK"
-            })
+            await self.transport.send_direct(sender_id, _seal_message(_HANDSHAKE_ACK_OK_PREFIX))
         else:
-            logger.error(f"Handshake Rejected for {sender_id}")
+            logger.error("Handshake Rejected for %s", sender_id)
 
     async def _handle_handshake_ack(self, message: dict[str, Any], sender_id: str):
         """Handle Handshake Acknowledgement."""
         if message.get("status") == "OK":
-            logger.info(f"Secure Connection Established with {sender_id} ✅")
-            self.authenticated_peers[sender_id] = True
+            logger.info("Secure Connection Established with %s ✅", sender_id)
+            self.authenticated_peers.add(sender_id)
         else:
-            logger.error(f"Handshake Refused by {sender_id} ❌")
+            logger.error("Handshake Refused by %s ❌", sender_id)
@@ -12,12 +12,37 @@ import zmq
 import zmq.asyncio
 import json
 import asyncio
+import inspect
 import time
 import logging
-from typing import Any, Callable
+import sys
+from typing import Any, Callable, Iterable
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Most frames the receiver loop drains from the ROUTER socket per wakeup
+RECV_BATCH_SIZE = 64
+
+
+def encode_message(message: dict[str, Any]) -> bytes:
+    """Encode a message as UTF-8 JSON for the wire, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(message).encode('utf-8')
+
+
+def _decode_message(data: bytes) -> Any:
+    """Decode a UTF-8 JSON message straight from the received bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class NetworkError(Exception):
     """Base exception for network errors."""
     pass
@@ -30,6 +55,8 @@ class ZmqNode:
         node_id (str): Unique identifier for this node.
         port (int): The port to bind for listening (ROUTER).
         peers (Dict[str, str]): Mapping of peer_id -> address (e.g., "tcp://127.0.0.1:5001").
+            Peer IDs are interned with sys.intern, and received sender IDs of
+            registered peers resolve to the same interned strings.
     """
     
 
@@ -46,6 +73,7 @@ class ZmqNode:
         self.port = port
         self.address = f"tcp://{host}:{port}"
         self.peers: dict[str, dict[str, Any]] = {}  # peer_id -> {address, public_key}
+        self._peer_ids: dict[bytes, str] = {}  # encoded peer_id -> interned peer_id
         
         # CurveZMQ keys (Curve25519)
         self.server_secret = server_secret_key
@@ -54,6 +82,7 @@ class ZmqNode:
         self.ctx = zmq.asyncio.Context()
         self._stop_event = asyncio.Event()
         self._message_handler: Callable[[dict[str, Any], str], Any] | None = None
+        self._batch_handler: Callable[[list[tuple[dict[str, Any], str]]], Any] | None = None
 
         # Replay Protection
         self.replay_buffer: set[tuple[float, str]] = set() # (timestamp, nonce)
@@ -98,15 +127,44 @@ class ZmqNode:
 
     def register_peer(self, peer_id: str, address: str, public_key: bytes = None):
         """Register a known peer with optional public key."""
+        peer_id = sys.intern(peer_id)
+        self._peer_ids[peer_id.encode('utf-8')] = peer_id
         self.peers[peer_id] = {
             "address": address,
             "public_key": public_key
         }
 
+    def register_peers(self, peers: Iterable[tuple[str, str]]):
+        """Register several known peers (peer_id, address) without public keys."""
+        for peer_id, address in peers:
+            peer_id = sys.intern(peer_id)
+            self._peer_ids[peer_id.encode('utf-8')] = peer_id
+            self.peers[peer_id] = {"address": address, "public_key": None}
+
+    def _sender_id(self, sender_id_bytes: bytes) -> str:
+        """
+        Resolve a received sender identity to a peer ID.
+        
+        Registered peers map to their interned ID; unknown senders are
+        decoded but not interned, so arbitrary identities cannot grow the
+        interpreter's intern table.
+        """
+        peer_id = self._peer_ids.get(sender_id_bytes)
+        if peer_id is None:
+            peer_id = sender_id_bytes.decode('utf-8')
+        return peer_id
+
     def set_handler(self, handler: Callable[[dict[str, Any], str], Any]):
         """Set the callback function for processing received messages."""
         self._message_handler = handler
 
+    def set_batch_handler(self, handler: Callable[[list[tuple[dict[str, Any], str]]], Any]):
+        """
+        Set a callback that receives every message ready at one wakeup as a
+        list of (message, sender_id) pairs. Takes precedence over set_handler.
+        """
+        self._batch_handler = handler
+
     def _is_valid_replay(self, message_data: dict[str, Any]) -> bool:
         """
         Check if message is a replay.
@@ -145,13 +203,14 @@ class ZmqNode:
         
         return True
 
-    async def send_direct(self, target_peer_id: str, message: dict[str, Any]) -> bool:
+    async def send_direct(self, target_peer_id: str, message: dict[str, Any] | bytes) -> bool:
         """
         Send a message directly to a peer.
         
         Args:
             target_peer_id: Destination node ID.
-            message: Dictionary message content.
+            message: Dictionary message content, or a message already
+                encoded with encode_message().
         """
         if target_peer_id not in self.peers:
             logger.error(f"Unknown peer: {target_peer_id}")
@@ -159,8 +218,10 @@ class ZmqNode:
 
         try:
             socket = await self._get_or_create_dealer(target_peer_id)
-            encoded_msg = json.dumps(message).encode('utf-8')
-            await socket.send(encoded_msg)
+            encoded_msg = message if isinstance(message, bytes) else encode_message(message)
+            # bytes are immutable, so libzmq can send straight from the buffer;
+            # pyzmq still copies frames below zmq.COPY_THRESHOLD, where that is cheaper
+            await socket.send(encoded_msg, copy=False)
             return True
         except Exception as e:
             logger.error(f"Failed to send to {target_peer_id}: {e}")
@@ -199,34 +260,21 @@ class ZmqNode:
 
     async def _receiver_loop(self):
         """Loop to receive messages from ROUTER socket."""
+        router = self.router
         while not self._stop_event.is_set():
             try:
-                msg_parts = await self.router.recv_multipart()
+                # Wait for one frame, then drain whatever else is already
+                # queued so a burst is decoded and dispatched in one pass
+                frames = [await router.recv_multipart()]
+                while len(frames) < RECV_BATCH_SIZE:
+                    try:
+                        frames.append(await router.recv_multipart(flags=zmq.NOBLOCK))
+                    except zmq.Again:
+                        break
                 
-                if len(msg_parts) < 2:
-                    continue
-                    
-                sender_id_bytes = msg_parts[0]
-                message_bytes = msg_parts[-1] # Payload is the last part
-                
-                sender_id = sender_id_bytes.decode('utf-8')
-                message_str = message_bytes.decode('utf-8')
-                
-                try:
-                    message_data = json.loads(message_str)
-                    
-                    # Replay Check
-                    if not self._is_valid_replay(message_data):
-                        continue
-                        
-                    if self._message_handler:
-                        # Process message (could be async or sync)
-                        if asyncio.iscoroutinefunction(self._message_handler):
-                            await self._message_handler(message_data, sender_id)
-                        else:
-                            self._message_handler(message_data, sender_id)
-                except json.JSONDecodeError:
-                    logger.warning(f"Received invalid JSON from {sender_id}")
+                batch = self._decode_frames(frames)
+                if batch:
+                    await self._dispatch(batch)
                     
             except zmq.ZMQError as e:
                 if not self._stop_event.is_set():
@@ -235,3 +283,69 @@ class ZmqNode:
             except Exception as e:
                 logger.error(f"Unexpected error in receiver loop: {e}")
                 await asyncio.sleep(1)
+
+    def _decode_frames(self, frames: list[list[bytes]]) -> list[tuple[dict[str, Any], str]]:
+        """
+        Decode received multipart frames into (message, sender_id) pairs.
+        
+        Frames that are not JSON objects or fail the replay check are
+        dropped one by one, so a malformed frame never costs the rest.
+        """
+        batch = []
+        for msg_parts in frames:
+            if len(msg_parts) < 2:
+                continue
+            
+            sender_id_bytes = msg_parts[0]
+            message_bytes = msg_parts[-1] # Payload is the last part
+            
+            try:
+                sender_id = self._sender_id(sender_id_bytes)
+                message_data = _decode_message(message_bytes)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                logger.warning(f"Received invalid JSON from {sender_id_bytes!r}")
+                continue
+            
+            if not isinstance(message_data, dict):
+                logger.warning(f"Received non-object message from {sender_id}")
+                continue
+            
+            # Replay Check
+            try:
+                valid = self._is_valid_replay(message_data)
+            except Exception as e:
+                logger.warning(f"Received malformed message from {sender_id}: {e}")
+                continue
+            if valid:
+                batch.append((message_data, sender_id))
+        return batch
+
+    async def _dispatch(self, batch: list[tuple[dict[str, Any], str]]):
+        """
+        Hand received (message, sender_id) pairs to the registered handler.
+        
+        A handler error is logged per message so the rest of the batch is
+        still delivered.
+        """
+        if self._batch_handler:
+            try:
+                result = self._batch_handler(batch)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Error in batch handler: {e}")
+            return
+        
+        handler = self._message_handler
+        if handler is None:
+            return
+        # Process message (could be async or sync)
+        is_async = asyncio.iscoroutinefunction(handler)
+        for message_data, sender_id in batch:
+            try:
+                if is_async:
+                    await handler(message_data, sender_id)
+                else:
+                    handler(message_data, sender_id)
+            except Exception as e:
+                logger.error(f"Error handling message from {sender_id}: {e}")
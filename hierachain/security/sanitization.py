@@ -14,6 +14,12 @@ import html
 from typing import Any
 import logging
 
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,6 +44,70 @@ SCRIPT_PATTERNS = [
 LOG_INJECTION_CHARS = ["\n", "\r", "\x1b", "\x00"]
 
 
+
+def _compile_scanner(pattern: str):
+    """
+    Compile a pattern used to scan untrusted payload text.
+    
+    Uses RE2 (google-re2) when installed: it matches in linear time with an
+    automaton instead of backtracking, so large inputs scan faster and cannot
+    trigger catastrophic backtracking. Falls back to the stdlib re module.
+    """
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile(pattern)
+        except re2.error as e:
+            logger.debug(f"RE2 cannot compile {pattern!r}, using re: {e}")
+    return re.compile(pattern)
+
+
+# Template patterns precompiled once. They are applied one after another,
+# as an alternation would pick different matches where patterns overlap.
+_TEMPLATE_RES = tuple(_compile_scanner(p) for p in TEMPLATE_PATTERNS)
+
+# Single-pass character replacement tables for the log and filename contexts
+_LOG_TRANSLATE = str.maketrans(dict.fromkeys(LOG_INJECTION_CHARS, " "))
+_FILENAME_TRANSLATE = str.maketrans(dict.fromkeys('\\/:*?"<>|', "_"))
+
+# Characters any sanitization in a context can act on. Strings without one
+# come back unchanged, so they are returned before any escaping or regex
+# substitution (every template pattern needs '{' or '<').
+_HTML_META_RE = re.compile(r"[<>&'\"{]")
+_CONTEXT_META_RE = {
+    "general": _HTML_META_RE,
+    "html": _HTML_META_RE,
+    "log": re.compile(r"[\n\r\x1b\x00]"),
+    "filename": re.compile(r"[\\/:*?\"<>|.]"),
+}
+
+# Error message redaction: file paths become [FILE] / [PATH], applied in
+# order since each pass sees the previous pass's replacements
+_ERROR_PATH_SUBS = (
+    (re.compile(r"[A-Za-z]:\\[^\s]+"), "[PATH]"),
+    (re.compile(r"/[^\s]+\.py"), "[FILE]"),
+    (re.compile(r"/home/[^\s]+"), "[PATH]"),
+    (re.compile(r"/var/[^\s]+"), "[PATH]"),
+)
+_ERROR_LINE_RE = re.compile(r"line \d+")
+
+# Attack patterns reported by is_safe_input, one capture group per reason
+_DANGEROUS_INPUT_REASONS = (
+    "Script tag detected",
+    "JavaScript URI detected",
+    "Template expression detected",
+    "Template expression detected",
+    "Template expression detected",
+)
+_DANGEROUS_INPUT_RE = _compile_scanner(
+    r"(?i)(<script)|(javascript:)|(\{\{.*\}\})|(\$\{.*\})|(<%.*%>)"
+)
+
+
+def _escape_match(match: re.Match) -> str:
+    """HTML-escape a matched template expression."""
+    return html.escape(match.group(0))
+
+
 def sanitize_string(value: str, context: str = "general") -> str:
     """
     Sanitize a string value based on context.
@@ -52,6 +122,10 @@ def sanitize_string(value: str, context: str = "general") -> str:
     if not isinstance(value, str):
         return value
     
+    meta = _CONTEXT_META_RE.get(context)
+    if meta is None or not meta.search(value):
+        return value
+    
     result = value
     
     if context in ("general", "html"):
@@ -59,22 +133,80 @@ def sanitize_string(value: str, context: str = "general") -> str:
         result = html.escape(result)
         
         # Neutralize template expressions
-        for pattern in TEMPLATE_PATTERNS:
-            result = re.sub(pattern, lambda m: html.escape(m.group(0)), result)
+        for pattern in _TEMPLATE_RES:
+            result = pattern.sub(_escape_match, result)
     
     if context == "log":
         # Remove characters that could inject fake log entries
-        for char in LOG_INJECTION_CHARS:
-            result = result.replace(char, " ")
+        result = result.translate(_LOG_TRANSLATE)
     
     if context == "filename":
         # Remove path traversal and dangerous characters
-        result = re.sub(r"[\\/:*?\"<>|]", "_", result)
+        result = result.translate(_FILENAME_TRANSLATE)
         result = result.replace("..", "_")
     
     return result
 
 
+def _sanitize_tree(root: dict | list, context: str) -> dict | list:
+    """
+    Sanitize all strings (and string dict keys) in nested dicts and lists.
+    
+    Walks the structure with an explicit stack instead of recursion, so
+    deeply nested payloads cost no Python frames per level and cannot hit
+    the recursion limit. Each output container is created when its parent
+    is filled and populated when it is popped, which keeps key order.
+    
+    Raises:
+        ValueError: If a container contains itself, directly or nested
+    """
+    sanitize = sanitize_string
+    out = {} if isinstance(root, dict) else []
+    stack = [(root, out)]
+    pop = stack.pop
+    push = stack.append
+    # ids of the containers on the path from the root to the one being
+    # filled; an exit entry (src, None) removes src once its subtree is done
+    active = set()
+    
+    def enter(value, child):
+        if id(value) in active:
+            raise ValueError("Cannot sanitize self-referencing data")
+        push((value, child))
+        return child
+    
+    while stack:
+        src, dst = pop()
+        if dst is None:
+            active.discard(id(src))
+            continue
+        active.add(id(src))
+        push((src, None))
+        if isinstance(src, dict):
+            for key, value in src.items():
+                if isinstance(key, str):
+                    key = sanitize(key, context)
+                if isinstance(value, str):
+                    value = sanitize(value, context)
+                elif isinstance(value, dict):
+                    value = enter(value, {})
+                elif isinstance(value, list):
+                    value = enter(value, [])
+                dst[key] = value
+        else:
+            append = dst.append
+            for value in src:
+                if isinstance(value, str):
+                    value = sanitize(value, context)
+                elif isinstance(value, dict):
+                    value = enter(value, {})
+                elif isinstance(value, list):
+                    value = enter(value, [])
+                append(value)
+    
+    return out
+
+
 def sanitize_dict(data: dict[str, Any], context: str = "general") -> dict[str, Any]:
     """
     Recursively sanitize all string values in a dictionary.
@@ -86,21 +218,7 @@ def sanitize_dict(data: dict[str, Any], context: str = "general") -> dict[str, A
     Returns:
         Sanitized dictionary
     """
-    result = {}
-    for key, value in data.items():
-        # Sanitize key as well
-        safe_key = sanitize_string(str(key), context) if isinstance(key, str) else key
-        
-        if isinstance(value, str):
-            result[safe_key] = sanitize_string(value, context)
-        elif isinstance(value, dict):
-            result[safe_key] = sanitize_dict(value, context)
-        elif isinstance(value, list):
-            result[safe_key] = sanitize_list(value, context)
-        else:
-            result[safe_key] = value
-    
-    return result
+    return _sanitize_tree(data, context)
 
 
 def sanitize_list(data: list[Any], context: str = "general") -> list[Any]:
@@ -114,18 +232,7 @@ def sanitize_list(data: list[Any], context: str = "general") -> list[Any]:
     Returns:
         Sanitized list
     """
-    result = []
-    for item in data:
-        if isinstance(item, str):
-            result.append(sanitize_string(item, context))
-        elif isinstance(item, dict):
-            result.append(sanitize_dict(item, context))
-        elif isinstance(item, list):
-            result.append(sanitize_list(item, context))
-        else:
-            result.append(item)
-    
-    return result
+    return _sanitize_tree(data, context)
 
 
 def sanitize_for_output(data: Any, context: str = "general") -> Any:
@@ -162,14 +269,14 @@ def sanitize_error_message(error: Exception) -> str:
     """
     error_str = str(error)
     
-    # Remove file paths
-    error_str = re.sub(r'[A-Za-z]:\\[^\s]+', '[PATH]', error_str)
-    error_str = re.sub(r'/[^\s]+\.py', '[FILE]', error_str)
-    error_str = re.sub(r'/home/[^\s]+', '[PATH]', error_str)
-    error_str = re.sub(r'/var/[^\s]+', '[PATH]', error_str)
-    
-    # Remove line numbers from tracebacks
-    error_str = re.sub(r'line \d+', 'line [N]', error_str)
+    # Paths need a separator and line numbers need "line "; most messages have neither
+    if '/' in error_str or '\\' in error_str or 'line ' in error_str:
+        # Remove file paths
+        for pattern, replacement in _ERROR_PATH_SUBS:
+            error_str = pattern.sub(replacement, error_str)
+        
+        # Remove line numbers from tracebacks
+        error_str = _ERROR_LINE_RE.sub('line [N]', error_str)
     
     # Truncate long messages
     if len(error_str) > 200:
@@ -196,22 +303,36 @@ def is_safe_input(value: str, max_length: int = 10000) -> tuple[bool, str]:
         return False, f"Input exceeds maximum length of {max_length}"
     
     # Check for obvious attack patterns
-    dangerous_patterns = [
-        (r"<script", "Script tag detected"),
-        (r"javascript:", "JavaScript URI detected"),
-        (r"\{\{.*\}\}", "Template expression detected"),
-        (r"\$\{.*\}", "Template expression detected"),
-        (r"<%.*%>", "Template expression detected"),
-    ]
-    
-    for pattern, reason in dangerous_patterns:
-        if re.search(pattern, value, re.IGNORECASE):
-            logger.warning(f"Potentially dangerous input detected: {reason}")
-            # Don't reject, just log - sanitization will handle it
+    match = _DANGEROUS_INPUT_RE.search(value)
+    if match:
+        reason = _DANGEROUS_INPUT_REASONS[match.lastindex - 1]
+        logger.warning(f"Potentially dangerous input detected: {reason}")
+        # Don't reject, just log - sanitization will handle it
     
     return True, "Input accepted"
 
 
+def sanitize_format_args(**kwargs: Any) -> dict[str, Any]:
+    """
+    Sanitize keyword arguments for str.format.
+    
+    Only string values are sanitized; numbers, booleans and other values
+    cannot carry markup and are passed through. Callers formatting many
+    strings with the same values can sanitize once and reuse the result
+    with template.format_map().
+    
+    Args:
+        **kwargs: Values to sanitize
+        
+    Returns:
+        Dictionary of sanitized values
+    """
+    return {
+        key: sanitize_string(value) if isinstance(value, str) else value
+        for key, value in kwargs.items()
+    }
+
+
 def safe_format(template: str, **kwargs: Any) -> str:
     """
     Safe string formatting that prevents injection.
@@ -224,8 +345,4 @@ def safe_format(template: str, **kwargs: Any) -> str:
     Returns:
         Safely formatted string
     """
-    safe_kwargs = {
-        key: sanitize_string(str(value)) if isinstance(value, str) else value
-        for key, value in kwargs.items()
-    }
-    return template.format(**safe_kwargs)
+    return template.format_map(sanitize_format_args(**kwargs))
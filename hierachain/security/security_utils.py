@@ -10,6 +10,8 @@ import binascii
 from typing import Tuple, Any
 from nacl.signing import SigningKey, VerifyKey
 from nacl.encoding import HexEncoder
+from nacl.utils import random as nacl_random
+from nacl.bindings import crypto_sign_SEEDBYTES
 from nacl.exceptions import BadSignatureError
 
 logger = logging.getLogger(__name__)
@@ -44,6 +46,29 @@ class KeyPair:
         """Generate a new random key pair."""
         return cls()
 
+    @classmethod
+    def generate_batch(cls, count: int) -> list['KeyPair']:
+        """
+        Generate several random key pairs.
+        
+        Draws the seeds for all key pairs with a single call to the system
+        random source instead of one call per key pair.
+
+        Args:
+            count: Number of key pairs to generate.
+
+        Returns:
+            List of new key pairs.
+        """
+        if count < 0:
+            raise ValueError("count must not be negative")
+        seed_size = crypto_sign_SEEDBYTES
+        seeds = nacl_random(seed_size * count) if count else b""
+        return [
+            cls(SigningKey(seeds[i * seed_size:(i + 1) * seed_size]))
+            for i in range(count)
+        ]
+
     @classmethod
     def from_private_key(cls, private_key_hex: str) -> 'KeyPair':
         """Load a key pair from a hex-encoded private key."""
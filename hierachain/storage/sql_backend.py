@@ -7,7 +7,7 @@ It connects the application logic (OrderingService) with the database models.
 
 import logging
 from typing import Any
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, insert
 from sqlalchemy.orm import sessionmaker, scoped_session
 
 from hierachain.storage.models import Base, BlockModel, EventModel, ChainStateModel
@@ -61,23 +61,16 @@ class SqlStorageBackend:
                 metadata_json=block_data.get('metadata', {})
             )
             
-            # 2. Create Event Records
-            events = []
-            for event_data in block_data.get('events', []):
-                evt_id = event_data.get("event_id")
-                event_model = EventModel(
-                    block_hash=block_data['hash'],
-                    event_id=evt_id,
-                    event_type=event_data.get('event', 'unknown'),
-                    timestamp=event_data.get('timestamp', 0.0),
-                    sender_id=event_data.get('sender', None),
-                    data=event_data # Store full JSON
-                )
-                events.append(event_model)
+            session.add(new_block)
+            session.flush()
             
-            new_block.events = events
+            # 2. Bulk-insert Event Records. SQLAlchemy batches these into
+            # multi-row INSERT ... VALUES statements (insertmanyvalues) instead
+            # of emitting one INSERT per ORM object.
+            events = self._event_rows(block_data)
+            if events:
+                session.execute(insert(EventModel), events)
             
-            session.add(new_block)
             session.commit()
             logger.debug(f"Saved Block #{new_block.index} ({len(events)} events) to DB.")
             return True
@@ -89,6 +82,65 @@ class SqlStorageBackend:
         finally:
             session.close()
 
+    def save_blocks_bulk(self, blocks: list[dict[str, Any]]) -> bool:
+        """
+        Save several blocks and their events in a single transaction.
+
+        Either every block is stored or none is.
+
+        Args:
+            blocks: Dictionary representations of the Blocks, in chain order.
+
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        if not blocks:
+            return True
+
+        session = self.Session()
+        try:
+            block_rows = [
+                {
+                    "index": block_data['index'],
+                    "hash": block_data['hash'],
+                    "previous_hash": block_data['previous_hash'],
+                    "timestamp": block_data['timestamp'],
+                    "metadata_json": block_data.get('metadata', {})
+                }
+                for block_data in blocks
+            ]
+            session.execute(insert(BlockModel), block_rows)
+
+            events = [row for block_data in blocks for row in self._event_rows(block_data)]
+            if events:
+                session.execute(insert(EventModel), events)
+
+            session.commit()
+            logger.debug(f"Saved {len(blocks)} blocks ({len(events)} events) to DB.")
+            return True
+
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to save blocks to DB: {e}")
+            return False
+        finally:
+            session.close()
+
+    @staticmethod
+    def _event_rows(block_data: dict[str, Any]) -> list[dict[str, Any]]:
+        """Build event table rows for a block dictionary"""
+        return [
+            {
+                "block_hash": block_data['hash'],
+                "event_id": event_data.get("event_id"),
+                "event_type": event_data.get('event', 'unknown'),
+                "timestamp": event_data.get('timestamp', 0.0),
+                "sender_id": event_data.get('sender', None),
+                "data": event_data  # Store full JSON
+            }
+            for event_data in block_data.get('events', [])
+        ]
+
     def get_event_by_id(self, event_id: str) -> dict[str, Any] | None:
         """
         Retrieve an event by its unique ID.
@@ -12,6 +12,7 @@ import logging
 import sys
 import os
 import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
 from hierachain.consensus.ordering_service import OrderingService, OrderingNode, OrderingStatus
@@ -32,29 +33,51 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Below this many events, signing in-process beats starting worker processes
+PARALLEL_SIGNING_THRESHOLD = 10_000
+
+def sign_nonces(private_key_hex: str, start: int, stop: int) -> list[str]:
+    """Sign the payloads nonce_{start} .. nonce_{stop - 1}; runs in worker processes."""
+    sign = KeyPair.from_private_key(private_key_hex).sign
+    return [sign(f"nonce_{i}".encode()) for i in range(start, stop)]
+
 def generate_events(count: int) -> list[dict[str, Any]]:
-    events = []
     # Generate a keypair for signing
     kp = KeyPair.generate()
     public_key = kp.public_key
     
-    for i in range(count):
-        payload = f"nonce_{i}"
-        signature = kp.sign(payload.encode())
-        
-        event = {
+    # Sign all payloads up front, fanned out over processes for large runs
+    processes = os.cpu_count() or 1
+    if count < PARALLEL_SIGNING_THRESHOLD or processes == 1:
+        signatures = sign_nonces(kp.private_key, 0, count)
+    else:
+        step = -(-count // processes)
+        starts = range(0, count, step)
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            chunks = executor.map(
+                sign_nonces,
+                [kp.private_key] * len(starts),
+                starts,
+                [min(start + step, count) for start in starts],
+            )
+            signatures = [signature for chunk in chunks for signature in chunk]
+    
+    # One clock read; events get distinct, increasing microsecond offsets
+    base_time = time.time()
+    return [
+        {
             "entity_id": "user1",
             "event": "transaction",
-            "timestamp": time.time(),
-            "details": {"nonce": str(i), "payload": payload},
+            "timestamp": base_time + i * 1e-6,
+            "details": {"nonce": str(i), "payload": f"nonce_{i}"},
             "sender": public_key,
             "receiver": "user2",
             "amount": 10,
             "signature": signature,
             "creator_id": "user1",
         }
-        events.append(event)
-    return events
+        for i, signature in enumerate(signatures)
+    ]
 
 async def run_benchmark(event_count: int, workers: int, batch_size: int):
     logger.info(f"Starting benchmark with {event_count} events, {workers} workers, batch size {batch_size}")
@@ -90,27 +113,20 @@ async def run_benchmark(event_count: int, workers: int, batch_size: int):
     
     try:
         start_time = time.time()
+        completion = service.register_completion_target(event_count)
         
-        # Submit events
-        for event in events:
-            service.receive_event(event, "default", "org1")
+        # Submit events in chunks of several blocks each
+        chunk_size = batch_size * 4
+        for i in range(0, len(events), chunk_size):
+            service.receive_events_batch(events[i:i + chunk_size], "default", "org1")
             
         logger.info(f"Submitted {event_count} events. Waiting for processing...")
         
         # Wait for completion
-        while True:
-            processed = service.statistics["events_certified"]
-            rejected = service.statistics["events_rejected"]
-            blocks = service.blocks_created
-            
-            if (processed + rejected) >= event_count:
-                break
-            
-            if time.time() - start_time > 60: # 1 minute timeout
-                logger.warning("Timeout reached!")
-                break
-                
-            await asyncio.sleep(0.5)
+        try:
+            await asyncio.wait_for(completion.wait(), timeout=60)  # 1 minute timeout
+        except asyncio.TimeoutError:
+            logger.warning("Timeout reached!")
             
         end_time = time.time()
         duration = end_time - start_time
@@ -13,6 +13,59 @@ If no file is specified, defaults to 'python.sarif'.
 import json
 import sys
 import os
+from typing import Any, Iterator
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+RESULT_PREFIX = 'runs.item.results.item'
+
+JSON_ERRORS: tuple[type[Exception], ...] = (json.JSONDecodeError,)
+if IJSON_AVAILABLE:
+    JSON_ERRORS += (ijson.JSONError,)
+
+
+def iter_results(f) -> Iterator[tuple[int, str, dict[str, Any]]]:
+    """
+    Yield (run index, tool name, result) for every result in a SARIF file.
+
+    With ijson installed the file is streamed and only one result is held
+    in memory at a time; otherwise the whole document is loaded.
+
+    Args:
+        f: SARIF file opened in binary mode
+
+    Returns:
+        Iterator over the results of every run, in file order
+    """
+    if not IJSON_AVAILABLE:
+        sarif = json.load(f)
+        for run_index, run in enumerate(sarif.get('runs', [])):
+            tool_name = run.get('tool', {}).get('driver', {}).get('name', 'Unknown')
+            for r in run.get('results', []):
+                yield run_index, tool_name, r
+        return
+
+    run_index = -1
+    tool_name = 'Unknown'
+    builder = None
+    for prefix, event, value in ijson.parse(f):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == RESULT_PREFIX and event == 'end_map':
+                yield run_index, tool_name, builder.value
+                builder = None
+        elif prefix == RESULT_PREFIX and event == 'start_map':
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+        elif prefix == 'runs.item' and event == 'start_map':
+            run_index += 1
+            tool_name = 'Unknown'
+        elif prefix == 'runs.item.tool.driver.name':
+            tool_name = value
 
 
 def analyze_sarif(sarif_file: str) -> None:
@@ -25,37 +78,33 @@ def analyze_sarif(sarif_file: str) -> None:
         print("\nNo analysis performed.")
         return  # Exit gracefully, not an error
     
+    total_results = 0
+    current_run = None
     try:
-        with open(sarif_file, 'r', encoding='utf-8') as f:
-            sarif = json.load(f)
-    except json.JSONDecodeError as e:
+        with open(sarif_file, 'rb') as f:
+            for run_index, tool_name, r in iter_results(f):
+                if run_index != current_run:
+                    print(f"\n=== {tool_name} ===\n")
+                    current_run = run_index
+
+                locations = r.get('locations', [])
+                if locations:
+                    loc = locations[0].get('physicalLocation', {})
+                    uri = loc.get('artifactLocation', {}).get('uri', 'unknown')
+                    line = loc.get('region', {}).get('startLine', '?')
+                    rule_id = r.get('ruleId', 'unknown')
+                    message = r.get('message', {}).get('text', 'No message')
+                    level = r.get('level', 'note')
+
+                    print(f"[{level.upper()}] {rule_id}")
+                    print(f"  File: {uri}:{line}")
+                    print(f"  Message: {message}")
+                    print()
+                    total_results += 1
+    except JSON_ERRORS as e:
         print(f"Error: Invalid JSON in SARIF file: {e}")
         sys.exit(1)
     
-    total_results = 0
-    for run in sarif.get('runs', []):
-        tool_name = run.get('tool', {}).get('driver', {}).get('name', 'Unknown')
-        results = run.get('results', [])
-        
-        if results:
-            print(f"\n=== {tool_name} ({len(results)} findings) ===\n")
-            
-        for r in results:
-            locations = r.get('locations', [])
-            if locations:
-                loc = locations[0].get('physicalLocation', {})
-                uri = loc.get('artifactLocation', {}).get('uri', 'unknown')
-                line = loc.get('region', {}).get('startLine', '?')
-                rule_id = r.get('ruleId', 'unknown')
-                message = r.get('message', {}).get('text', 'No message')
-                level = r.get('level', 'note')
-                
-                print(f"[{level.upper()}] {rule_id}")
-                print(f"  File: {uri}:{line}")
-                print(f"  Message: {message}")
-                print()
-                total_results += 1
-    
     if total_results == 0:
         print("No findings in SARIF file.")
     else:
@@ -30,8 +30,8 @@ def run_verification():
     
     # 3. Simulate Saving Blocks
     logger.info("Simulating OrderingService saving blocks...")
-    for i in range(10):
-        block_data = {
+    blocks = [
+        {
             "index": i,
             "hash": f"hash_{i}",
             "previous_hash": f"hash_{i-1}",
@@ -41,7 +41,10 @@ def run_verification():
             ],
             "metadata": {"consensus": "PoA"}
         }
-        backend.save_block(block_data)
+        for i in range(10)
+    ]
+    if not backend.save_blocks_bulk(blocks):
+        logger.error("FAILURE: Could not save blocks.")
     
     # 4. Close Backend
     backend.close()
@@ -0,0 +1,526 @@
+"""
+Test suite for FileStorageAdapter
+
+This module contains unit tests for the Parquet-based file storage adapter,
+including block persistence, the events index and chain statistics.
+"""
+
+import os
+import time
+
+import pyarrow.parquet as pq
+import pytest
+
+from hierachain.adapters.storage import file_storage
+from hierachain.adapters.storage.file_storage import BatchBlockWriter, FileStorageAdapter
+from hierachain.core.block import Block
+
+
+CHAIN = "test_chain"
+
+
+def make_block(index: int, entity_ids: list[str], previous_hash: str = "0" * 64) -> Block:
+    base = time.time() + index * 100
+    events = [
+        {
+            "entity_id": entity_id,
+            "event": "quality_check",
+            "timestamp": base + i,
+            "details": {"seq": str(i)}
+        }
+        for i, entity_id in enumerate(entity_ids)
+    ]
+    return Block(index=index, events=events, previous_hash=previous_hash)
+
+
+def age_dirs(*paths):
+    """Backdate directory mtimes so mtime-keyed listings may be cached"""
+    old = time.time() - 60
+    for path in paths:
+        os.utime(path, (old, old))
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return FileStorageAdapter(str(tmp_path / "data"))
+
+
+def test_store_and_get_block(storage):
+    """Test that a stored block round-trips its header and events"""
+    block = make_block(1, ["ENT-1", "ENT-2"])
+    storage.store_block(CHAIN, block)
+
+    loaded = storage.get_block(CHAIN, 1)
+    assert loaded is not None
+    assert loaded["index"] == 1
+    assert loaded["hash"] == block.hash
+    assert loaded["previous_hash"] == block.previous_hash
+    assert loaded["timestamp"] == block.timestamp
+    assert loaded["events"].num_rows == 2
+
+    assert storage.get_block(CHAIN, 99) is None
+
+
+def test_store_block_from_dict(storage):
+    """Test storing a block given as a dictionary"""
+    block = make_block(1, ["ENT-1"])
+    storage.store_block(CHAIN, block.to_dict())
+
+    loaded = storage.get_block(CHAIN, 1)
+    assert loaded is not None
+    assert loaded["events"].num_rows == 1
+
+
+def test_store_block_dict_skips_block_rebuild(tmp_path, monkeypatch):
+    """Test that block dictionaries are stored as given, without rebuilding a Block"""
+    source = FileStorageAdapter(str(tmp_path / "source"))
+    block = make_block(1, ["ENT-1", "ENT-2"])
+    source.store_block(CHAIN, block)
+    block_data = source.get_block(CHAIN, 1)
+
+    def fail_merkle(events):
+        raise AssertionError("unexpected Merkle root computation")
+
+    monkeypatch.setattr(Block, "calculate_merkle_from_list", staticmethod(fail_merkle))
+
+    target = FileStorageAdapter(str(tmp_path / "target"), block_cache_size=0)
+    target.store_block(CHAIN, block_data)
+
+    copied = target.get_block(CHAIN, 1)
+    assert copied["hash"] == block.hash
+    assert copied["events"].num_rows == 2
+    assert len(target.get_entity_events("ENT-2", CHAIN)) == 1
+
+
+def test_get_chain_blocks_ordering_and_paging(storage):
+    """Test that chain blocks are returned in index order with offset/limit"""
+    for index in [3, 1, 10, 2]:
+        storage.store_block(CHAIN, make_block(index, ["ENT-1"]))
+
+    blocks = storage.get_chain_blocks(CHAIN)
+    assert [b["index"] for b in blocks] == [1, 2, 3, 10]
+
+    page = storage.get_chain_blocks(CHAIN, limit=2, offset=1)
+    assert [b["index"] for b in page] == [2, 3]
+
+    assert storage.get_chain_blocks("unknown_chain") == []
+
+
+def test_get_entity_events(storage):
+    """Test entity event lookup across blocks"""
+    storage.store_block(CHAIN, make_block(1, ["ENT-1", "ENT-2", "ENT-1"]))
+    storage.store_block(CHAIN, make_block(2, ["ENT-2", "ENT-1"]))
+
+    events = storage.get_entity_events("ENT-1", CHAIN)
+    assert len(events) == 3
+    assert [e["block_index"] for e in events] == [1, 1, 2]
+    assert all(e["event_type"] == "quality_check" for e in events)
+    assert events[0]["details"] == {"seq": "0"}
+
+    timestamps = [e["timestamp"] for e in events]
+    assert timestamps == sorted(timestamps)
+
+    # Search across all chains
+    assert len(storage.get_entity_events("ENT-2")) == 2
+    assert storage.get_entity_events("ENT-404") == []
+
+
+def test_get_entity_events_falls_back_to_event_type(storage):
+    """Test that events carrying only event_type are indexed under that type"""
+    events = [
+        {"entity_id": "ENT-1", "event_type": "legacy_type", "timestamp": time.time()},
+        {"entity_id": "ENT-1", "timestamp": time.time() + 1},
+    ]
+    storage.store_block(CHAIN, Block(index=1, events=events, previous_hash="0" * 64))
+
+    found = storage.get_entity_events("ENT-1", CHAIN)
+    assert [e["event_type"] for e in found] == ["legacy_type", "unknown"]
+
+
+def test_get_chain_stats(storage):
+    """Test chain statistics over blocks and the events index"""
+    storage.store_block(CHAIN, make_block(1, ["ENT-1", "ENT-2"]))
+    storage.store_block(CHAIN, make_block(2, ["ENT-2", "ENT-3"]))
+
+    stats = storage.get_chain_stats(CHAIN)
+    assert stats["total_blocks"] == 2
+    assert stats["total_events"] == 4
+    assert stats["unique_entities"] == 3
+
+
+def test_chain_metadata_roundtrip(storage):
+    """Test storing and reading chain metadata"""
+    storage.store_chain_metadata(CHAIN, "sub", parent_chain="main", metadata={"domain": "test"})
+
+    meta = storage.get_chain_metadata(CHAIN)
+    assert meta["name"] == CHAIN
+    assert meta["parent_chain"] == "main"
+    assert meta["metadata"] == {"domain": "test"}
+    assert storage.list_chains() == [CHAIN]
+    assert storage.get_chain_metadata("missing") is None
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_chain_metadata_json_backends(storage, monkeypatch, use_orjson):
+    """Test that chain metadata round-trips with and without orjson"""
+    if use_orjson and not file_storage.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(file_storage, "ORJSON_AVAILABLE", use_orjson)
+
+    metadata = {"domain": "test", "limits": {"max": 10, "ratio": 0.5}, "tags": ["a", "b"]}
+    storage.store_chain_metadata(CHAIN, "sub", metadata=metadata)
+    assert storage.get_chain_metadata(CHAIN)["metadata"] == metadata
+
+
+def test_chain_metadata_survives_short_writes(storage, monkeypatch):
+    """Test that metadata files are complete even when os.write writes partially"""
+    real_write = os.write
+    monkeypatch.setattr(file_storage.os, "write", lambda fd, data: real_write(fd, bytes(data[:7])))
+
+    metadata = {"domain": "test", "description": "x" * 100}
+    storage.store_chain_metadata(CHAIN, "sub", metadata=metadata)
+    monkeypatch.undo()
+
+    assert storage.get_chain_metadata(CHAIN)["metadata"] == metadata
+
+
+def test_get_storage_info(storage):
+    """Test storage info aggregation"""
+    storage.store_chain_metadata(CHAIN, "sub")
+    storage.store_block(CHAIN, make_block(1, ["ENT-1"]))
+
+    info = storage.get_storage_info()
+    assert info["file_count"] >= 3
+    assert info["total_size_bytes"] > 0
+    assert info["chains_count"] == 1
+
+
+def test_invalid_chain_name_rejected(storage):
+    """Test path traversal protection on chain names"""
+    with pytest.raises(ValueError):
+        storage.get_chain_blocks("../etc")
+
+
+def test_compact_events_index(storage):
+    """Test that per-block events index files are merged without losing rows"""
+    for index in range(1, 6):
+        storage.store_block(CHAIN, make_block(index, ["ENT-1", "ENT-2"]))
+
+    events_dir = storage.events_path / CHAIN
+    assert len(list(events_dir.glob("*.parquet"))) == 5
+
+    assert storage.compact_events_index(CHAIN) == 5
+    assert [f.name for f in events_dir.glob("*.parquet")] == ["events_000000001-000000005.parquet"]
+
+    # Blocks stored after compaction are still found alongside the snapshot
+    storage.store_block(CHAIN, make_block(6, ["ENT-1"]))
+    events = storage.get_entity_events("ENT-1", CHAIN)
+    assert [e["block_index"] for e in events] == [1, 2, 3, 4, 5, 6]
+    assert storage.get_chain_stats(CHAIN)["total_events"] == 11
+
+    # A lone fragment is not worth compacting
+    assert storage.compact_events_index(CHAIN) == 0
+
+
+def test_compact_events_index_after_restore(storage):
+    """Test that blocks re-stored after compaction are neither duplicated nor lost"""
+    for index in range(5):
+        storage.store_block(CHAIN, make_block(index, ["ENT-1"]))
+    storage.compact_events_index(CHAIN)
+
+    storage.store_block(CHAIN, make_block(0, ["ENT-1"]))
+    assert [e["block_index"] for e in storage.get_entity_events("ENT-1", CHAIN)] == [0, 1, 2, 3, 4]
+
+    # Compacting the re-stored first and last blocks reuses the snapshot's name
+    storage.store_block(CHAIN, make_block(4, ["ENT-1"]))
+    assert storage.compact_events_index(CHAIN) == 2
+    assert [e["block_index"] for e in storage.get_entity_events("ENT-1", CHAIN)] == [0, 1, 2, 3, 4]
+
+
+def test_iter_chain_blocks_is_lazy(tmp_path, monkeypatch):
+    """Test that block files are only read as the iterator advances"""
+    storage = FileStorageAdapter(str(tmp_path / "data"), block_cache_size=0)
+    for index in range(1, 6):
+        storage.store_block(CHAIN, make_block(index, ["ENT-1"]))
+
+    reads = []
+    original = FileStorageAdapter._read_block_file
+    monkeypatch.setattr(
+        FileStorageAdapter, "_read_block_file",
+        staticmethod(lambda path: reads.append(path) or original(path))
+    )
+
+    blocks = storage.iter_chain_blocks(CHAIN, offset=1)
+    assert reads == []
+    assert next(blocks)["index"] == 2
+    assert len(reads) == 1
+
+
+def test_store_blocks_batch_leaves_no_temp_files(storage):
+    """Test batched atomic writes and the BatchBlockWriter that uses them"""
+    blocks = [make_block(index, ["ENT-1", "ENT-2"]) for index in range(1, 4)]
+    with BatchBlockWriter(storage, CHAIN, batch_size=2) as writer:
+        for block in blocks:
+            writer.add(block)
+
+    stats = writer.get_stats()
+    assert stats["blocks_written"] == 3
+    assert stats["events_written"] == 6
+    assert stats["flush_count"] == 2
+
+    assert [b["hash"] for b in storage.get_chain_blocks(CHAIN)] == [b.hash for b in blocks]
+    assert not list(storage.storage_path.rglob("*.tmp"))
+
+
+def test_block_cache_serves_reads(storage, monkeypatch):
+    """Test that stored blocks are served from the cache without disk reads"""
+    block = make_block(1, ["ENT-1"])
+    storage.store_block(CHAIN, block)
+
+    def fail_read(path):
+        raise AssertionError(f"unexpected disk read of {path}")
+
+    monkeypatch.setattr(FileStorageAdapter, "_read_block_file", staticmethod(fail_read))
+
+    assert storage.get_block(CHAIN, 1)["hash"] == block.hash
+    assert [b["hash"] for b in storage.get_chain_blocks(CHAIN)] == [block.hash]
+
+    # Mutating a returned block must not leak into the cache
+    storage.get_block(CHAIN, 1)["hash"] = "tampered"
+    assert storage.get_block(CHAIN, 1)["hash"] == block.hash
+
+
+def test_block_cache_sees_writes_from_other_adapters(tmp_path):
+    """Test that cached blocks are dropped once another adapter rewrites the file"""
+    reader = FileStorageAdapter(str(tmp_path / "data"))
+    writer = FileStorageAdapter(str(tmp_path / "data"))
+    writer.store_block(CHAIN, make_block(0, ["ENT-1"]))
+    assert reader.get_block(CHAIN, 0) is not None
+
+    replacement = make_block(0, ["ENT-2"])
+    writer.store_block(CHAIN, replacement)
+
+    block_data = reader.get_block(CHAIN, 0)
+    assert block_data["hash"] == replacement.hash
+    assert block_data["events"].column("entity_id").to_pylist() == ["ENT-2"]
+    reader.close()
+    writer.close()
+
+
+def test_block_cache_disabled(tmp_path):
+    """Test that a zero-sized cache reads blocks from disk"""
+    storage = FileStorageAdapter(str(tmp_path / "data"), block_cache_size=0)
+    block = make_block(1, ["ENT-1"])
+    storage.store_block(CHAIN, block)
+
+    assert storage._block_cache is None
+    assert storage.get_block(CHAIN, 1)["hash"] == block.hash
+
+
+def test_get_entity_events_served_from_index(storage, monkeypatch):
+    """Test that entity lookups do not read block files"""
+    storage.store_block(CHAIN, make_block(1, ["ENT-1", "ENT-2"]))
+    storage.store_block(CHAIN, make_block(2, ["ENT-1"]))
+
+    def fail_get_block(chain_name, block_index):
+        raise AssertionError(f"unexpected block read of {chain_name}/{block_index}")
+
+    monkeypatch.setattr(storage, "get_block", fail_get_block)
+
+    events = storage.get_entity_events("ENT-1", CHAIN)
+    assert [e["block_index"] for e in events] == [1, 2]
+    assert [e["details"] for e in events] == [{"seq": "0"}, {"seq": "0"}]
+
+
+def test_get_entity_events_legacy_index(storage):
+    """Test that index files without an event payload column fall back to the block"""
+    block = make_block(1, ["ENT-1"])
+    storage.store_block(CHAIN, block)
+    storage.store_block(CHAIN, make_block(2, ["ENT-1"]))
+
+    # Rewrite the first index file in the layout used before the payload was indexed
+    legacy_file = storage.events_path / CHAIN / "events_000000001.parquet"
+    legacy = pq.read_table(legacy_file).drop_columns(["data"])
+    pq.write_table(legacy, legacy_file)
+
+    events = storage.get_entity_events("ENT-1", CHAIN)
+    assert [e["block_index"] for e in events] == [1, 2]
+    assert events[0]["details"] == {"seq": "0"}
+    assert events[0]["timestamp"] == block.to_dict()["events"][0]["timestamp"]
+
+
+def test_store_blocks_batch_writes_one_events_file(storage):
+    """Test that a batch shares one events index file with a row group per block"""
+    storage.store_blocks_batch(CHAIN, [make_block(index, ["ENT-1", "ENT-2"]) for index in range(1, 4)])
+
+    events_files = list((storage.events_path / CHAIN).glob("*.parquet"))
+    assert [f.name for f in events_files] == ["events_000000001-000000003.parquet"]
+    assert pq.ParquetFile(events_files[0]).num_row_groups == 3
+
+    events = storage.get_entity_events("ENT-2", CHAIN)
+    assert [e["block_index"] for e in events] == [1, 2, 3]
+    assert storage.get_chain_stats(CHAIN)["total_events"] == 6
+
+
+def test_restored_blocks_are_indexed_once(storage):
+    """Test that re-storing a block replaces its rows in earlier events files"""
+    storage.store_blocks_batch(CHAIN, [make_block(0, ["ENT-1"]), make_block(1, ["ENT-1", "ENT-2"])])
+
+    storage.store_block(CHAIN, make_block(0, ["ENT-1"]))
+    assert [e["block_index"] for e in storage.get_entity_events("ENT-1", CHAIN)] == [0, 1]
+
+    # Overwriting with different entities drops the block's old rows
+    storage.store_block(CHAIN, make_block(1, ["ENT-3"]))
+    assert [e["block_index"] for e in storage.get_entity_events("ENT-1", CHAIN)] == [0]
+    assert storage.get_entity_events("ENT-2", CHAIN) == []
+    assert storage.get_chain_stats(CHAIN)["total_events"] == 2
+
+
+def test_batches_with_same_range_keep_each_others_rows(storage):
+    """Test that a batch spanning another batch's file name keeps its other blocks"""
+    storage.store_blocks_batch(CHAIN, [make_block(index, ["ENT-1"]) for index in (1, 2, 3)])
+    storage.store_blocks_batch(CHAIN, [make_block(index, ["ENT-2"]) for index in (1, 3)])
+
+    assert [e["block_index"] for e in storage.get_entity_events("ENT-1", CHAIN)] == [2]
+    assert [e["block_index"] for e in storage.get_entity_events("ENT-2", CHAIN)] == [1, 3]
+    events_file = storage.events_path / CHAIN / "events_000000001-000000003.parquet"
+    assert pq.ParquetFile(events_file).num_row_groups == 3
+
+
+def test_get_entity_events_across_chains(storage):
+    """Test that a lookup without chain filter reports each event's chain"""
+    storage.store_block("chain_a", make_block(1, ["ENT-1"]))
+    storage.store_block("chain_b", make_block(2, ["ENT-1", "ENT-2"]))
+
+    events = storage.get_entity_events("ENT-1")
+    assert [(e["chain_name"], e["block_index"]) for e in events] == [("chain_a", 1), ("chain_b", 2)]
+
+
+def test_events_dataset_is_reused_until_written(storage):
+    """Test that opened events datasets are cached and refreshed on writes"""
+    storage.store_block(CHAIN, make_block(1, ["ENT-1"]))
+
+    # Freshly modified directories are rescanned rather than cached
+    assert storage._events_dataset(CHAIN) is not storage._events_dataset(CHAIN)
+
+    age_dirs(storage.events_path / CHAIN)
+    dataset = storage._events_dataset(CHAIN)
+    assert storage._events_dataset(CHAIN) is dataset
+    all_chains = storage._events_dataset()
+    assert storage._events_dataset() is all_chains
+
+    storage.store_block(CHAIN, make_block(2, ["ENT-1"]))
+    assert storage._events_dataset(CHAIN) is not dataset
+    assert storage._events_dataset() is not all_chains
+    assert len(storage.get_entity_events("ENT-1", CHAIN)) == 2
+
+    # Files added behind the adapter's back are picked up too
+    other = FileStorageAdapter(str(storage.storage_path))
+    other.store_block(CHAIN, make_block(3, ["ENT-1"]))
+    assert len(storage.get_entity_events("ENT-1", CHAIN)) == 3
+
+
+def test_get_chain_block_headers_reads_footers_only(tmp_path, monkeypatch):
+    """Test that block headers are listed without reading event data"""
+    storage = FileStorageAdapter(str(tmp_path / "data"), block_cache_size=0)
+    blocks = [make_block(index, ["ENT-1"] * index) for index in range(1, 4)]
+    for block in blocks:
+        storage.store_block(CHAIN, block)
+
+    def fail_read(path):
+        raise AssertionError(f"unexpected full read of {path}")
+
+    monkeypatch.setattr(FileStorageAdapter, "_read_block_file", staticmethod(fail_read))
+
+    headers = storage.get_chain_block_headers(CHAIN, limit=2, offset=1)
+    assert [h["index"] for h in headers] == [2, 3]
+    assert [h["hash"] for h in headers] == [blocks[1].hash, blocks[2].hash]
+    assert [h["event_count"] for h in headers] == [2, 3]
+    assert "events" not in headers[0]
+
+
+def test_get_chain_blocks_concurrent_reads(tmp_path):
+    """Test that uncached blocks read concurrently keep index order and skip bad files"""
+    storage = FileStorageAdapter(str(tmp_path / "data"), block_cache_size=0)
+    for index in range(1, 13):
+        storage.store_block(CHAIN, make_block(index, ["ENT-1"]))
+
+    (storage.blocks_path / CHAIN / "block_000005.parquet").write_bytes(b"not parquet")
+
+    blocks = storage.get_chain_blocks(CHAIN)
+    assert [b["index"] for b in blocks] == [i for i in range(1, 13) if i != 5]
+
+
+def test_buffered_events_index(tmp_path):
+    """Test that buffered index rows are written in one file at the threshold, on read and on close"""
+    events_dir = tmp_path / "data" / "events" / CHAIN
+
+    storage = FileStorageAdapter(str(tmp_path / "data"), events_buffer_rows=4)
+    storage.store_block(CHAIN, make_block(1, ["ENT-1", "ENT-2"]))
+    assert not list(events_dir.glob("*.parquet"))
+    storage.store_block(CHAIN, make_block(2, ["ENT-1", "ENT-2"]))
+    assert [f.name for f in events_dir.glob("*.parquet")] == ["events_000000001-000000002.parquet"]
+
+    # Reads flush pending rows first
+    storage.store_block(CHAIN, make_block(3, ["ENT-1"]))
+    assert [e["block_index"] for e in storage.get_entity_events("ENT-1", CHAIN)] == [1, 2, 3]
+    assert storage.get_chain_stats(CHAIN)["total_events"] == 5
+
+    with FileStorageAdapter(str(tmp_path / "data"), events_buffer_rows=100) as buffered:
+        buffered.store_block(CHAIN, make_block(4, ["ENT-1"]))
+    assert len(storage.get_entity_events("ENT-1", CHAIN)) == 4
+
+
+def test_list_chains_tracks_new_chains(storage):
+    """Test that the cached chain listing picks up chains added later"""
+    storage.store_chain_metadata("chain_a", "sub")
+    assert storage.list_chains() == ["chain_a"]
+
+    storage.list_chains().append("tampered")
+    FileStorageAdapter(str(storage.storage_path)).store_chain_metadata("chain_b", "sub")
+    assert sorted(storage.list_chains()) == ["chain_a", "chain_b"]
+
+
+def test_block_listing_cache(storage):
+    """Test that the sorted block listing is cached and refreshed on changes"""
+    for index in [2, 1, 3]:
+        storage.store_block(CHAIN, make_block(index, ["ENT-1"]))
+    chain_dir = storage.blocks_path / CHAIN
+    age_dirs(chain_dir)
+
+    assert [i for i, _ in storage._list_block_files(CHAIN)] == [1, 2, 3]
+    assert CHAIN in storage._block_listings
+    assert [i for i, _ in storage._list_block_files(CHAIN, limit=1, offset=1)] == [2]
+
+    # A block written by another adapter changes the directory mtime
+    FileStorageAdapter(str(storage.storage_path)).store_block(CHAIN, make_block(4, ["ENT-1"]))
+    assert [b["index"] for b in storage.get_chain_blocks(CHAIN, offset=2)] == [3, 4]
+
+
+@pytest.mark.asyncio
+async def test_async_wrappers(storage):
+    """Test the asyncio wrappers around metadata and block I/O"""
+    await storage.store_chain_metadata_async(CHAIN, "sub", metadata={"domain": "test"})
+    assert (await storage.get_chain_metadata_async(CHAIN))["metadata"] == {"domain": "test"}
+
+    block = make_block(1, ["ENT-1"])
+    await storage.store_block_async(CHAIN, block)
+    assert (await storage.get_block_async(CHAIN, 1))["hash"] == block.hash
+
+
+def test_block_headers_are_memoized_per_file_version(tmp_path):
+    """Test that repeated header listings reuse decoded footers until a block is rewritten"""
+    storage = FileStorageAdapter(str(tmp_path / "data"), block_cache_size=0)
+    for index in range(1, 4):
+        storage.store_block(CHAIN, make_block(index, ["ENT-1"]))
+
+    first = storage.get_chain_block_headers(CHAIN)
+    hits = file_storage._read_block_footer.cache_info().hits
+    assert storage.get_chain_block_headers(CHAIN) == first
+    assert file_storage._read_block_footer.cache_info().hits == hits + 3
+
+    replacement = make_block(2, ["ENT-1", "ENT-2"])
+    storage.store_block(CHAIN, replacement)
+    headers = storage.get_chain_block_headers(CHAIN)
+    assert headers[1]["hash"] == replacement.hash
+    assert headers[1]["event_count"] == 2
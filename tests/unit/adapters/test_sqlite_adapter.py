@@ -0,0 +1,152 @@
+"""
+Test suite for SQLiteAdapter
+
+This module contains unit tests for the SQLite database adapter,
+including chain persistence, event queries and chain statistics.
+"""
+
+import pytest
+
+from hierachain.adapters.database.sqlite_adapter import SQLiteAdapter
+from hierachain.core.block import Block
+from hierachain.core.blockchain import Blockchain
+
+
+@pytest.fixture
+def adapter(tmp_path):
+    return SQLiteAdapter(str(tmp_path / "test.db"))
+
+
+@pytest.fixture
+def chain():
+    chain = Blockchain(name="AdapterTestChain")
+    for i in range(3):
+        chain.add_event({
+            "entity_id": f"ENT-{i % 2}",
+            "event": "operation_start",
+            "details": {"step": i}
+        })
+    chain.finalize_block()
+    return chain
+
+
+def test_store_chain(adapter, chain):
+    """Test that a stored chain persists all blocks and events"""
+    assert adapter.store_chain(chain) is True
+
+    events = adapter.get_events_by_type("operation_start", chain.name)
+    assert len(events) == 3
+    assert [e["details"] for e in events] == [{"step": 0}, {"step": 1}, {"step": 2}]
+    assert all(e["block_index"] == 1 for e in events)
+
+
+def test_get_entity_events(adapter, chain):
+    """Test entity event lookup with and without chain filter"""
+    adapter.store_chain(chain)
+
+    events = adapter.get_entity_events("ENT-0")
+    assert len(events) == 2
+    assert all(e["entity_id"] == "ENT-0" for e in events)
+
+    assert len(adapter.get_entity_events("ENT-1", chain.name)) == 1
+    assert adapter.get_entity_events("ENT-1", "OtherChain") == []
+
+
+def test_get_chain_statistics(adapter, chain):
+    """Test chain statistics aggregation"""
+    adapter.store_chain(chain)
+
+    stats = adapter.get_chain_statistics(chain.name)
+    assert stats["total_blocks"] == len(chain.chain)
+    # Genesis block contributes the SYSTEM entity
+    assert stats["unique_entities"] == 3
+    assert stats["total_events"] == 4
+    assert stats["event_types"]["operation_start"] == 3
+    assert stats["first_event_at"] <= stats["last_event_at"]
+
+
+def test_get_chain_statistics_unknown_chain(adapter):
+    """Test statistics for a chain that was never stored"""
+    assert adapter.get_chain_statistics("MissingChain") == {}
+
+
+def test_invalid_database_path():
+    """Test path traversal protection"""
+    with pytest.raises(ValueError):
+        SQLiteAdapter("../outside.db")
+
+
+def test_entity_query_uses_composite_index(adapter):
+    """Test that entity lookups are served by the composite events index"""
+    with adapter._get_connection() as conn:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM events "
+            "WHERE entity_id = ? AND chain_name = ? ORDER BY timestamp",
+            ("ENT-0", "AdapterTestChain")
+        ).fetchall()
+
+    detail = " ".join(row["detail"] for row in plan)
+    assert "idx_events_chain_entity_ts" in detail
+    assert "TEMP B-TREE" not in detail
+
+
+def test_connections_are_pooled(adapter):
+    """Test that connections are returned to the pool and reused"""
+    with adapter._get_connection() as conn:
+        first = conn
+    with adapter._get_connection() as conn:
+        assert conn is first
+
+    adapter.close()
+    with adapter._get_connection() as conn:
+        assert conn is not first
+
+
+def test_connections_use_wal_journal(adapter):
+    """Test that pooled connections run in WAL journal mode"""
+    with adapter._get_connection() as conn:
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+
+def test_store_blocks_batch(adapter, chain):
+    """Test that a batch of blocks is stored with events linked to their block rows"""
+    assert adapter.store_blocks(chain.name, chain.chain) is True
+
+    with adapter._get_connection() as conn:
+        orphaned = conn.execute("""
+            SELECT COUNT(*) FROM events e
+            LEFT JOIN blocks b ON b.id = e.block_id
+            WHERE b.id IS NULL OR b.block_index != e.block_index
+        """).fetchone()[0]
+    assert orphaned == 0
+
+    stats = adapter.get_chain_statistics(chain.name)
+    assert stats == {}  # Chain row is only written by store_chain
+    assert len(adapter.get_entity_events("ENT-0", chain.name)) == 2
+
+
+def test_store_blocks_rolls_back_on_failure(adapter, chain):
+    """Test that a failing batch leaves no partial rows behind"""
+    # Missing event type violates NOT NULL on events.event_type
+    bad_block = Block(index=5, events=[{"entity_id": "ENT-0", "timestamp": 1.0}])
+
+    assert adapter.store_blocks("BatchChain", [chain.chain[-1], bad_block]) is False
+    assert adapter.get_entity_events("ENT-0", "BatchChain") == []
+    with adapter._get_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM blocks").fetchone()[0] == 0
+
+
+def test_cached_chain_statistics(adapter, chain):
+    """Test that cached statistics match live aggregation after a refresh"""
+    adapter.store_chain(chain)
+
+    # Not refreshed yet: falls back to live aggregation
+    live = adapter.get_chain_statistics(chain.name)
+    assert adapter.get_chain_statistics(chain.name, use_cached=True) == live
+
+    assert adapter.refresh_chain_statistics() is True
+    cached = adapter.get_chain_statistics(chain.name, use_cached=True)
+    refreshed_at = cached.pop("refreshed_at")
+    assert refreshed_at > 0
+    assert cached == live
@@ -0,0 +1,28 @@
+"""
+Test suite for framework settings
+
+This module contains unit tests for environment-based settings selection.
+"""
+
+from hierachain.config.settings import (
+    DevelopmentSettings,
+    ProductionSettings,
+    TestingSettings,
+    get_settings,
+)
+
+
+def test_get_settings_is_memoized(monkeypatch):
+    """Test that repeated lookups return the same settings instance"""
+    monkeypatch.setenv("HRC_ENV", "dev")
+    assert get_settings() is get_settings()
+    assert isinstance(get_settings(), DevelopmentSettings)
+
+
+def test_get_settings_follows_environment(monkeypatch):
+    """Test that switching HRC_ENV selects the matching settings class"""
+    monkeypatch.setenv("HRC_ENV", "product")
+    assert isinstance(get_settings(), ProductionSettings)
+
+    monkeypatch.setenv("HRC_ENV", "TEST")
+    assert isinstance(get_settings(), TestingSettings)
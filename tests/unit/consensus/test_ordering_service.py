@@ -3,6 +3,8 @@ Unit tests for the Ordering Service
 """
 
 import time
+import asyncio
+import pytest
 import os
 import tempfile
 import shutil
@@ -107,6 +109,96 @@ def test_receive_valid_event():
             shutil.rmtree(temp_dir)
 
 
+def test_receive_events_batch():
+    """Test receiving a batch of events in one call"""
+    temp_dir = create_test_temp_dir()
+    service = None
+    try:
+        config = {"storage_dir": temp_dir}
+        service = OrderingService(nodes=[node], config=config)
+        events = [
+            {"entity_id": f"BATCH-{i}", "event": "test_event", "timestamp": time.time()}
+            for i in range(5)
+        ]
+
+        event_ids = service.receive_events_batch(events, "test-channel", "test-org")
+        assert len(event_ids) == 5
+        assert len(set(event_ids)) == 5
+        assert service.statistics["events_received"] == 5
+        assert all(service.get_event_status(event_id) is not None for event_id in event_ids)
+
+        # A malformed event rejects the whole batch
+        with pytest.raises(ValueError):
+            service.receive_events_batch([events[0], "not-a-dict"], "test-channel", "test-org")
+        assert service.statistics["events_received"] == 5
+    finally:
+        if service:
+            service.shutdown()
+        if os.path.exists(temp_dir):
+            shutil.rmtree(temp_dir)
+
+
+def test_receive_events_batch_journal_failure():
+    """Test that events queued before a journal failure are still counted"""
+    temp_dir = create_test_temp_dir()
+    service = None
+    try:
+        config = {"storage_dir": temp_dir}
+        service = OrderingService(nodes=[node], config=config)
+        log_event = service.journal.log_event
+        calls = []
+
+        def failing_log_event(event_data):
+            calls.append(event_data)
+            return len(calls) < 3 and log_event(event_data)
+
+        service.journal.log_event = failing_log_event
+        events = [
+            {"entity_id": f"JOURNAL-{i}", "event": "test_event", "timestamp": time.time()}
+            for i in range(5)
+        ]
+
+        with pytest.raises(RuntimeError):
+            service.receive_events_batch(events, "test-channel", "test-org")
+        assert service.statistics["events_received"] == 2
+        assert len(service.pending_events) + len(service.processed_events) == 2
+    finally:
+        if service:
+            service.shutdown()
+        if os.path.exists(temp_dir):
+            shutil.rmtree(temp_dir)
+
+
+@pytest.mark.asyncio
+async def test_completion_target():
+    """Test that the completion event is set once all events are processed"""
+    temp_dir = create_test_temp_dir()
+    service = None
+    try:
+        config = {"storage_dir": temp_dir}
+        service = OrderingService(nodes=[create_test_node()], config=config)
+        while service.status != OrderingStatus.ACTIVE:
+            await asyncio.sleep(0.01)
+
+        completion = service.register_completion_target(3)
+        assert not completion.is_set()
+
+        events = [
+            {"entity_id": f"DONE-{i}", "event": "test_event", "timestamp": time.time()}
+            for i in range(3)
+        ]
+        service.receive_events_batch(events, "test-channel", "test-org")
+
+        await asyncio.wait_for(completion.wait(), timeout=5)
+        processed = service.statistics["events_certified"] + service.statistics["events_rejected"]
+        assert processed >= 3
+    finally:
+        if service:
+            service.shutdown()
+        if os.path.exists(temp_dir):
+            shutil.rmtree(temp_dir)
+
+
 
 def test_block_creation(benchmark: Any) -> None:
     """Test block creation when batch size is reached"""
@@ -0,0 +1,60 @@
+"""
+Test suite for the advanced caching system
+
+This module contains unit tests for AdvancedCache eviction bookkeeping and
+its TTL cleanup thread.
+"""
+
+import gc
+
+from hierachain.core.caching import AdvancedCache
+
+
+def test_lru_evicts_least_recently_used():
+    """Test that LRU eviction follows access order, not insertion order"""
+    cache = AdvancedCache(max_size=3, eviction_policy="lru")
+    for key in ["a", "b", "c"]:
+        cache.set(key, key.upper())
+
+    # Touch "a" so "b" becomes the least recently used
+    assert cache.get("a") == "A"
+    cache.set("d", "D")
+
+    assert cache.get("b") is None
+    assert sorted(cache.get_keys()) == ["a", "c", "d"]
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_lru_delete_and_reinsert():
+    """Test that deleted keys leave the access order"""
+    cache = AdvancedCache(max_size=2, eviction_policy="lru")
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.delete("a") is True
+
+    cache.set("c", 3)
+    assert sorted(cache.get_keys()) == ["b", "c"]
+    assert list(cache.access_order) == ["b", "c"]
+
+    # Updating an existing key refreshes its position
+    cache.set("b", 20)
+    cache.set("d", 4)
+    assert sorted(cache.get_keys()) == ["b", "d"]
+
+
+def test_cleanup_thread_stops_on_close():
+    """Test that close() stops the TTL cleanup thread"""
+    cache = AdvancedCache(max_size=2)
+    cache.close()
+    cache._cleanup_thread.join(timeout=5)
+    assert not cache._cleanup_thread.is_alive()
+
+
+def test_cleanup_thread_does_not_keep_cache_alive():
+    """Test that the TTL cleanup thread exits once the cache is garbage collected"""
+    cache = AdvancedCache(max_size=2)
+    thread = cache._cleanup_thread
+    del cache
+    gc.collect()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
@@ -12,7 +12,8 @@ from hypothesis import given, strategies as st
 
 from hierachain.core.utils import (
     generate_hash, generate_entity_id,
-    generate_proof_hash, validate_proof_metadata
+    generate_proof_hash, validate_proof_metadata,
+    BloomFilter, HyperLogLog
 )
 
 
@@ -371,3 +372,31 @@ def test_utils_integration():
     # Verify consistency - same inputs should produce same outputs
     proof_hash2 = generate_proof_hash(event_hash, proof_metadata)
     assert proof_hash == proof_hash2
+
+
+def test_bloom_filter_membership():
+    """Test that added items are always found and most absent items are not"""
+    bloom = BloomFilter(size_bits=1 << 12)
+    added = [f"ENTITY-{i}" for i in range(100)]
+    for item in added:
+        bloom.add(item)
+
+    assert all(item in bloom for item in added)
+    false_positives = sum(f"OTHER-{i}" in bloom for i in range(1000))
+    assert false_positives < 50
+
+
+def test_hyperloglog_estimates_distinct_count():
+    """Test HyperLogLog estimates and register-wise merging"""
+    first = HyperLogLog()
+    second = HyperLogLog()
+    for i in range(6000):
+        first.add(f"ENTITY-{i}")
+        first.add(f"ENTITY-{i}")  # Duplicates do not change the estimate
+    for i in range(4000, 10000):
+        second.add(f"ENTITY-{i}")
+
+    assert abs(first.count() - 6000) < 6000 * 0.05
+    first.merge(second)
+    assert abs(first.count() - 10000) < 10000 * 0.05
+    assert HyperLogLog().count() == 0
@@ -0,0 +1,140 @@
+"""
+Test suite for Hierarchy Manager proof submission
+
+This module contains unit tests for submitting sub-chain proofs to the
+Main Chain through the HierarchyManager.
+"""
+
+import pytest
+
+from hierachain.hierarchical.hierarchy_manager import HierarchyManager
+
+
+@pytest.fixture
+def hierarchy():
+    manager = HierarchyManager("ProofSubmissionMain")
+    manager.main_chain.consensus.config["block_interval"] = 0
+    for name in ("ChainA", "ChainB"):
+        manager.create_sub_chain(name, "generic")
+        sub_chain = manager.get_sub_chain(name)
+        sub_chain.consensus.config["block_interval"] = 0
+        sub_chain.proof_submission_interval = float('inf')
+    yield manager
+    for sub_chain in manager.sub_chains.values():
+        sub_chain.stop()
+
+
+def test_submit_all_proofs(hierarchy):
+    """Test that every sub-chain gets its latest block proven on the Main Chain"""
+    for name, sub_chain in hierarchy.sub_chains.items():
+        sub_chain.start_operation(f"{name}-ENT", "test_operation")
+        sub_chain.flush_pending_and_finalize()
+    latest_hashes = {name: c.get_latest_block().hash for name, c in hierarchy.sub_chains.items()}
+
+    results = hierarchy.submit_all_proofs()
+
+    assert results == {"ChainA": True, "ChainB": True}
+    assert hierarchy.system_stats["total_proofs"] == 2
+    for name, block_hash in latest_hashes.items():
+        assert hierarchy.main_chain.verify_proof(block_hash, name)
+
+
+def test_submit_all_proofs_without_sub_chains():
+    """Test that a hierarchy without sub-chains submits nothing"""
+    assert HierarchyManager("NoSubChainsMain").submit_all_proofs() == {}
+
+
+def test_sub_chain_snapshot_tracks_registration(hierarchy):
+    """Test that the sub-chain snapshot follows additions and removals"""
+    snapshot = hierarchy.get_sub_chain_snapshot()
+    assert [name for name, _ in snapshot] == ["ChainA", "ChainB"]
+
+    removed = hierarchy.get_sub_chain("ChainA")
+    assert hierarchy.remove_sub_chain("ChainA") is True
+    removed.stop()
+    assert hierarchy.remove_sub_chain("ChainA") is False
+    assert [name for name, _ in hierarchy.get_sub_chain_snapshot()] == ["ChainB"]
+    # Earlier snapshots are unaffected
+    assert len(snapshot) == 2
+    # The public mapping stays a plain, live dict
+    assert type(hierarchy.sub_chains) is dict
+    assert hierarchy.get_all_sub_chains() is hierarchy.sub_chains
+
+
+def test_trace_entity_skips_chains_without_entity():
+    """Test that entity tracing only scans sub-chains that may hold the entity"""
+    from hierachain.domains.generic.utils.entity_tracer import EntityTracer
+
+    manager = HierarchyManager("TraceMain")
+    for name in ("TraceChainA", "TraceChainB"):
+        manager.create_sub_chain(name, "generic")
+        manager.get_sub_chain(name).consensus.config["block_interval"] = 0
+        manager.get_sub_chain(name).proof_submission_interval = float('inf')
+    chain_a = manager.get_sub_chain("TraceChainA")
+    chain_b = manager.get_sub_chain("TraceChainB")
+
+    try:
+        chain_a.add_event({"entity_id": "TRACE-ENT", "event": "test_operation"})
+        chain_a.flush_pending_and_finalize()
+
+        assert chain_a.may_contain_entity("TRACE-ENT")
+        assert not chain_b.may_contain_entity("TRACE-ENT")
+
+        trace = EntityTracer(manager).trace_entity_across_chains("TRACE-ENT")
+        assert list(trace) == ["TraceChainA"]
+        assert all(e["entity_id"] == "TRACE-ENT" for e in trace["TraceChainA"])
+    finally:
+        chain_a.stop()
+        chain_b.stop()
+
+
+def test_system_overview_totals(hierarchy):
+    """Test that overview totals match a full walk of every chain"""
+    for name, sub_chain in hierarchy.sub_chains.items():
+        sub_chain.add_event({"entity_id": f"{name}-ENT", "event": "test_operation"})
+        sub_chain.flush_pending_and_finalize()
+
+    overview = hierarchy.get_system_overview()
+
+    chains = [hierarchy.main_chain, *hierarchy.sub_chains.values()]
+    sub_chain_events = sum(
+        len(block.events) for c in hierarchy.sub_chains.values() for block in c.chain
+    )
+    assert overview["total_blocks_system_wide"] == sum(len(c.chain) for c in chains)
+    assert overview["total_transactions_system_wide"] == sub_chain_events
+    # ChainA-ENT, ChainB-ENT and entities shared by both chains (SYSTEM, ...)
+    all_entities = {
+        entity_id for c in hierarchy.sub_chains.values() for block in c.chain
+        for entity_id in block.events.column("entity_id").to_pylist()
+    }
+    assert overview["unique_entities_system_wide"] == len(all_entities)
+
+
+def test_create_sub_chain_records_sanitized_metadata():
+    """Test that creation metadata reaches the Main Chain registration in summary form"""
+    manager = HierarchyManager("MetadataMain")
+    metadata = {"region": "EU", "raw_data": "secret", "owner": "Org1"}
+
+    assert manager.create_sub_chain("MetadataChain", "generic", metadata) is True
+    try:
+        registered = manager.main_chain.sub_chain_metadata["MetadataChain"]
+        assert registered["region"] == "EU"
+        assert registered["owner"] == "Org1"
+        assert registered["domain_type"] == "generic"
+        assert "raw_data" not in registered
+    finally:
+        manager.get_sub_chain("MetadataChain").stop()
+
+
+def test_sub_chain_validity_detects_tampered_block(hierarchy):
+    """Test that validation is not answered from a stale result after tampering"""
+    sub_chain = hierarchy.get_sub_chain("ChainA")
+    for i in range(2):
+        sub_chain.add_event({"entity_id": f"TAMPER-{i}", "event": "test_operation"})
+        sub_chain.flush_pending_and_finalize()
+    assert len(sub_chain.chain) >= 3
+    assert sub_chain.is_chain_valid()
+
+    # Tamper with a block that is neither genesis nor the latest
+    sub_chain.chain[1].previous_hash = "0" * 64
+    assert not sub_chain.is_chain_valid()
@@ -7,6 +7,8 @@ where the main chain stores proofs from registered sub-chains.
 
 from unittest.mock import Mock
 
+import pytest
+
 from hierachain.hierarchical.main_chain import MainChain
 
 
@@ -273,4 +275,79 @@ def test_main_chain_with_mock_consensus():
     # Add a proof
     proof_hash = "test_hash"
     result = main_chain.add_proof("TestSubChain", proof_hash, {"count": 1})
-    assert result is True
\ No newline at end of file
+    assert result is True
+
+
+def test_record_proofs_batch():
+    """Test recording proofs from several Sub-Chains in one batch"""
+    main_chain = MainChain(name="BatchProofMainChain")
+    main_chain.consensus.config["block_interval"] = 0
+    main_chain.register_sub_chain("ChainA", {"domain": "testing"})
+    main_chain.register_sub_chain("ChainB", {"domain": "testing"})
+
+    hash_a = "a" * 64
+    hash_b = "b" * 64
+    accepted = main_chain.record_proofs_batch([
+        ("ChainA", hash_a, {"domain_type": "testing"}),
+        ("UnregisteredChain", "c" * 64, {"domain_type": "testing"}),
+        ("ChainB", hash_b, {"domain_type": "testing"}),
+    ])
+
+    assert accepted == ["ChainA", "ChainB"]
+    assert main_chain.proof_count == 2
+
+    block = main_chain.finalize_block()
+    assert block is not None
+    assert main_chain.verify_proof(hash_a, "ChainA")
+    assert main_chain.verify_proof(hash_b, "ChainB")
+
+    details = [p["details"] for p in main_chain.get_proofs_by_sub_chain("ChainA") +
+               main_chain.get_proofs_by_sub_chain("ChainB")]
+    assert [d["proof_id"] for d in details] == ["PROOF-1", "PROOF-2"]
+    assert details[0]["batch_root"] == details[1]["batch_root"]
+    assert details[0]["batch_size"] == 2
+
+
+def test_record_proofs_batch_empty():
+    """Test that a batch with no acceptable proofs records nothing"""
+    main_chain = MainChain(name="EmptyBatchMainChain")
+
+    assert main_chain.record_proofs_batch([("Unknown", "d" * 64, {})]) == []
+    assert main_chain.pending_events == []
+
+
+def test_verify_proof_index_matches_chain():
+    """Test that proof verification agrees for proofs added before and after indexing"""
+    main_chain = MainChain(name="ProofIndexMainChain")
+    main_chain.consensus.config["block_interval"] = 0
+    main_chain.register_sub_chain("IndexChain", {"domain_type": "testing"})
+
+    main_chain.add_proof("IndexChain", "e" * 64, {"domain_type": "testing"})
+    main_chain.finalize_block()
+
+    # First lookup builds the index from the finalized block
+    assert main_chain.verify_proof("e" * 64, "IndexChain")
+    assert not main_chain.verify_proof("e" * 64, "OtherChain")
+
+    # Later proofs are indexed as they are added, including earlier ones
+    main_chain.add_proof("IndexChain", "f" * 64, {"domain_type": "testing"})
+    assert main_chain.verify_proof("f" * 64, "IndexChain")
+    assert main_chain.verify_proof("e" * 64, "IndexChain")
+    assert not main_chain.verify_proof("0" * 64, "IndexChain")
+
+
+@pytest.mark.parametrize("finalize", ["finalize_block", "finalize_main_chain_block"])
+def test_verify_proof_after_rejected_block(finalize):
+    """Test that proofs from a block rejected by the chain no longer verify"""
+    main_chain = MainChain(name="RejectedBlockMainChain")
+    main_chain.register_sub_chain("RejectedChain", {"domain_type": "testing"})
+    main_chain.add_proof("RejectedChain", "a" * 64, {"domain_type": "testing"})
+
+    # Build the index while the proof is still pending
+    assert main_chain.verify_proof("a" * 64, "RejectedChain")
+
+    main_chain.add_block = lambda block: False
+    assert getattr(main_chain, finalize)() is None
+
+    assert main_chain.pending_events == []
+    assert not main_chain.verify_proof("a" * 64, "RejectedChain")
@@ -0,0 +1,243 @@
+"""
+Test suite for GoEngineClient
+
+This module contains unit tests for batch splitting, result merging and
+reconnection in the Go Engine gRPC client. The RPCs are served by in-process
+fakes; when the generated protobuf modules are absent, each test imports the
+client against minimal stand-ins that are removed again afterwards.
+"""
+
+import asyncio
+import importlib
+import sys
+import types
+
+import grpc
+import grpc.aio
+import pytest
+
+GO_CLIENT = "hierachain.integration.go_client"
+
+
+def _proto_stand_ins() -> list[types.ModuleType]:
+    """Minimal stand-ins for the generated protobuf modules."""
+    class _Message:
+        def __init__(self, **fields):
+            self.__dict__.update(fields)
+
+    class _RepeatedTransactions(list):
+        def add(self, **fields):
+            self.append(_Message(**fields))
+
+    class _TransactionBatch:
+        def __init__(self):
+            self.transactions = _RepeatedTransactions()
+
+    class _BatchResult:
+        def __init__(self, success=False, message="", processing_time_ms=0,
+                     processed_tx_ids=(), errors=()):
+            self.success = success
+            self.message = message
+            self.processing_time_ms = processing_time_ms
+            self.processed_tx_ids = list(processed_tx_ids)
+            self.errors = list(errors)
+
+    pb = types.ModuleType("hierachain.integration.proto.hierachain_pb2")
+    pb.Transaction = _Message
+    pb.TransactionBatch = _TransactionBatch
+    pb.BatchResult = _BatchResult
+    pb.Empty = _Message
+    pb.HealthResponse = _Message
+    pb.TxStatus = types.SimpleNamespace(PENDING=0, CONFIRMED=1, FAILED=2)
+
+    pb_grpc = types.ModuleType("hierachain.integration.proto.hierachain_pb2_grpc")
+    pb_grpc.HieraChainEngineStub = None  # Replaced by FakeEngine
+
+    proto = types.ModuleType("hierachain.integration.proto")
+    proto.hierachain_pb2 = pb
+    proto.hierachain_pb2_grpc = pb_grpc
+    return [proto, pb, pb_grpc]
+
+
+@pytest.fixture
+def go_client(monkeypatch):
+    """The go_client module, imported against stand-in protobuf modules if the generated ones are absent."""
+    try:
+        import hierachain.integration.proto.hierachain_pb2  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        yield importlib.import_module(GO_CLIENT)
+        return
+
+    # Stand-ins only live for this test, and so does the module imported against them
+    for module in _proto_stand_ins():
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+    try:
+        yield importlib.import_module(GO_CLIENT)
+    finally:
+        sys.modules.pop(GO_CLIENT, None)
+        vars(sys.modules["hierachain.integration"]).pop("go_client", None)
+
+
+class FakeChannel:
+    """Stand-in for grpc.aio.Channel that records whether it was closed."""
+
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeEngine:
+    """In-process Go Engine: hands out channels and serves their stubs."""
+
+    def __init__(self, monkeypatch, go_client):
+        self.pb = go_client.pb
+        self.channels = []
+        self.batches = []
+        self.failures = []
+        monkeypatch.setattr(grpc.aio, "insecure_channel", self._open_channel)
+        monkeypatch.setattr(go_client.pb_grpc, "HieraChainEngineStub", self._stub)
+
+    def _open_channel(self, address, options=None, compression=None):
+        channel = FakeChannel()
+        self.channels.append(channel)
+        return channel
+
+    def _stub(self, channel):
+        async def health_check(request, timeout=None):
+            # Yield so concurrent connects interleave
+            await asyncio.sleep(0)
+            return self.pb.HealthResponse(healthy=True, version="test")
+
+        async def submit_batch(batch, timeout=None):
+            if self.failures:
+                raise self.failures.pop(0)
+            tx_ids = [tx.tx_id for tx in batch.transactions]
+            self.batches.append(tx_ids)
+            # Later batches finish first, so merge order is not arrival order
+            await asyncio.sleep(0.01 / len(self.batches))
+            return self.pb.BatchResult(
+                success=True, processing_time_ms=1, processed_tx_ids=tx_ids
+            )
+
+        return types.SimpleNamespace(
+            HealthCheck=health_check,
+            SubmitBatch=submit_batch,
+            StreamTransactions=None,
+        )
+
+
+@pytest.fixture
+def engine(monkeypatch, go_client):
+    return FakeEngine(monkeypatch, go_client)
+
+
+def make_transactions(go_client, count):
+    return [
+        go_client.Transaction(tx_id=f"tx-{i}", entity_id="e-1", event_type="created")
+        for i in range(count)
+    ]
+
+
+def test_submit_batch_splits_by_max_batch_size(go_client, engine):
+    """Test that large batches are split and merged back in submission order"""
+    async def run():
+        async with go_client.GoEngineClient(max_batch_size=2, retry_delay_seconds=0) as client:
+            return await client.submit_batch(make_transactions(go_client, 5))
+
+    result = asyncio.run(run())
+
+    assert sorted(len(batch) for batch in engine.batches) == [1, 2, 2]
+    assert list(result.processed_tx_ids) == [f"tx-{i}" for i in range(5)]
+    assert result.success
+    assert result.processing_time_ms == 3
+
+
+def test_submit_batch_without_split(go_client, engine):
+    """Test that batches within max_batch_size go out as a single call"""
+    async def run():
+        async with go_client.GoEngineClient(max_batch_size=None) as client:
+            return await client.submit_batch(make_transactions(go_client, 5))
+
+    result = asyncio.run(run())
+
+    assert len(engine.batches) == 1
+    assert len(result.processed_tx_ids) == 5
+
+
+def test_submit_batch_rejects_incomplete_dicts(go_client, engine):
+    """Test that dict transactions without required fields are not sent with empty defaults"""
+    async def run():
+        async with go_client.GoEngineClient(max_batch_size=None) as client:
+            return await client.submit_batch([{"entity_id": "e-1", "event_type": "created"}])
+
+    with pytest.raises(TypeError, match="tx_id"):
+        asyncio.run(run())
+    assert engine.batches == []
+
+
+def test_batch_result_merge(go_client):
+    """Test merging of sub-batch results"""
+    BatchResult, pb = go_client.BatchResult, go_client.pb
+    results = [
+        BatchResult(pb.BatchResult(success=True, message="ok", processing_time_ms=2, processed_tx_ids=["a", "b"])),
+        BatchResult(pb.BatchResult(success=False, message="partial", processing_time_ms=3, processed_tx_ids=["c"])),
+        BatchResult(pb.BatchResult(success=True, message="ok", processing_time_ms=1)),
+    ]
+
+    merged = BatchResult.merge(results)
+
+    assert not merged.success
+    assert merged.message == "ok; partial"
+    assert merged.processing_time_ms == 6
+    assert list(merged.processed_tx_ids) == ["a", "b", "c"]
+
+
+def test_batch_result_value_semantics(go_client):
+    """Test that results compare by value and expose plain lists"""
+    BatchResult, pb = go_client.BatchResult, go_client.pb
+
+    def make():
+        return BatchResult(pb.BatchResult(success=True, message="ok", processing_time_ms=2, processed_tx_ids=["a"]))
+
+    result = make()
+
+    assert result == make()
+    assert result != BatchResult(pb.BatchResult(success=False, processed_tx_ids=["a"]))
+    assert type(result.processed_tx_ids) is list
+    assert result.errors is result.errors
+    assert repr(result) == (
+        "BatchResult(success=True, message='ok', processed_tx_ids=['a'], processing_time_ms=2, errors=[])"
+    )
+
+
+def test_reconnect_after_unavailable(go_client, engine):
+    """Test that an UNAVAILABLE error reopens the channel and retries"""
+    engine.failures.append(grpc.aio.AioRpcError(grpc.StatusCode.UNAVAILABLE, details="down"))
+
+    async def run():
+        async with go_client.GoEngineClient(max_batch_size=None, retry_delay_seconds=0) as client:
+            return await client.submit_batch(make_transactions(go_client, 2))
+
+    result = asyncio.run(run())
+
+    assert list(result.processed_tx_ids) == ["tx-0", "tx-1"]
+    assert len(engine.channels) == 2
+    assert engine.channels[0].closed
+
+
+def test_concurrent_connects_open_one_channel(go_client, engine):
+    """Test that concurrent reconnects neither leak nor close each other's channels"""
+    async def run():
+        client = go_client.GoEngineClient()
+        await asyncio.gather(*(client.connect() for _ in range(4)))
+        return client
+
+    client = asyncio.run(run())
+
+    assert client.is_connected
+    assert len(engine.channels) == 1
+    assert not engine.channels[0].closed
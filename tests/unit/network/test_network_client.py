@@ -0,0 +1,110 @@
+"""
+Unit tests for NetworkClient peer management.
+
+Tests cover peer registration and removal, healthy peer filtering and the
+peer counts reported by the network status.
+"""
+
+import asyncio
+
+from hierachain.network.network_client import (
+    NetworkClient,
+    NetworkClientConfig,
+    NetworkClientSync,
+)
+
+
+def make_client(peer_count: int) -> NetworkClient:
+    client = NetworkClient(NetworkClientConfig(node_id="node-0"))
+    for i in range(peer_count):
+        client.register_peer(f"peer-{i}", f"tcp://127.0.0.1:{6000 + i}")
+    return client
+
+
+def test_register_and_unregister_peers():
+    """Test that peers can be removed from any position and looked up afterwards"""
+    client = make_client(4)
+
+    client.unregister_peer("peer-1")
+    client.unregister_peer("peer-3")
+    client.unregister_peer("missing")
+
+    peers = {p.peer_id: p.address for p in client.get_peers()}
+    assert peers == {"peer-0": "tcp://127.0.0.1:6000", "peer-2": "tcp://127.0.0.1:6002"}
+    assert client.peer_count == 2
+
+    client.register_peer("peer-2", "tcp://10.0.0.2:7000")
+    client.unregister_peer("peer-0")
+    assert [(p.peer_id, p.address) for p in client.get_peers()] == [("peer-2", "tcp://10.0.0.2:7000")]
+
+
+def test_healthy_peers_and_status():
+    """Test healthy peer filtering and status counts"""
+    client = make_client(3)
+    client._set_peer_health("peer-1", False)
+
+    assert [p.peer_id for p in client.get_healthy_peers()] == ["peer-0", "peer-2"]
+    assert all(p.is_healthy for p in client.get_healthy_peers())
+
+    status = client.get_network_status()
+    assert status.peer_count == 3
+    assert status.healthy_peers == 2
+    assert status.address == "tcp://127.0.0.1:5555"
+
+    client._set_peer_health("peer-1", False)
+    client.unregister_peer("peer-0")
+    assert client.get_network_status().healthy_peers == 1
+    client.register_peer("peer-1", "tcp://127.0.0.1:6001")
+    assert client.get_network_status().healthy_peers == 2
+
+
+def test_sync_client_runs_on_background_loop():
+    """Test that the sync wrapper hosts its loop on a thread and stops it on exit"""
+    sync_client = NetworkClientSync(NetworkClientConfig(node_id="node-0"))
+    with sync_client as client:
+        thread = client._thread
+        assert thread.is_alive()
+        client.register_peer("peer-0", "tcp://127.0.0.1:6000")
+        assert client.get_network_status().peer_count == 1
+
+    assert not thread.is_alive()
+    assert sync_client._loop is None
+
+
+def test_register_peers_batch():
+    """Test that batch registration matches one-by-one registration"""
+    client = make_client(1)
+    client._set_peer_health("peer-0", False)
+
+    client.register_peers([("peer-0", "tcp://10.0.0.1:6000"), ("peer-1", "tcp://10.0.0.1:6001")])
+
+    assert [(p.peer_id, p.address) for p in client.get_peers()] == [
+        ("peer-0", "tcp://10.0.0.1:6000"),
+        ("peer-1", "tcp://10.0.0.1:6001"),
+    ]
+    assert client.get_network_status().healthy_peers == 2
+
+
+def test_send_failure_marks_peer_unhealthy():
+    """Test that send results drive peer health"""
+    class FakeNode:
+        def __init__(self):
+            self.reachable = {"peer-0"}
+
+        async def send_direct(self, peer_id, message):
+            return peer_id in self.reachable
+
+    client = make_client(2)
+    assert not asyncio.run(client.send_to_peer("peer-0", {"type": "ping"}))
+
+    client._zmq_node = FakeNode()
+    client._is_running = True
+
+    assert asyncio.run(client.send_to_peer("peer-0", {"type": "ping"}))
+    assert not asyncio.run(client.send_to_peer("peer-1", {"type": "ping"}))
+    assert [p.peer_id for p in client.get_healthy_peers()] == ["peer-0"]
+    assert client.get_network_status().healthy_peers == 1
+
+    client._zmq_node.reachable.add("peer-1")
+    assert asyncio.run(client.send_to_peer("peer-1", {"type": "ping"}))
+    assert client.get_network_status().healthy_peers == 2
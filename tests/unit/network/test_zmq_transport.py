@@ -5,6 +5,8 @@ Tests cover validation of message timestamps, nonce uniqueness and automatic
 cleanup of expired entries from the replay buffer.
 """
 
+import asyncio
+import json
 import pytest
 import time
 import uuid
@@ -90,3 +92,67 @@ def test_buffer_cleanup(node):
     # 3. Verify old entry is gone
     assert old_entry not in node.replay_buffer
     assert (new_msg["timestamp"], "new_nonce") in node.replay_buffer
+
+
+def test_dispatch_continues_after_handler_error(node):
+    """A failing handler must not drop the rest of the received batch."""
+    delivered = []
+
+    def handler(message, sender_id):
+        if message["content"] == "bad":
+            raise ValueError("handler failure")
+        delivered.append(message["content"])
+
+    node.set_handler(handler)
+    batch = [({"content": c}, "peer") for c in ("first", "bad", "last")]
+    asyncio.run(node._dispatch(batch))
+
+    assert delivered == ["first", "last"]
+
+
+def test_dispatch_continues_after_async_handler_error(node):
+    """Async handlers get the same per-message error isolation."""
+    delivered = []
+
+    async def handler(message, sender_id):
+        if message["content"] == "bad":
+            raise ValueError("handler failure")
+        delivered.append(message["content"])
+
+    node.set_handler(handler)
+    batch = [({"content": c}, "peer") for c in ("bad", "second", "third")]
+    asyncio.run(node._dispatch(batch))
+
+    assert delivered == ["second", "third"]
+
+
+def test_sender_id_resolves_registered_peers(node):
+    """Test that registered senders map to the interned peer ID and others are decoded"""
+    node.register_peer("peer-1", "tcp://127.0.0.1:5001")
+    node.register_peers([("peer-2", "tcp://127.0.0.1:5002")])
+    peer_ids = list(node.peers)
+
+    assert node._sender_id("peer-1".encode('utf-8')) is peer_ids[0]
+    assert node._sender_id("peer-2".encode('utf-8')) is peer_ids[1]
+    assert node._sender_id(b"stranger") == "stranger"
+    assert b"stranger" not in node._peer_ids
+
+
+def test_decode_frames_drops_only_malformed_frames(node):
+    """Test that non-object or malformed payloads do not discard the rest of a drained batch"""
+    def frame(payload):
+        return [b"peer", json.dumps(payload).encode("utf-8")]
+
+    def message(content):
+        return {"timestamp": time.time(), "nonce": str(uuid.uuid4()), "content": content}
+
+    frames = [
+        frame(message("first")),
+        frame([1]),
+        frame({"timestamp": "not-a-number", "nonce": "n"}),
+        [b"peer", b"{not json"],
+        frame(message("last")),
+    ]
+
+    batch = node._decode_frames(frames)
+    assert [(m["content"], sender) for m, sender in batch] == [("first", "peer"), ("last", "peer")]
@@ -39,3 +39,16 @@ def test_import_export():
     sig = kp.sign(b"test")
     sig2 = kp2.sign(b"test")
     assert sig == sig2
+
+
+def test_generate_batch():
+    """Test generating several distinct key pairs at once."""
+    keypairs = KeyPair.generate_batch(5)
+    assert len(keypairs) == 5
+    assert len({kp.public_key for kp in keypairs}) == 5
+
+    signature = keypairs[2].sign(b"batch")
+    assert verify_signature(keypairs[2].public_key, b"batch", signature)
+    assert not verify_signature(keypairs[3].public_key, b"batch", signature)
+
+    assert KeyPair.generate_batch(0) == []
@@ -0,0 +1,164 @@
+"""
+Test suite for sanitization utilities
+
+This module contains unit tests for input/output sanitization, including
+HTML and template escaping, log and filename contexts, error message
+redaction and dangerous input detection.
+"""
+
+import html
+import logging
+import re
+
+import pytest
+from hypothesis import given, strategies as st
+
+from hierachain.security.sanitization import (
+    TEMPLATE_PATTERNS,
+    is_safe_input,
+    safe_format,
+    sanitize_error_message,
+    sanitize_for_output,
+    sanitize_format_args,
+    sanitize_string,
+)
+
+
+def test_sanitize_string_escapes_html_and_templates():
+    """Test that HTML and template expressions are neutralized"""
+    assert sanitize_string("<b>hi</b>") == "&lt;b&gt;hi&lt;/b&gt;"
+    assert sanitize_string("{{ user.name }} and <%= x %>") == "{{ user.name }} and &lt;%= x %&gt;"
+    assert sanitize_string("plain-id_123") == "plain-id_123"
+
+
+def test_sanitize_string_log_and_filename_contexts():
+    """Test log injection and filename contexts"""
+    assert sanitize_string("a\nb\r\x1bc\x00", "log") == "a b  c "
+    assert sanitize_string("../etc/pa:ss*wd", "filename") == "__etc_pa_ss_wd"
+
+
+def test_sanitize_for_output_recurses():
+    """Test that nested dicts and lists are sanitized"""
+    data = {"<k>": ["<v>", {"n": 1, "s": "<s>"}]}
+    assert sanitize_for_output(data) == {"&lt;k&gt;": ["&lt;v&gt;", {"n": 1, "s": "&lt;s&gt;"}]}
+
+
+def test_sanitize_error_message_redacts_paths():
+    """Test that file paths and line numbers are removed from errors"""
+    error = ValueError(
+        'File "/srv/app/module.py", line 42 in C:\\Users\\me\\x '
+        "reading /home/me/secret and /var/lib/db"
+    )
+    assert sanitize_error_message(error) == (
+        'File "[FILE]", line [N] in [PATH] reading [PATH] and [PATH]'
+    )
+    assert sanitize_error_message(ValueError("x" * 300)) == "x" * 200 + "..."
+
+
+def test_is_safe_input_logs_dangerous_patterns(caplog):
+    """Test that dangerous input is accepted but logged"""
+    with caplog.at_level(logging.WARNING, logger="hierachain.security.sanitization"):
+        assert is_safe_input("JavaScript:alert(1)") == (True, "Input accepted")
+        assert is_safe_input("hello") == (True, "Input accepted")
+    assert [r.getMessage() for r in caplog.records] == [
+        "Potentially dangerous input detected: JavaScript URI detected"
+    ]
+    assert is_safe_input("abc", max_length=2)[0] is False
+
+
+def test_sanitize_string_returns_plain_strings_unchanged():
+    """Test that strings without metacharacters are returned as the same object"""
+    value = "".join(["ENTITY", "-", "0042"])
+    for context in ("general", "html", "log", "filename", "other"):
+        assert sanitize_string(value, context) is value
+    assert sanitize_string("a.b", "filename") == "a.b"
+    assert sanitize_string("a..b", "filename") == "a_b"
+
+
+def test_sanitize_dict_handles_deep_nesting():
+    """Test that deeply nested payloads are sanitized without hitting the recursion limit"""
+    depth = 5000
+    data = node = {}
+    for _ in range(depth):
+        node["<n>"] = [{}]
+        node = node["<n>"][0]
+    node["leaf"] = "<x>"
+
+    result = sanitize_for_output(data)
+    for _ in range(depth):
+        result = result["&lt;n&gt;"][0]
+    assert result == {"leaf": "&lt;x&gt;"}
+
+
+def test_sanitize_for_output_rejects_cycles():
+    """Test that self-referencing payloads raise instead of looping forever"""
+    data = {"a": "<x>"}
+    data["self"] = data
+    with pytest.raises(ValueError):
+        sanitize_for_output(data)
+
+    items = ["<x>", {"nested": []}]
+    items[1]["nested"].append(items)
+    with pytest.raises(ValueError):
+        sanitize_for_output(items)
+
+    # Containers shared by siblings are not cycles
+    shared = ["<s>"]
+    assert sanitize_for_output({"a": shared, "b": [shared]}) == {"a": ["&lt;s&gt;"], "b": [["&lt;s&gt;"]]}
+
+
+def test_safe_format_sanitizes_only_strings():
+    """Test that safe_format escapes string values and passes others through"""
+    assert safe_format("{name}: {count} {ok}", name="<b>", count=3, ok=True) == "&lt;b&gt;: 3 True"
+
+    args = sanitize_format_args(name="{{x}}<", count=1.5)
+    assert args == {"name": "{{x}}&lt;", "count": 1.5}
+    assert "{name}/{count}".format_map(args) == "{{x}}&lt;/1.5"
+
+
+def _reference_sanitize_string(value: str) -> str:
+    """Sequential per-pattern template escaping, as originally implemented"""
+    result = html.escape(value)
+    for pattern in TEMPLATE_PATTERNS:
+        result = re.sub(pattern, lambda m: html.escape(m.group(0)), result)
+    return result
+
+
+def _reference_sanitize_error_message(error: Exception) -> str:
+    """Sequential per-pattern path redaction, as originally implemented"""
+    error_str = str(error)
+    error_str = re.sub(r'[A-Za-z]:\\[^\s]+', '[PATH]', error_str)
+    error_str = re.sub(r'/[^\s]+\.py', '[FILE]', error_str)
+    error_str = re.sub(r'/home/[^\s]+', '[PATH]', error_str)
+    error_str = re.sub(r'/var/[^\s]+', '[PATH]', error_str)
+    error_str = re.sub(r'line \d+', 'line [N]', error_str)
+    if len(error_str) > 200:
+        error_str = error_str[:200] + "..."
+    return error_str
+
+
+# Fragments chosen so that template and path patterns overlap and nest
+_overlap_text = st.lists(
+    st.sampled_from(list("ab/\\:.C{}$#%<>?\n ") + [
+        "/home/", "/var/", ".py", "{{", "}}", "${", "#{", "<%", "%>", "{%", "%}", "line 7"
+    ]),
+    max_size=20,
+).map("".join)
+
+
+def test_sanitize_error_message_overlapping_paths():
+    """Test that overlapping path patterns are redacted one pattern at a time"""
+    assert sanitize_error_message(ValueError("n/home/}?lC:\\b.py2\n")) == "n[PATH]\n"
+
+
+@given(_overlap_text)
+def test_sanitize_string_matches_sequential_patterns(value):
+    """Test that template escaping matches applying each pattern in turn"""
+    assert sanitize_string(value) == _reference_sanitize_string(value)
+
+
+@given(_overlap_text)
+def test_sanitize_error_message_matches_sequential_patterns(value):
+    """Test that path redaction matches applying each pattern in turn"""
+    error = ValueError(value)
+    assert sanitize_error_message(error) == _reference_sanitize_error_message(error)